@@ -1,9 +1,3 @@
 # -*- coding: utf-8 -*-
 
-from pyglet.font import add_file as add_pyglet_font
-
-from t3.assets.path import GOWUN_DODUM_REGULAR_TTF_PATH
-
 __version__ = "0.0.1"
-
-add_pyglet_font(GOWUN_DODUM_REGULAR_TTF_PATH)
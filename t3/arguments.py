@@ -5,6 +5,7 @@ from functools import lru_cache
 from typing import Final, List, Optional
 
 from t3.logging.logging import SEVERITIES, SEVERITY_NAME_INFO
+from t3.variables.rate import DEFAULT_DRAW_HZ
 
 PROG: Final[str] = "t3"
 DESCRIPTION: Final[str] = "Turn The Tricks"
@@ -12,6 +13,16 @@ EPILOG: Final[str] = ""
 
 DEFAULT_SEVERITY: Final[str] = SEVERITY_NAME_INFO
 DEFAULT_FPS: Final[int] = 60
+DEFAULT_BENCHMARK_REPEAT: Final[int] = 5
+DEFAULT_GENERATE_COUNT: Final[int] = 100
+DEFAULT_GENERATE_PIECES: Final[int] = 8
+DEFAULT_GENERATE_HEIGHT: Final[int] = 8
+
+CMD_VALIDATE_STAGES: Final[str] = "validate-stages"
+CMD_REPLAY: Final[str] = "replay"
+CMD_BENCHMARK: Final[str] = "benchmark"
+CMD_GENERATE_STAGES: Final[str] = "generate-stages"
+CMD_SCORE_STAGES: Final[str] = "score-stages"
 
 
 @lru_cache
@@ -67,7 +78,28 @@ def default_argument_parser() -> ArgumentParser:
         "--fps",
         type=int,
         default=DEFAULT_FPS,
-        help="Frames per second",
+        help=(
+            "Simulation steps per second, unless --update-hz is given;"
+            " the draw rate is set by --draw-hz only"
+        ),
+    )
+    parser.add_argument(
+        "--update-hz",
+        metavar="hz",
+        type=int,
+        default=None,
+        help="Simulation steps per second (default: --fps)",
+    )
+    parser.add_argument(
+        "--draw-hz",
+        metavar="hz",
+        type=int,
+        default=DEFAULT_DRAW_HZ,
+        help=(
+            "Frames drawn per second, independent of --fps"
+            f" (default: {DEFAULT_DRAW_HZ}); the cursor is interpolated"
+            " when it differs from --update-hz"
+        ),
     )
     parser.add_argument(
         "--vsync",
@@ -76,6 +108,48 @@ def default_argument_parser() -> ArgumentParser:
         help="Enable vsync mode",
     )
 
+    parser.add_argument(
+        "--render-mode",
+        choices=("continuous", "event"),
+        default="continuous",
+        help=(
+            "'event' redraws the scene only after input or a state change"
+            " and shows a cached copy otherwise (default: 'continuous')"
+        ),
+    )
+    parser.add_argument(
+        "--board-backend",
+        choices=("bits", "numpy"),
+        default="bits",
+        help="Board representation; 'numpy' requires NumPy (default: 'bits')",
+    )
+
+    parser.add_argument(
+        "--stage-pack",
+        metavar="path",
+        default=None,
+        help="Play the stages of a stage pack, directory or zip archive",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="file",
+        default=None,
+        help="Save a replay of the session to the file on exit",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="Record frame timings; F3 toggles the overlay (implied by '--debug')",
+    )
+    parser.add_argument(
+        "--profile-output",
+        metavar="file",
+        default=None,
+        help="Save the recorded frame timings to a JSON file on exit",
+    )
+
     parser.add_argument(
         "--verbose",
         "-v",
@@ -90,9 +164,174 @@ def default_argument_parser() -> ArgumentParser:
         version=version(),
     )
 
+    subparsers = parser.add_subparsers(dest="cmd")
+    add_validate_stages_parser(subparsers)
+    add_replay_parser(subparsers)
+    add_benchmark_parser(subparsers)
+    add_generate_stages_parser(subparsers)
+    add_score_stages_parser(subparsers)
+
     return parser
 
 
+def add_validate_stages_parser(subparsers) -> None:
+    parser = subparsers.add_parser(
+        CMD_VALIDATE_STAGES,
+        help="Check that every stage can be cleared",
+    )
+    parser.add_argument(
+        "stage_files",
+        nargs="*",
+        default=[],
+        help="Additional JSON stage files or stage packs to validate",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--split",
+        action="store_true",
+        default=False,
+        help="Solve each first move of a stage in a separate worker",
+    )
+
+
+def add_replay_parser(subparsers) -> None:
+    parser = subparsers.add_parser(
+        CMD_REPLAY,
+        help="Play back recorded replay files",
+    )
+    parser.add_argument(
+        "replay_files",
+        nargs="+",
+        help="Replay files recorded with '--record'; only one without '--headless'",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        default=False,
+        help="Play back without a window as fast as possible",
+    )
+
+
+def add_benchmark_parser(subparsers) -> None:
+    parser = subparsers.add_parser(
+        CMD_BENCHMARK,
+        help="Measure board operations, sprites and headless playthroughs",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        metavar="COLSxROWS",
+        default=None,
+        help="Board sizes (default: 10x20 20x40 50x100 100x200)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_BENCHMARK_REPEAT,
+        help=f"Number of timed batches (default: {DEFAULT_BENCHMARK_REPEAT})",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        metavar="file",
+        default=None,
+        help="Save the results to a JSON file",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="file",
+        default=None,
+        help="Print the ratio to the results in a previous JSON file",
+    )
+
+
+def add_generate_stages_parser(subparsers) -> None:
+    parser = subparsers.add_parser(
+        CMD_GENERATE_STAGES,
+        help="Generate random solvable stages",
+    )
+    parser.add_argument(
+        "output",
+        help="Stage pack to write, or a JSON file if it ends with '.json'",
+    )
+    parser.add_argument(
+        "--count",
+        "-n",
+        type=int,
+        default=DEFAULT_GENERATE_COUNT,
+        help=f"Number of stages (default: {DEFAULT_GENERATE_COUNT})",
+    )
+    parser.add_argument(
+        "--pieces",
+        type=int,
+        default=DEFAULT_GENERATE_PIECES,
+        help=f"Number of pieces in each stage (default: {DEFAULT_GENERATE_PIECES})",
+    )
+    parser.add_argument(
+        "--disabled",
+        type=int,
+        default=None,
+        help="Maximum number of disabled cells (default: every cell)",
+    )
+    parser.add_argument(
+        "--height",
+        type=int,
+        default=DEFAULT_GENERATE_HEIGHT,
+        help=f"Maximum height of the stack (default: {DEFAULT_GENERATE_HEIGHT})",
+    )
+    parser.add_argument(
+        "--max-solutions",
+        type=int,
+        default=None,
+        help="Reject stages with more solutions than this",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed (default: 0)",
+    )
+
+
+def add_score_stages_parser(subparsers) -> None:
+    parser = subparsers.add_parser(
+        CMD_SCORE_STAGES,
+        help="Compute the difficulty profile of stages",
+    )
+    parser.add_argument(
+        "stage_files",
+        nargs="*",
+        default=[],
+        help="JSON stage files or stage packs to score (default: built-in stages)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("csv", "jsonl"),
+        default="csv",
+        help="Output format (default: 'csv')",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        metavar="file",
+        default=None,
+        help="Write the records to a file instead of the standard output",
+    )
+
+
 def get_default_arguments(
     cmdline: Optional[List[str]] = None,
     namespace: Optional[Namespace] = None,
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+import os
+from concurrent.futures import Future
+from threading import Lock, Thread
+from time import perf_counter
+from typing import Callable, Dict, Final, Iterable, List, Optional, TypeVar
+
+from PIL import Image
+
+from arcade import Sound, Texture
+
+from t3.logging.logging import logger
+
+IMAGE_EXTENSIONS: Final[List[str]] = [".png"]
+SOUND_EXTENSIONS: Final[List[str]] = [".wav", ".ogg"]
+
+_T = TypeVar("_T")
+
+
+def open_image(path: str) -> Image.Image:
+    """
+    Opens and decodes the image; `Image.open` alone only reads the header.
+    """
+
+    image = Image.open(path)
+    image.load()
+    return image
+
+
+class AssetManager:
+    """
+    Loads the images, textures and sounds of `t3.assets.path` on first use
+    and keeps them by path, with the time each one took to load.
+
+    `preload` decodes assets on a background thread so that they are ready
+    before they are first used; a request for an asset that is being loaded
+    waits for it instead of loading it twice.
+
+    The caches hold a future per path, so the lock is only taken to look one
+    up or to add it, and different assets are decoded at the same time.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._images: Dict[str, Future[Image.Image]] = dict()
+        self._textures: Dict[str, Future[Texture]] = dict()
+        self._sounds: Dict[str, Future[Sound]] = dict()
+        self._load_times: Dict[str, float] = dict()
+        self._preloader: Optional[Thread] = None
+
+    @property
+    def load_times(self) -> Dict[str, float]:
+        return dict(self._load_times)
+
+    def _get(
+        self,
+        cache: Dict[str, Future[_T]],
+        path: str,
+        loader: Callable[[str], _T],
+    ) -> _T:
+        with self._lock:
+            future = cache.get(path)
+            if future is None:
+                future = cache[path] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            # Loaded, or being loaded by another thread.
+            return future.result()
+
+        begin = perf_counter()
+        try:
+            asset = loader(path)
+        except BaseException as e:
+            # Let a later request try again; the waiting ones get the error.
+            with self._lock:
+                del cache[path]
+            future.set_exception(e)
+            raise
+        elapsed = perf_counter() - begin
+
+        with self._lock:
+            # A texture load includes the load of its image under the same path.
+            self._load_times[path] = max(self._load_times.get(path, 0.0), elapsed)
+        future.set_result(asset)
+        logger.debug(f"Load asset ({elapsed * 1e3:.2f}ms): {path}")
+        return asset
+
+    def image(self, path: str) -> Image.Image:
+        return self._get(self._images, path, open_image)
+
+    def texture(self, path: str) -> Texture:
+        # The path doubles as the texture name, which is unique per image.
+        return self._get(self._textures, path, lambda p: Texture(p, self.image(p)))
+
+    def sound(self, path: str) -> Sound:
+        return self._get(self._sounds, path, Sound)
+
+    def load(self, path: str) -> None:
+        extension = os.path.splitext(path)[1].lower()
+        if extension in IMAGE_EXTENSIONS:
+            self.texture(path)
+        elif extension in SOUND_EXTENSIONS:
+            self.sound(path)
+        else:
+            raise ValueError(f"Unknown asset type: {path}")
+
+    def preload(self, paths: Iterable[str]) -> Thread:
+        """
+        Loads the `paths` on a daemon thread, in order.
+        """
+
+        pending = list(paths)
+
+        def _preload() -> None:
+            for path in pending:
+                try:
+                    self.load(path)
+                except BaseException as e:  # noqa
+                    logger.error(f"Preload asset error: {path} ({e})")
+
+        self._preloader = Thread(target=_preload, name="AssetPreloader", daemon=True)
+        self._preloader.start()
+        return self._preloader
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        if self._preloader is not None:
+            self._preloader.join(timeout)
+
+    def summary(self) -> List[str]:
+        """
+        One line per loaded asset with the load time in milliseconds,
+        the slowest first.
+        """
+
+        times = sorted(self._load_times.items(), key=lambda x: x[1], reverse=True)
+        return [f"{t * 1e3:8.2f}ms {os.path.basename(p)}" for p, t in times]
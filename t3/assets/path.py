@@ -55,3 +55,6 @@ LOOPABLE_BG_MUSIC_DIR = os.path.join(ASSETS_DIR, "LoopableBGMusic")
 BEATS_A_PATH = os.path.join(LOOPABLE_BG_MUSIC_DIR, "Beats A.wav")
 MAGICAL_FOREST_PATH = os.path.join(LOOPABLE_BG_MUSIC_DIR, "Magical Forest.wav")
 CATWALK_OGG_PATH = os.path.join(LOOPABLE_BG_MUSIC_DIR, "Catwalk.ogg")
+
+# Stage files of the default stage pack
+STAGES_DIR = os.path.join(ASSETS_DIR, "stages")
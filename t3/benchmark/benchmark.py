@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+import json
+import platform
+from time import perf_counter
+from typing import Any, Callable, Dict, Final, List, NamedTuple, Optional, Tuple
+
+from t3.objects.action import Action
+from t3.objects.bitboard import as_bit_shape
+from t3.objects.block import BLOCK_T, D, E
+from t3.objects.engine import Engine
+from t3.objects.matrix import Matrix
+from t3.solver.solver import Placement, solve_stage
+from t3.stages.stage import Stage
+from t3.stages.stages import default_stage_pack
+
+BoardSize = Tuple[int, int]
+
+DEFAULT_SIZES: Final[List[BoardSize]] = [(10, 20), (20, 40), (50, 100), (100, 200)]
+DEFAULT_REPEAT: Final[int] = 5
+DEFAULT_DURATION: Final[float] = 0.05
+
+PLAYTHROUGH_STAGE: Final[int] = 10
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    cols: int
+    rows: int
+    number: int
+    best: float
+    mean: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+def parse_size(text: str) -> BoardSize:
+    cols, rows = text.lower().split("x")
+    return int(cols), int(rows)
+
+
+def measure(
+    func: Callable[[], Any],
+    repeat=DEFAULT_REPEAT,
+    duration=DEFAULT_DURATION,
+) -> Tuple[int, float, float]:
+    """
+    Calls `func` in batches that last about `duration` seconds and returns
+    the batch size with the best and mean seconds per call.
+    """
+
+    number = 1
+    while True:
+        begin = perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = perf_counter() - begin
+        if elapsed >= duration or number >= 1 << 20:
+            break
+        number *= 2
+
+    timings = [elapsed / number]
+    for _ in range(repeat - 1):
+        begin = perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((perf_counter() - begin) / number)
+    return number, min(timings), sum(timings) / len(timings)
+
+
+def create_test_matrix(cols: int, rows: int) -> Matrix:
+    """
+    The lower half is filled with disabled cells, leaving a slanted surface
+    so that the drop checks have to scan several rows.
+    """
+
+    result = [[E for _x in range(cols)] for _y in range(rows)]
+    for y in range(rows // 2):
+        for x in range(cols):
+            if (x + y) % 7 != 0:
+                result[y][x] = D
+    return result
+
+
+def pad_stage(stage: Stage, cols: int, rows: int) -> Stage:
+    """
+    Places the `stage` at the bottom left corner of a larger empty board.
+    """
+
+    board = [line + [E] * (cols - len(line)) for line in stage.board]
+    board = [[E] * cols for _ in range(rows - len(board))] + board
+
+    result = Stage()
+    result.board = board
+    result.history = stage.history
+    return result
+
+
+def play_stage(engine: Engine, path: List[Placement]) -> None:
+    """
+    Plays the solution `path` through the same actions as a player would.
+    """
+
+    engine.reset()
+    for placement in path:
+        for _ in range(placement.rotation):
+            engine.apply(Action.rotate)
+        delta = placement.x - engine.cursor_x
+        step = Action.move_right if delta > 0 else Action.move_left
+        for _ in range(abs(delta)):
+            engine.apply(step)
+        engine.apply(Action.hard_drop)
+    assert engine.stage_clear
+
+
+def bench_core(cols: int, rows: int, repeat: int, duration: float):
+    # The sprite benchmarks are the only ones that need arcade.
+    from t3.objects.block_texture import create_block_textures
+    from t3.objects.board import Board
+    from t3.objects.sprite_pool import SpritePool
+    from t3.theme.flat import FlatTheme
+
+    textures = create_block_textures(4, 4, FlatTheme())
+    board = Board(cols, rows, 4, 4, 1, textures)
+    board.set_matrix(create_test_matrix(cols, rows))
+
+    # Built once, so that the conversion of the matrix is not measured.
+    shape = as_bit_shape(BLOCK_T)
+    y = rows // 2 - 2
+    positions = range(cols - shape.width + 1)
+
+    def check_collision():
+        for x in positions:
+            board.check_collision(shape, x, y)
+
+    def check_intersection():
+        for x in positions:
+            board.check_intersection(shape, x, y)
+
+    def check_insertable():
+        for x in positions:
+            board.check_insertable(shape, x, y)
+
+    # The search itself, on the core; `Engine` caches its result per board version.
+    def get_hard_drop_position():
+        for x in positions:
+            board.core.get_hard_drop_position(shape, x)
+
+    def create_sprites():
+        Board(cols, rows, 4, 4, 1, textures, pool=SpritePool())
+
+    benches = [
+        ("check_collision", check_collision),
+        ("check_intersection", check_intersection),
+        ("check_insertable", check_insertable),
+        ("bbox", lambda: board.bbox),
+        ("is_all_inactive", board.is_all_inactive),
+        ("get_hard_drop_position", get_hard_drop_position),
+        ("create_sprites", create_sprites),
+    ]
+    for name, func in benches:
+        yield (name,) + measure(func, repeat, duration)
+
+
+def bench_playthrough(cols: int, rows: int, repeat: int, duration: float):
+    stage = default_stage_pack()[PLAYTHROUGH_STAGE]
+    path = solve_stage(stage).path
+    assert path is not None
+
+    padded = pad_stage(stage, cols, rows)
+    engine = Engine(cols, rows, [padded])
+    result = measure(lambda: play_stage(engine, path), repeat, duration)
+    yield ("playthrough",) + result
+
+
+def run_benchmarks(
+    sizes: Optional[List[BoardSize]] = None,
+    repeat=DEFAULT_REPEAT,
+    duration=DEFAULT_DURATION,
+    printer: Optional[Callable[..., None]] = None,
+) -> List[BenchmarkResult]:
+    result = list()
+    for cols, rows in sizes if sizes else DEFAULT_SIZES:
+        for bench in (bench_core, bench_playthrough):
+            for name, number, best, mean in bench(cols, rows, repeat, duration):
+                item = BenchmarkResult(name, cols, rows, number, best, mean)
+                result.append(item)
+                if printer is not None:
+                    printer(
+                        f"{cols:>4}x{rows:<4} {name:<24}"
+                        f" best={best * 1e6:10.2f}us mean={mean * 1e6:10.2f}us"
+                    )
+    return result
+
+
+def dump_results(results: List[BenchmarkResult]) -> Dict[str, Any]:
+    from t3 import __version__
+
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": [r.as_dict() for r in results],
+    }
+
+
+def compare_results(
+    previous: Dict[str, Any],
+    results: List[BenchmarkResult],
+) -> List[Tuple[BenchmarkResult, float]]:
+    """
+    Returns the ratio of each best time to the best time in a previous dump.
+    A ratio above 1 is a slowdown.
+    """
+
+    bests = dict()
+    for item in previous.get("results", list()):
+        bests[(item["name"], item["cols"], item["rows"])] = item["best"]
+
+    comparison = list()
+    for result in results:
+        best = bests.get((result.name, result.cols, result.rows))
+        if best:
+            comparison.append((result, result.best / best))
+    return comparison
+
+
+def run_benchmark_command(
+    sizes: Optional[List[str]] = None,
+    repeat=DEFAULT_REPEAT,
+    duration=DEFAULT_DURATION,
+    output: Optional[str] = None,
+    compare: Optional[str] = None,
+    printer: Callable[..., None] = print,
+) -> int:
+    board_sizes = [parse_size(s) for s in sizes] if sizes else None
+    results = run_benchmarks(board_sizes, repeat, duration, printer)
+
+    if compare:
+        with open(compare, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+        for result, ratio in compare_results(previous, results):
+            printer(f"{result.cols:>4}x{result.rows:<4} {result.name:<24} x{ratio:.2f}")
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(dump_results(results), f, indent=2)
+    return 0
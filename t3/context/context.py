@@ -1,17 +1,15 @@
 # -*- coding: utf-8 -*-
 
 from overrides import overrides
-from typing import Final, Tuple
-
-from PIL import Image
+from time import perf_counter
+from typing import Dict, Final, List, Optional, Sequence, Tuple
 
 from arcade import (
-    Sound,
     Window,
-    Texture,
     set_background_color,
     draw_rectangle_filled,
     draw_rectangle_outline,
+    draw_text,
 )
 from arcade import run as arcade_run
 from arcade import exit as arcade_exit
@@ -32,20 +30,43 @@ from arcade.key import RIGHT as ARCADE_KEY_RIGHT
 from arcade.key import UP as ARCADE_KEY_UP
 from arcade.key import DOWN as ARCADE_KEY_DOWN
 from arcade.key import SPACE as ARCADE_KEY_SPACE
+from arcade.key import F3 as ARCADE_KEY_F3
+from pyglet.app import run as pyglet_run
+from pyglet.font import add_file as add_pyglet_font
 
 from t3.assets.path import (
     EXIT_RUN_NORMAL_PATH,
     EXIT_RUN_HOVERED_PATH,
     EXIT_RUN_PRESSED_PATH,
     FUI_PING_TRIPLET_ECHO_PATH,
+    GOWUN_DODUM_REGULAR_TTF_PATH,
     BEATS_A_PATH,
     MAGICAL_FOREST_PATH,
 )
-from t3.objects.game import Game
+from t3.assets.manager import AssetManager
+from t3.context.scene_cache import RENDER_MODE_CONTINUOUS, RENDER_MODE_EVENT, SceneCache
+from t3.objects.action import Action
+from t3.objects.bitboard import BOARD_BACKEND_BITS
+from t3.objects.game import SOUND_PATHS, Game
+from t3.profiler.profiler import (
+    SECTION_DRAW,
+    SECTION_GAME_DRAW,
+    SECTION_GAME_UPDATE,
+    SECTION_INPUT,
+    SECTION_LATENCY,
+    SECTION_UI_DRAW,
+    SECTION_UPDATE,
+    FrameProfiler,
+)
+from t3.replay.replay import Replay, ReplayPlayer
+from t3.stages.stage import Stage
+from t3.stages.stages import open_stage_pack
 from t3.theme.flat import FlatTheme
+from t3.timestep.timestep import FixedTimestep, InputEvent
 from t3.variables.block import BLOCK_WIDTH, BLOCK_HEIGHT, BLOCK_MARGIN
 from t3.variables.board import BOARD_ROWS, BOARD_COLS
 from t3.variables.fonts import GOWUN_DODUM_FONT
+from t3.variables.rate import DEFAULT_DRAW_HZ
 
 SCREEN_WIDTH: Final[int] = 800
 SCREEN_HEIGHT: Final[int] = 800
@@ -55,6 +76,40 @@ MUSIC_VOLUME: Final[float] = 0.3
 
 BACKGROUND_COLOR: Final[Tuple[int, int, int, int]] = (0x0c, 0x1b, 0x23, 0xFF)
 
+# Events that may change what is drawn, including the hover state of the UI.
+SCENE_EVENTS: Final[Tuple[str, ...]] = (
+    "on_key_press",
+    "on_key_release",
+    "on_mouse_motion",
+    "on_mouse_press",
+    "on_mouse_release",
+    "on_mouse_drag",
+    "on_mouse_scroll",
+    "on_mouse_enter",
+    "on_mouse_leave",
+    "on_resize",
+    "on_show",
+    "on_expose",
+)
+
+# Interval at which `arcade.run` redraws the window.
+DEFAULT_DRAW_RATE: Final[float] = 1.0 / DEFAULT_DRAW_HZ
+
+PROFILER_OVERLAY_KEY: Final[int] = ARCADE_KEY_F3
+# Number of frames between the updates of the overlay text.
+PROFILER_OVERLAY_REFRESH: Final[int] = 30
+
+KEY_ACTIONS: Final[Dict[int, Action]] = {
+    ARCADE_KEY_R: Action.reset,
+    ARCADE_KEY_P: Action.prev_stage,
+    ARCADE_KEY_N: Action.next_stage,
+    ARCADE_KEY_LEFT: Action.move_left,
+    ARCADE_KEY_RIGHT: Action.move_right,
+    ARCADE_KEY_DOWN: Action.hard_drop,
+    ARCADE_KEY_SPACE: Action.hard_drop,
+    ARCADE_KEY_UP: Action.rotate,
+}
+
 
 # def remove_row(board, row):
 #     del board[row]
@@ -72,11 +127,36 @@ class Context(Window):
         center_window=False,
         debug=False,
         verbose=0,
+        stages: Optional[Sequence[Stage]] = None,
+        replay: Optional[Replay] = None,
+        board_backend=BOARD_BACKEND_BITS,
+        profiler: Optional[FrameProfiler] = None,
+        render_mode=RENDER_MODE_CONTINUOUS,
+        assets: Optional[AssetManager] = None,
+        update_hz: Optional[int] = None,
+        draw_hz=DEFAULT_DRAW_HZ,
     ):
-        self._update_rate = 1.0 / fps
+        # `fps` only sets the simulation rate; the draw rate does not follow it.
+        self._update_rate = 1.0 / (update_hz if update_hz else fps)
+        self._draw_rate = 1.0 / draw_hz
+        # The cursor is drawn between the simulation steps when the rates differ.
+        self._interpolate = self._update_rate != self._draw_rate
+        self._timestep = FixedTimestep(self._update_rate)
+        # Input events applied since the last frame, for the latency sections.
+        self._applied_events: List[InputEvent] = list()
+        self._profiler = profiler if profiler else FrameProfiler(enabled=False)
+        self._assets = assets if assets else AssetManager()
+        self._show_profiler = False
+        self._profiler_lines: List[str] = list()
+        self._profiler_frames = 0
         self._debug = debug
         self._verbose = verbose
 
+        # `Window.__init__` already dispatches events to `dispatch_event`.
+        self._scene: Optional[SceneCache] = None
+        # Whether the last `on_draw` left the frame on screen untouched.
+        self._frame_skipped = False
+
         super().__init__(
             width=SCREEN_WIDTH,
             height=SCREEN_HEIGHT,
@@ -98,8 +178,20 @@ class Context(Window):
             BLOCK_WIDTH,
             BLOCK_HEIGHT,
             BLOCK_MARGIN,
+            stages=stages,
+            board_backend=board_backend,
+            profiler=self._profiler,
+            assets=self._assets,
         )
 
+        # Player input is ignored while a replay is played back.
+        self._replay_player: Optional[ReplayPlayer] = None
+        if replay is not None:
+            self._game.select_stage(replay.stage)
+            self._replay_player = ReplayPlayer(replay)
+        else:
+            self._game.start_recording()
+
         # window_width, window_height = self.get_size()
         # self._game.resize(window_width, window_height)
 
@@ -116,14 +208,19 @@ class Context(Window):
         self._stage_failed_uis = self._create_stage_failed_ui()
         self._stage_complete_uis = self._create_stage_complete_ui()
 
+        # The sounds are decoded while the first frames are drawn.
         self._sfx_volume = 0.5
-        self._error_sound = Sound(FUI_PING_TRIPLET_ECHO_PATH)
+        self._assets.preload(SOUND_PATHS + (FUI_PING_TRIPLET_ECHO_PATH,))
+
+        self._last_result = (False, False)
+        if render_mode == RENDER_MODE_EVENT:
+            self._scene = SceneCache(self.ctx, self.get_framebuffer_size())
 
         # self._bgm_volume = 0.1
         # self._bgm = Sound(MAGICAL_FOREST_PATH).play(self._bgm_volume, loop=True)
 
     def play_error_sound(self) -> None:
-        self._error_sound.play(self._sfx_volume)
+        self._game.sound_pool.play(FUI_PING_TRIPLET_ECHO_PATH, self._sfx_volume)
 
     def _exit_alert_ui(self) -> UIManager:
         uis = UIManager()
@@ -257,9 +354,9 @@ class Context(Window):
     def _create_ui(self) -> UIManager:
         uis = UIManager()
         v_box = UIBoxLayout(x=0, y=0, vertical=True, align="left")
-        exit_run_normal = Texture("ExitRunNormal", Image.open(EXIT_RUN_NORMAL_PATH))
-        exit_run_hovered = Texture("ExitRunHovered", Image.open(EXIT_RUN_HOVERED_PATH))
-        exit_run_pressed = Texture("ExitRunPressed", Image.open(EXIT_RUN_PRESSED_PATH))
+        exit_run_normal = self._assets.texture(EXIT_RUN_NORMAL_PATH)
+        exit_run_hovered = self._assets.texture(EXIT_RUN_HOVERED_PATH)
+        exit_run_pressed = self._assets.texture(EXIT_RUN_PRESSED_PATH)
         exit_button = UITextureButton(
             texture=exit_run_normal,
             texture_hovered=exit_run_hovered,
@@ -321,16 +418,58 @@ class Context(Window):
     def verbose(self) -> int:
         return self._verbose
 
+    @property
+    def game(self) -> Game:
+        return self._game
+
+    @property
+    def profiler(self) -> FrameProfiler:
+        return self._profiler
+
+    @property
+    def assets(self) -> AssetManager:
+        return self._assets
+
+    @property
+    def timestep(self) -> FixedTimestep:
+        return self._timestep
+
+    @property
+    def scene(self) -> Optional[SceneCache]:
+        return self._scene
+
+    def invalidate(self) -> None:
+        """
+        Draws the scene again on the next frame in the event render mode.
+        """
+
+        if self._scene is not None:
+            self._scene.invalidate()
+
+    @overrides
+    def dispatch_event(self, event_type: str, *args):
+        if event_type in SCENE_EVENTS:
+            self.invalidate()
+        return super().dispatch_event(event_type, *args)
+
     @overrides
     def on_resize(self, width: float, height: float) -> None:
         super().on_resize(width, height)
         self._main_buttons.on_resize(width, height)
         self._game.resize(width, height)
+        if self._scene is not None:
+            self._scene.resize(self.get_framebuffer_size())
 
     @overrides
     def on_update(self, delta_time: float) -> None:
+        with self._profiler.measure(SECTION_UPDATE):
+            self._update(delta_time)
+
+    def _update(self, delta_time: float) -> None:
         self._main_buttons.on_update(delta_time)
-        self._game.update(delta_time)
+        with self._profiler.measure(SECTION_GAME_UPDATE):
+            for events in self._timestep.advance(perf_counter()):
+                self._step(events)
 
         if self._game.stage_clear:
             self._main_buttons.disable()
@@ -339,22 +478,68 @@ class Context(Window):
             self._main_buttons.disable()
             self._game.disable_buttons()
 
+        result = self._game.stage_clear, self._game.stage_failed
+        if result != self._last_result:
+            self._last_result = result
+            self.invalidate()
+
+    def _step(self, events: List[InputEvent]) -> None:
+        """
+        One fixed step of the simulation: applies the input events of the step,
+        then advances the game time.
+        """
+
+        for event in events:
+            if (
+                self._show_exit_alert
+                or self._game.stage_clear
+                or self._game.stage_failed
+            ):
+                self._timestep.clear()
+                break
+            self._game.apply(event.action)
+            self._applied_events.append(event)
+            self.invalidate()
+
+        self._game.update(self._timestep.step)
+
+        if self._replay_player is not None:
+            total_delta = self._game.engine.total_delta
+            for action in self._replay_player.pop_due(total_delta):
+                self.apply_action(action)
+                self.invalidate()
+
     def next_stage(self) -> None:
         if self._game.is_empty_more_stage():
             self.close()
         else:
-            self._game.change_next_stage()
+            self._game.apply(Action.next_stage)
             self._main_buttons.enable()
             self._game.enable_buttons()
 
     def reset_stage(self) -> None:
-        self._game.reset()
+        self._game.apply(Action.reset)
         self._main_buttons.enable()
         self._game.enable_buttons()
 
+    def apply_action(self, action: Action) -> None:
+        """
+        Applies a replayed `action` the same way as a key press.
+        """
+
+        if self._game.stage_clear:
+            self.next_stage()
+            return
+
+        if self._game.stage_failed:
+            self.reset_stage()
+            return
+
+        self._game.apply(action)
+
     @overrides
     def on_mouse_press(self, x: int, y: int, button: int, modifiers: int) -> None:
-        if self._show_exit_alert:
+        if self._show_exit_alert or self._replay_player is not None:
             return
 
         if self._game.stage_clear:
@@ -372,7 +557,15 @@ class Context(Window):
         # self._stage_clear_uis.on_key_press(symbol, modifiers)
         # self._stage_failed_uis.on_key_press(symbol, modifiers)
 
-        if self._show_exit_alert:
+        if symbol == PROFILER_OVERLAY_KEY and self._profiler.enabled:
+            self._show_profiler = not self._show_profiler
+            return
+
+        with self._profiler.measure(SECTION_INPUT):
+            self._key_press(symbol)
+
+    def _key_press(self, symbol: int) -> None:
+        if self._show_exit_alert or self._replay_player is not None:
             return
 
         if self._game.stage_clear:
@@ -383,44 +576,116 @@ class Context(Window):
             self.reset_stage()
             return
 
-        if symbol == ARCADE_KEY_R:
-            self._game.reset()
-        if symbol == ARCADE_KEY_P:
-            self._game.change_prev_stage()
-        if symbol == ARCADE_KEY_N:
-            self._game.change_next_stage()
-        if symbol == ARCADE_KEY_LEFT:
-            self._game.move(-1)
-        elif symbol == ARCADE_KEY_RIGHT:
-            self._game.move(1)
-        elif symbol == ARCADE_KEY_DOWN or symbol == ARCADE_KEY_SPACE:
-            self._game.hard_drop()
-        elif symbol == ARCADE_KEY_UP:
-            self._game.rotate()
+        action = KEY_ACTIONS.get(symbol)
+        if action is not None:
+            self._timestep.press(action, perf_counter())
+
+    @overrides
+    def on_key_release(self, symbol: int, modifiers: int) -> None:
+        action = KEY_ACTIONS.get(symbol)
+        if action is not None:
+            self._timestep.release(action, perf_counter())
+
+    @property
+    def update_rate(self) -> float:
+        return self._update_rate
+
+    @property
+    def draw_rate(self) -> float:
+        return self._draw_rate
 
     @overrides
     def on_draw(self) -> None:
-        self.clear()
+        if self._interpolate:
+            alpha = self._timestep.alpha_at(perf_counter())
+            if self._game.interpolate_cursor(alpha):
+                self.invalidate()
+
+        self._frame_skipped = self._is_frame_unchanged()
+        if self._frame_skipped:
+            return
+
+        with self._profiler.measure(SECTION_DRAW):
+            if self._scene is not None:
+                self._scene.draw(self._draw, self.background_color)
+            else:
+                self.clear()
+                self._draw()
 
+        if self._show_profiler:
+            self._draw_profiler_overlay()
+
+        self._record_latency()
+
+    def _record_latency(self) -> None:
+        if not self._applied_events:
+            return
+
+        now = perf_counter()
+        for event in self._applied_events:
+            name = f"{SECTION_LATENCY}.{event.action.name}"
+            self._profiler.record(name, now - event.time)
+        self._applied_events.clear()
+
+    def _is_frame_unchanged(self) -> bool:
+        if self._scene is None or self._scene.dirty:
+            return False
+        return not self._show_profiler
+
+    @overrides
+    def flip(self) -> None:
+        # Nothing was drawn, so the front buffer still shows the last frame.
+        if self._frame_skipped:
+            return
+        super().flip()
+
+    def _draw(self) -> None:
         if self._show_exit_alert:
-            self._exit_alert.draw()
+            with self._profiler.measure(SECTION_UI_DRAW):
+                self._exit_alert.draw()
             return
 
-        self._main_buttons.draw()
-        self._game.draw()
+        with self._profiler.measure(SECTION_UI_DRAW):
+            self._main_buttons.draw()
+        with self._profiler.measure(SECTION_GAME_DRAW):
+            self._game.draw()
 
         if self._game.stage_clear:
             self._draw_result_panel()
-            if self._game.is_empty_more_stage():
-                self._stage_complete_uis.draw()
-            else:
-                self._stage_clear_uis.draw()
+            with self._profiler.measure(SECTION_UI_DRAW):
+                if self._game.is_empty_more_stage():
+                    self._stage_complete_uis.draw()
+                else:
+                    self._stage_clear_uis.draw()
         elif self._game.stage_failed:
             self._draw_result_panel()
-            self._stage_failed_uis.draw()
+            with self._profiler.measure(SECTION_UI_DRAW):
+                self._stage_failed_uis.draw()
+
+    def _draw_profiler_overlay(self) -> None:
+        if self._profiler_frames % PROFILER_OVERLAY_REFRESH == 0:
+            self._profiler_lines = self._profiler.summary()
+        self._profiler_frames += 1
+
+        window_width, window_height = self.get_size()
+        for index, line in enumerate(self._profiler_lines):
+            draw_text(
+                text=line,
+                start_x=window_width - 8,
+                start_y=window_height - 8 - index * 14,
+                color=self._theme.foreground,
+                font_size=9,
+                font_name="monospace",
+                anchor_x="right",
+                anchor_y="top",
+            )
 
     def run(self) -> None:
-        arcade_run()
+        if self._draw_rate == DEFAULT_DRAW_RATE:
+            arcade_run()
+        else:
+            # `arcade.run` always redraws at the default rate of pyglet.
+            pyglet_run(self._draw_rate)
 
 
 def run_context(
@@ -432,7 +697,19 @@ def run_context(
     center_window=False,
     debug=False,
     verbose=0,
+    stage_pack: Optional[str] = None,
+    replay: Optional[Replay] = None,
+    record_path: Optional[str] = None,
+    board_backend=BOARD_BACKEND_BITS,
+    profile=False,
+    profile_path: Optional[str] = None,
+    render_mode=RENDER_MODE_CONTINUOUS,
+    update_hz: Optional[int] = None,
+    draw_hz=DEFAULT_DRAW_HZ,
 ) -> None:
+    add_pyglet_font(GOWUN_DODUM_REGULAR_TTF_PATH)
+    stages = open_stage_pack(stage_pack) if stage_pack else None
+
     context = Context(
         fullscreen=fullscreen,
         resizable=resizable,
@@ -442,5 +719,19 @@ def run_context(
         center_window=center_window,
         debug=debug,
         verbose=verbose,
+        stages=stages,
+        replay=replay,
+        board_backend=board_backend,
+        profiler=FrameProfiler(enabled=profile or profile_path is not None),
+        render_mode=render_mode,
+        update_hz=update_hz,
+        draw_hz=draw_hz,
     )
     context.run()
+
+    if profile_path:
+        context.profiler.dump(profile_path)
+
+    recorded = context.game.replay
+    if record_path and recorded is not None:
+        recorded.save(record_path)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+from typing import Callable, Final, Optional, Tuple
+
+from arcade.gl import Context, Framebuffer
+from arcade.gl.geometry import quad_2d_fs
+
+RENDER_MODE_CONTINUOUS: Final[str] = "continuous"
+RENDER_MODE_EVENT: Final[str] = "event"
+RENDER_MODES: Final[Tuple[str, ...]] = (RENDER_MODE_CONTINUOUS, RENDER_MODE_EVENT)
+
+_VERTEX_SHADER: Final[str] = """
+#version 330
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 uv;
+void main() {
+    gl_Position = vec4(in_vert, 0.0, 1.0);
+    uv = in_uv;
+}
+"""
+
+_FRAGMENT_SHADER: Final[str] = """
+#version 330
+uniform sampler2D scene;
+in vec2 uv;
+out vec4 color;
+void main() {
+    color = texture(scene, uv);
+}
+"""
+
+
+class SceneCache:
+    """
+    Keeps the composed scene in an offscreen framebuffer. The scene is only
+    drawn again after `invalidate`; frames that need the window redrawn without
+    a scene change, e.g. for an overlay on top, draw a single textured quad
+    from the framebuffer.
+    """
+
+    def __init__(self, ctx: Context, size: Tuple[int, int]):
+        self._ctx = ctx
+        self._quad = quad_2d_fs()
+        self._program = ctx.program(
+            vertex_shader=_VERTEX_SHADER,
+            fragment_shader=_FRAGMENT_SHADER,
+        )
+        self._program["scene"] = 0
+
+        self._framebuffer: Optional[Framebuffer] = None
+        self._size = (0, 0)
+        self._dirty = True
+        self._renders = 0
+        self._reuses = 0
+        self.resize(size)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    @property
+    def renders(self) -> int:
+        return self._renders
+
+    @property
+    def reuses(self) -> int:
+        return self._reuses
+
+    def invalidate(self) -> None:
+        self._dirty = True
+
+    def resize(self, size: Tuple[int, int]) -> None:
+        if size == self._size and self._framebuffer is not None:
+            return
+
+        width, height = max(size[0], 1), max(size[1], 1)
+        texture = self._ctx.texture((width, height), components=4)
+        self._framebuffer = self._ctx.framebuffer(color_attachments=[texture])
+        self._size = size
+        self._dirty = True
+
+    def draw(self, draw_scene: Callable[[], None], color) -> None:
+        """
+        Calls `draw_scene` into the framebuffer if the scene is invalidated,
+        then draws the framebuffer to the active one.
+        """
+
+        framebuffer = self._framebuffer
+        assert framebuffer is not None
+
+        if self._dirty:
+            with framebuffer.activate():
+                framebuffer.clear(color)
+                draw_scene()
+            self._dirty = False
+            self._renders += 1
+        else:
+            self._reuses += 1
+
+        framebuffer.color_attachments[0].use(0)
+        with self._ctx.enabled_only():
+            self._quad.render(self._program)
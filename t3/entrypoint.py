@@ -2,8 +2,14 @@
 
 from typing import Callable, List, Optional
 
-from t3.arguments import get_default_arguments
-from t3.context.context import run_context
+from t3.arguments import (
+    CMD_BENCHMARK,
+    CMD_GENERATE_STAGES,
+    CMD_REPLAY,
+    CMD_SCORE_STAGES,
+    CMD_VALIDATE_STAGES,
+    get_default_arguments,
+)
 from t3.logging.logging import (
     SEVERITY_NAME_DEBUG,
     logger,
@@ -11,6 +17,8 @@ from t3.logging.logging import (
     set_root_level,
     set_simple_logging_config,
 )
+from t3.module.optional import has_numpy
+from t3.objects.bitboard import BOARD_BACKEND_NUMPY
 
 
 def main(
@@ -30,8 +38,16 @@ def main(
     severity = args.severity
     fullscreen = args.fullscreen
     fps = args.fps
+    update_hz = args.update_hz
+    draw_hz = args.draw_hz
     vsync = args.vsync
+    board_backend = args.board_backend
+    render_mode = args.render_mode
     debug = args.debug
+    stage_pack = args.stage_pack
+    record = args.record
+    profile = args.profile
+    profile_output = args.profile_output
     verbose = args.verbose
 
     assert isinstance(default_logging, bool)
@@ -39,10 +55,22 @@ def main(
     assert isinstance(severity, str)
     assert isinstance(fullscreen, bool)
     assert isinstance(fps, int)
+    assert update_hz is None or isinstance(update_hz, int)
+    assert isinstance(draw_hz, int)
     assert isinstance(vsync, bool)
+    assert isinstance(board_backend, str)
+    assert isinstance(render_mode, str)
     assert isinstance(debug, bool)
+    assert stage_pack is None or isinstance(stage_pack, str)
+    assert record is None or isinstance(record, str)
+    assert isinstance(profile, bool)
+    assert profile_output is None or isinstance(profile_output, str)
     assert isinstance(verbose, int)
 
+    if board_backend == BOARD_BACKEND_NUMPY and not has_numpy():
+        printer("The 'numpy' board backend requires NumPy (pip install numpy)")
+        return 1
+
     if default_logging:
         set_default_logging_config()
     elif simple_logging:
@@ -55,6 +83,64 @@ def main(
 
     logger.debug(f"Arguments: {args}")
 
+    if args.cmd == CMD_VALIDATE_STAGES:
+        from t3.solver.validate import run_validate_stages
+
+        return run_validate_stages(args.stage_files, args.jobs, args.split, printer)
+
+    if args.cmd == CMD_SCORE_STAGES:
+        from t3.solver.difficulty import run_score_stages
+
+        return run_score_stages(
+            stage_files=args.stage_files,
+            max_workers=args.jobs,
+            output_format=args.format,
+            output=args.output,
+            printer=printer,
+        )
+
+    if args.cmd == CMD_BENCHMARK:
+        from t3.benchmark.benchmark import run_benchmark_command
+
+        return run_benchmark_command(
+            sizes=args.sizes,
+            repeat=args.repeat,
+            output=args.output,
+            compare=args.compare,
+            printer=printer,
+        )
+
+    if args.cmd == CMD_GENERATE_STAGES:
+        from t3.generator.generator import GeneratorOptions, run_generate_stages
+
+        options = GeneratorOptions(
+            pieces=args.pieces,
+            disabled=args.disabled,
+            height=args.height,
+            max_solutions=args.max_solutions,
+        )
+        return run_generate_stages(
+            output=args.output,
+            count=args.count,
+            options=options,
+            seed=args.seed,
+            printer=printer,
+        )
+
+    replay = None
+    if args.cmd == CMD_REPLAY:
+        from t3.replay.replay import Replay, run_headless_replays
+
+        if args.headless:
+            return run_headless_replays(args.replay_files, stage_pack, printer)
+        if len(args.replay_files) != 1:
+            printer("Only one replay file can be played in a window; use '--headless'")
+            return 1
+        replay = Replay.load(args.replay_files[0])
+
+    # arcade and pyglet are only imported when a window is created.
+    from t3.context.context import run_context
+
     try:
         run_context(
             fullscreen=fullscreen,
@@ -65,6 +151,15 @@ def main(
             center_window=False,
             debug=debug,
             verbose=verbose,
+            stage_pack=stage_pack,
+            replay=replay,
+            record_path=record,
+            board_backend=board_backend,
+            profile=profile or debug,
+            profile_path=profile_output,
+            render_mode=render_mode,
+            update_hz=update_hz,
+            draw_hz=draw_hz,
         )
     except BaseException as e:
         logger.exception(e)
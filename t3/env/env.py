@@ -0,0 +1,433 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, Dict, Final, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("t3.env requires NumPy (pip install numpy)") from e
+
+from t3.objects.action import Action
+from t3.objects.block import E, N
+from t3.objects.engine import Engine
+from t3.objects.matrix import Matrix
+from t3.objects.rotation import BLOCKS, freeze_matrix, get_rotations
+from t3.stages.stage import Stage
+from t3.stages.stages import default_stage_pack
+
+# Actions of the environments, by index.
+ACTIONS: Final[Tuple[Action, ...]] = (
+    Action.move_left,
+    Action.move_right,
+    Action.rotate,
+    Action.hard_drop,
+)
+
+REWARD_CLEAR: Final[float] = 1.0
+REWARD_FAILED: Final[float] = -1.0
+
+# Every piece fits in a square of this size in all of its rotations.
+SHAPE_SIZE: Final[int] = 4
+
+Observation = Dict[str, np.ndarray]
+
+
+def block_code(piece: Matrix) -> int:
+    """
+    The cell value of a piece, which identifies its shape in the observations.
+    """
+
+    return next(v for line in piece for v in line if v != N)
+
+
+def create_observation_space(
+    cols: int,
+    rows: int,
+    max_pieces: int,
+) -> Dict[str, Tuple[int, ...]]:
+    """
+    Shapes of the observation arrays of a single environment.
+
+    `board` holds the cell values with the bottom row first, `pieces` the codes
+    of the upcoming pieces padded with `N` and `cursor` the code, rotation and
+    column of the current piece.
+    """
+
+    return {"board": (rows, cols), "pieces": (max_pieces,), "cursor": (3,)}
+
+
+class T3Env:
+    """
+    A single environment over the `Engine` rules, with `reset`/`step` in the
+    style of gym. Actions are indices into `ACTIONS`.
+    """
+
+    def __init__(
+        self,
+        stages: Optional[Sequence[Stage]] = None,
+        max_pieces: Optional[int] = None,
+    ):
+        self._stages = stages if stages is not None else default_stage_pack()
+        self._engine = Engine(stages=self._stages)
+        self._max_pieces = (
+            max_pieces
+            if max_pieces is not None
+            else max(len(s.history) for s in self._stages)
+        )
+
+    @property
+    def engine(self) -> Engine:
+        return self._engine
+
+    @property
+    def max_pieces(self) -> int:
+        return self._max_pieces
+
+    @property
+    def observation_space(self) -> Dict[str, Tuple[int, ...]]:
+        board = self._engine.board
+        return create_observation_space(board.cols, board.rows, self._max_pieces)
+
+    def observe(self) -> Observation:
+        engine = self._engine
+
+        pieces = np.full(self._max_pieces, N, dtype=np.uint8)
+        codes = [block_code(piece) for piece in engine.history[: self._max_pieces]]
+        pieces[: len(codes)] = codes
+
+        cursor = np.zeros(3, dtype=np.int32)
+        if engine.cursor is not None:
+            cursor[0] = block_code(engine.cursor.matrix)
+            cursor[1] = engine.cursor_rotation
+            cursor[2] = engine.cursor_x
+
+        return {
+            "board": np.array(engine.board.matrix, dtype=np.uint8),
+            "pieces": pieces,
+            "cursor": cursor,
+        }
+
+    def reset(self, stage: Optional[int] = None) -> Observation:
+        if stage is not None:
+            self._engine.select_stage(stage)
+        else:
+            self._engine.reset()
+        return self.observe()
+
+    def step(self, action: int) -> Tuple[Observation, float, bool, Dict[str, Any]]:
+        engine = self._engine
+        legal = engine.apply(ACTIONS[action])
+
+        reward = 0.0
+        if engine.stage_clear:
+            reward = REWARD_CLEAR
+        elif engine.stage_failed:
+            reward = REWARD_FAILED
+        done = engine.stage_clear or engine.stage_failed
+        return self.observe(), reward, done, {"legal": legal}
+
+
+class _PieceTable:
+    """
+    Every rotation of every piece padded to `SHAPE_SIZE` squares, indexed by
+    (piece, rotation). Rotations past the distinct ones repeat the cycle.
+    """
+
+    def __init__(self, pieces: Sequence[Matrix]):
+        count = len(pieces)
+        self.codes = np.zeros(count, dtype=np.uint8)
+        self.rotations = np.zeros(count, dtype=np.int64)
+        self.widths = np.zeros((count, SHAPE_SIZE), dtype=np.int64)
+        self.masks = np.zeros((count, SHAPE_SIZE, SHAPE_SIZE, SHAPE_SIZE), bool)
+        self.unders = np.zeros_like(self.masks)
+
+        for k, piece in enumerate(pieces):
+            rotations = get_rotations(piece)
+            self.codes[k] = block_code(piece)
+            self.rotations[k] = len(rotations)
+            for r in range(SHAPE_SIZE):
+                item = rotations[r % len(rotations)]
+                self.widths[k, r] = item.width
+                for row in range(item.height):
+                    mask = item.masks[row]
+                    under = item.shape.unders[row]
+                    for col in range(item.width):
+                        self.masks[k, r, row, col] = mask >> col & 1
+                        self.unders[k, r, row, col] = under >> col & 1
+
+
+class VectorT3Env:
+    """
+    `num_envs` environments stepped together; each action is applied to all of
+    them with array operations instead of a Python loop over the environments.
+
+    The rules are those of `Engine`, and environments whose stage is over are
+    reset to another stage within the same `step`.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        stages: Optional[Sequence[Stage]] = None,
+        stage_indices: Optional[List[int]] = None,
+        max_pieces: Optional[int] = None,
+        seed=0,
+    ):
+        assert num_envs > 0
+
+        stages = stages if stages is not None else default_stage_pack()
+        if stage_indices is None:
+            stage_indices = list(range(len(stages)))
+        selected = [stages[i] for i in stage_indices]
+
+        self._num_envs = num_envs
+        self._stage_indices = np.array(stage_indices, dtype=np.int64)
+        self._random = np.random.default_rng(seed)
+
+        self._rows = len(selected[0].board)
+        self._cols = len(selected[0].board[0])
+        if any(len(s.board) != self._rows for s in selected):
+            raise ValueError("All stages must have the same board size")
+        if any(len(s.board[0]) != self._cols for s in selected):
+            raise ValueError("All stages must have the same board size")
+
+        self._max_pieces = (
+            max_pieces
+            if max_pieces is not None
+            else max(len(s.history) for s in selected)
+        )
+
+        self._table = _PieceTable(BLOCKS)
+        piece_index = {freeze_matrix(b): k for k, b in enumerate(BLOCKS)}
+
+        # Boards with the bottom row first, and the histories as piece indices.
+        count = len(selected)
+        self._history_size = max(len(s.history) for s in selected)
+        self._stage_values = np.zeros((count, self._rows, self._cols), np.uint8)
+        self._stage_history = np.zeros((count, self._history_size), np.int64)
+        self._stage_lengths = np.zeros(count, np.int64)
+        for i, stage in enumerate(selected):
+            self._stage_values[i] = np.array(stage.board[::-1], dtype=np.uint8)
+            history = [piece_index[freeze_matrix(p)] for p in stage.history]
+            self._stage_history[i, : len(history)] = history
+            self._stage_lengths[i] = len(history)
+
+        # Active cells, padded on the top and right so that a piece window
+        # never leaves the array; the padding is inactive.
+        padded = (num_envs, self._rows + SHAPE_SIZE, self._cols + SHAPE_SIZE)
+        self._active = np.zeros(padded, dtype=bool)
+        self._values = np.zeros((num_envs, self._rows, self._cols), np.uint8)
+
+        self._stage = np.zeros(num_envs, dtype=np.int64)
+        self._history = np.zeros((num_envs, self._history_size), np.int64)
+        self._lengths = np.zeros(num_envs, dtype=np.int64)
+        self._position = np.zeros(num_envs, dtype=np.int64)
+        self._piece = np.zeros(num_envs, dtype=np.int64)
+        self._rotation = np.zeros(num_envs, dtype=np.int64)
+        self._x = np.zeros(num_envs, dtype=np.int64)
+
+        self._offsets = np.arange(SHAPE_SIZE)
+        self._ys = np.arange(self._rows)
+
+    @property
+    def num_envs(self) -> int:
+        return self._num_envs
+
+    @property
+    def cols(self) -> int:
+        return self._cols
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def max_pieces(self) -> int:
+        return self._max_pieces
+
+    @property
+    def observation_space(self) -> Dict[str, Tuple[int, ...]]:
+        """
+        Shapes for a single environment; the observations of `step` add
+        a leading axis of `num_envs`.
+        """
+
+        return create_observation_space(self._cols, self._rows, self._max_pieces)
+
+    @property
+    def stages(self) -> np.ndarray:
+        """
+        Stage index of each environment.
+        """
+
+        return self._stage_indices[self._stage]
+
+    def observe(self) -> Observation:
+        positions = self._position[:, None] + 1 + np.arange(self._max_pieces)
+        upcoming = positions < self._lengths[:, None]
+        indices = np.take_along_axis(
+            self._history,
+            np.minimum(positions, self._history_size - 1),
+            axis=1,
+        )
+        pieces = np.where(upcoming, self._table.codes[indices], N).astype(np.uint8)
+        cursor = np.stack(
+            [self._table.codes[self._piece], self._rotation, self._x],
+            axis=1,
+        ).astype(np.int32)
+        return {"board": self._values.copy(), "pieces": pieces, "cursor": cursor}
+
+    def _reset_envs(self, envs: np.ndarray, stage: Optional[int] = None) -> None:
+        if not len(envs):
+            return
+
+        if stage is not None:
+            picked = np.full(len(envs), stage, dtype=np.int64)
+        else:
+            picked = self._random.integers(len(self._stage_indices), size=len(envs))
+
+        values = self._stage_values[picked]
+        self._values[envs] = values
+        self._active[envs] = False
+        self._active[envs, : self._rows, : self._cols] = (values != N) & (values != E)
+
+        self._stage[envs] = picked
+        self._history[envs] = self._stage_history[picked]
+        self._lengths[envs] = self._stage_lengths[picked]
+        self._position[envs] = 0
+        self._next_block(envs)
+
+    def reset(self, stage: Optional[int] = None) -> Observation:
+        """
+        Resets every environment to the `stage`-th of the selected stages,
+        or to random ones.
+        """
+
+        self._reset_envs(np.arange(self._num_envs), stage)
+        return self.observe()
+
+    def _next_block(self, envs: np.ndarray) -> None:
+        piece = self._history[envs, self._position[envs]]
+        self._piece[envs] = piece
+        self._rotation[envs] = 0
+        self._x[envs] = self._cols // 2 - self._table.widths[piece, 0] // 2
+
+    def _windows(
+        self,
+        grid: np.ndarray,
+        envs: np.ndarray,
+        ys: np.ndarray,
+        xs: np.ndarray,
+    ) -> np.ndarray:
+        """
+        `SHAPE_SIZE` squares of the `grid` at the (y, x) of each environment.
+        `ys` may have an extra axis to take several rows per environment.
+        """
+
+        extra = (None,) * (ys.ndim - 1)
+        rows = ys[..., None, None] + self._offsets[:, None]
+        cols = xs[(...,) + extra + (None, None)] + self._offsets
+        return grid[envs[(...,) + extra + (None, None)], rows, cols]
+
+    def _collides(self, envs, pieces, rotations, xs) -> np.ndarray:
+        windows = self._windows(self._active, envs, np.zeros_like(xs), xs)
+        return (windows & self._table.masks[pieces, rotations]).any(axis=(1, 2))
+
+    def _move(self, envs: np.ndarray, delta: int) -> np.ndarray:
+        pieces = self._piece[envs]
+        rotations = self._rotation[envs]
+        max_x = self._cols - self._table.widths[pieces, rotations]
+        xs = self._x[envs] + delta
+        stopped = (xs < 0) | (xs > max_x)
+        xs = np.clip(xs, 0, max_x)
+
+        moved = ~self._collides(envs, pieces, rotations, xs)
+        self._x[envs[moved]] = xs[moved]
+        return ~stopped
+
+    def _rotate(self, envs: np.ndarray) -> np.ndarray:
+        pieces = self._piece[envs]
+        rotations = (self._rotation[envs] + 1) % self._table.rotations[pieces]
+        widths = self._table.widths[pieces, rotations]
+        xs = self._x[envs]
+        xs = np.where(xs + widths >= self._cols, self._cols - widths, xs)
+
+        rotated = ~self._collides(envs, pieces, rotations, xs)
+        self._rotation[envs[rotated]] = rotations[rotated]
+        self._x[envs[rotated]] = xs[rotated]
+        return rotated
+
+    def _hard_drop(self, envs: np.ndarray) -> np.ndarray:
+        pieces = self._piece[envs]
+        rotations = self._rotation[envs]
+        xs = self._x[envs]
+        masks = self._table.masks[pieces, rotations]
+        unders = self._table.unders[pieces, rotations]
+
+        # The first row in which every cell of the piece is active.
+        ys = np.broadcast_to(self._ys, (len(envs), self._rows))
+        windows = self._windows(self._active, envs, ys, xs)
+        contained = (windows | ~masks[:, None]).all(axis=(2, 3))
+        found = contained.any(axis=1)
+        y = contained.argmax(axis=1)
+
+        # No active cell in the holes of the piece, nor under it.
+        at_y = windows[np.arange(len(envs)), y]
+        blocked = (at_y & unders).any(axis=(1, 2))
+
+        belows = np.logical_or.accumulate(self._active[envs], axis=1)
+        below_rows = np.maximum(y - 1, 0)
+        cols = xs[:, None] + self._offsets
+        spans = self._offsets < self._table.widths[pieces, rotations][:, None]
+        below = belows[np.arange(len(envs))[:, None], below_rows[:, None], cols]
+        blocked |= (y > 0) & (below & spans).any(axis=1)
+
+        dropped = found & ~blocked
+        if not dropped.any():
+            return dropped
+
+        cells, dy, dx = np.nonzero(masks[dropped])
+        targets = envs[dropped][cells]
+        rows = y[dropped][cells] + dy
+        cols = xs[dropped][cells] + dx
+        self._active[targets, rows, cols] = False
+        self._values[targets, rows, cols] = E
+
+        envs = envs[dropped]
+        self._position[envs] += 1
+        playing = self._position[envs] < self._lengths[envs]
+        self._next_block(envs[playing])
+        return dropped
+
+    def step(
+        self,
+        actions: np.ndarray,
+    ) -> Tuple[Observation, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Returns the observations, rewards, done flags and an info dict of arrays.
+        Observations of finished environments are those of their next stage.
+        """
+
+        actions = np.asarray(actions, dtype=np.int64)
+        legal = np.zeros(self._num_envs, dtype=bool)
+        for index, action in enumerate(ACTIONS):
+            envs = np.flatnonzero(actions == index)
+            if not len(envs):
+                continue
+            if action == Action.move_left:
+                legal[envs] = self._move(envs, -1)
+            elif action == Action.move_right:
+                legal[envs] = self._move(envs, 1)
+            elif action == Action.rotate:
+                legal[envs] = self._rotate(envs)
+            else:
+                legal[envs] = self._hard_drop(envs)
+
+        dones = self._position >= self._lengths
+        clear = dones & ~self._active.any(axis=(1, 2))
+        rewards = np.where(clear, REWARD_CLEAR, 0.0)
+        rewards = np.where(dones & ~clear, REWARD_FAILED, rewards)
+
+        info = {"legal": legal, "clear": clear, "stage": self.stages}
+        self._reset_envs(np.flatnonzero(dones))
+        return self.observe(), rewards, dones, info
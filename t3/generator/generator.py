@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+import json
+from random import Random
+from time import perf_counter
+from typing import Callable, Final, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from t3.objects.block import D, E
+from t3.objects.rotation import Rotation, get_rotations
+from t3.solver.solver import Solver, SolverResult, popcount
+from t3.stages.loader import BLOCK_CODES, CELL_CODES, dump_stage
+from t3.stages.mapped_pack import write_stage_pack
+from t3.stages.stage import Stage
+
+DEFAULT_COLS: Final[int] = 10
+DEFAULT_ROWS: Final[int] = 20
+DEFAULT_PIECES: Final[int] = 8
+DEFAULT_HEIGHT: Final[int] = 8
+DEFAULT_COUNT: Final[int] = 100
+
+# Random placements tried for each piece before the layout is started over.
+PLACEMENT_ATTEMPTS: Final[int] = 64
+# Layouts tried for each stage before giving up.
+STAGE_ATTEMPTS: Final[int] = 1000
+
+
+class GeneratorError(ValueError):
+    pass
+
+
+class GeneratorOptions(NamedTuple):
+    cols: int = DEFAULT_COLS
+    rows: int = DEFAULT_ROWS
+
+    # Number of pieces in the history.
+    pieces: int = DEFAULT_PIECES
+
+    # Upper bound of the cells drawn as disabled (`D`) instead of the colour of
+    # their piece; whole pieces are disabled. `None` disables every cell.
+    disabled: Optional[int] = None
+
+    # Number of rows, from the top of the board, the layout may occupy.
+    height: int = DEFAULT_HEIGHT
+
+    # Layouts with more solutions than this are rejected.
+    max_solutions: Optional[int] = None
+
+
+class GeneratedStage(NamedTuple):
+    stage: Stage
+    result: SolverResult
+
+
+class _Piece(NamedTuple):
+    code: str
+    rotation: Rotation
+    x: int
+    y: int
+
+
+class StageGenerator:
+    """
+    Builds a `_solver`-style layout by placing random pieces in the reverse order
+    of play, so that every piece can be hard dropped when its turn comes,
+    then derives the `board` and `history` from it and verifies the stage with
+    the `Solver`.
+
+    The layout hangs from the top of the board like the authored stages, and a
+    new piece is pushed up against the layout, so the lowest cell of each of
+    its columns is the lowest active cell of that column.
+    """
+
+    def __init__(self, options: Optional[GeneratorOptions] = None, seed=0):
+        self._options = options if options is not None else GeneratorOptions()
+        self._random = Random(seed)
+        self._codes = list(BLOCK_CODES.keys())
+        self._rotations = {
+            code: get_rotations(block) for code, block in BLOCK_CODES.items()
+        }
+
+        max_height = max(r.height for rs in self._rotations.values() for r in rs)
+        if self._options.height + max_height > self._options.rows:
+            # Otherwise the layout could block the cursor.
+            raise ValueError("The height leaves no room for the cursor")
+
+        self._layouts = 0
+
+    @property
+    def options(self) -> GeneratorOptions:
+        return self._options
+
+    @property
+    def layouts(self) -> int:
+        """
+        Number of layouts built so far, including the rejected ones.
+        """
+
+        return self._layouts
+
+    def _place(self, lowest: List[int], rotation: Rotation, x: int) -> int:
+        """
+        Returns the highest row at which the `rotation` can be placed in the `x`
+        column without any cell of the layout under or inside its columns.
+        """
+
+        y = self._options.rows - rotation.height
+        for col, bottom in enumerate(rotation.bottoms):
+            if bottom < 0:
+                continue
+            top = max(r for r, m in enumerate(rotation.masks) if m >> col & 1)
+            y = min(y, lowest[x + col] - top - 1)
+        return y
+
+    def layout(self) -> Optional[List[_Piece]]:
+        """
+        Pieces in the order of placement, the reverse of the `history`.
+        """
+
+        cols = self._options.cols
+        rows = self._options.rows
+        floor = rows - self._options.height
+
+        # The lowest occupied row of each column.
+        lowest = [rows] * cols
+        result = list()
+        for _ in range(self._options.pieces):
+            for _ in range(PLACEMENT_ATTEMPTS):
+                code = self._random.choice(self._codes)
+                rotation = self._random.choice(self._rotations[code])
+                if rotation.width > cols:
+                    continue
+                x = self._random.randrange(cols - rotation.width + 1)
+                y = self._place(lowest, rotation, x)
+                if y >= floor:
+                    break
+            else:
+                return None
+
+            for row, mask in enumerate(rotation.masks):
+                for col in range(rotation.width):
+                    if mask >> col & 1:
+                        lowest[x + col] = min(lowest[x + col], y + row)
+            result.append(_Piece(code, rotation, x, y))
+        return result
+
+    def create_stage(self, pieces: List[_Piece]) -> Stage:
+        cols = self._options.cols
+        rows = self._options.rows
+
+        disabled: Set[int] = set()
+        limit = self._options.disabled
+        if limit is None:
+            disabled.update(range(len(pieces)))
+        else:
+            cells = 0
+            order = list(range(len(pieces)))
+            self._random.shuffle(order)
+            for index in order:
+                size = sum(popcount(m) for m in pieces[index].rotation.masks)
+                if cells + size <= limit:
+                    disabled.add(index)
+                    cells += size
+
+        solver = [[E for _x in range(cols)] for _y in range(rows)]
+        board = [[E for _x in range(cols)] for _y in range(rows)]
+        for index, piece in enumerate(pieces):
+            value = CELL_CODES[piece.code]
+            for row, mask in enumerate(piece.rotation.masks):
+                for col in range(piece.rotation.width):
+                    if mask >> col & 1:
+                        solver[piece.y + row][piece.x + col] = value
+                        board[piece.y + row][piece.x + col] = (
+                            D if index in disabled else value
+                        )
+
+        # Stages are written from top to bottom.
+        stage = Stage()
+        stage.solver = solver[::-1]
+        stage.board = board[::-1]
+        stage.history = [BLOCK_CODES[piece.code] for piece in reversed(pieces)]
+        return stage
+
+    def generate(self) -> GeneratedStage:
+        max_solutions = self._options.max_solutions
+        for _ in range(STAGE_ATTEMPTS):
+            self._layouts += 1
+            pieces = self.layout()
+            if pieces is None:
+                continue
+
+            stage = self.create_stage(pieces)
+            result = Solver.from_stage(stage).solve()
+            if not result.solved:
+                continue
+            if max_solutions is not None and result.solutions > max_solutions:
+                continue
+            return GeneratedStage(stage, result)
+        raise GeneratorError("No stage satisfies the generator options")
+
+
+def generate_stages(
+    count: int,
+    options: Optional[GeneratorOptions] = None,
+    seed=0,
+) -> Iterator[GeneratedStage]:
+    generator = StageGenerator(options, seed)
+    for _ in range(count):
+        yield generator.generate()
+
+
+def run_generate_stages(
+    output: str,
+    count=DEFAULT_COUNT,
+    options: Optional[GeneratorOptions] = None,
+    seed=0,
+    printer: Callable[..., None] = print,
+) -> int:
+    """
+    Writes the generated stages to a JSON file, if the `output` ends with
+    `.json`, or to a binary stage pack.
+    """
+
+    begin = perf_counter()
+    stages: List[Tuple[str, Stage]] = list()
+    try:
+        for index, item in enumerate(generate_stages(count, options, seed)):
+            name = f"generated{index:05d}"
+            stages.append((name, item.stage))
+            printer(
+                f"{name}: pieces={len(item.stage.history)}"
+                f" solutions={item.result.solutions} nodes={item.result.nodes}"
+            )
+    except GeneratorError as e:
+        printer(f"Stage generation failed after {len(stages)} stages: {e}")
+        return 1
+    elapsed = perf_counter() - begin
+
+    if output.lower().endswith(".json"):
+        data = {"stages": [dump_stage(stage, name) for name, stage in stages]}
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    else:
+        names = [name for name, _ in stages]
+        write_stage_pack(output, [stage for _, stage in stages], names)
+
+    printer(f"{len(stages)} stages in {elapsed:.3f}s")
+    return 0
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+
+from importlib.util import find_spec
+
+
+def has_module(name: str) -> bool:
+    """
+    Whether an optional dependency is installed, without importing it.
+    """
+
+    return find_spec(name) is not None
+
+
+def has_numpy() -> bool:
+    return has_module("numpy")
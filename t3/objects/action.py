@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+from enum import IntEnum, unique
+
+
+@unique
+class Action(IntEnum):
+    """
+    Player inputs that change the game state. The values are part of the
+    replay file format and must not be changed.
+    """
+
+    move_left = 1
+    move_right = 2
+    rotate = 3
+    hard_drop = 4
+    reset = 5
+    prev_stage = 6
+    next_stage = 7
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+
+from typing import TYPE_CHECKING, Final, List, Optional, Tuple, Union
+
+from t3.objects.block import N, is_active_block
+from t3.objects.matrix import Matrix
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from t3.objects.numpy_board import NumpyBoard
+
+
+def row_mask(line: List[int]) -> int:
+    result = 0
+    for col, val in enumerate(line):
+        if is_active_block(val):
+            result |= 1 << col
+    return result
+
+
+class BitShape:
+    """
+    Occupancy masks of a shape. Bit `n` of each row mask is column `n`.
+    """
+
+    def __init__(self, shape: Matrix):
+        self._matrix = shape
+        self._width = len(shape[0])
+        self._height = len(shape)
+        self._masks = [row_mask(line) for line in shape]
+
+        # Inactive cells located under the top-most active cell of each column.
+        # A shape can not pass through a block that is placed in these cells.
+        self._unders = list()
+        above = 0
+        for mask in reversed(self._masks):
+            self._unders.append(above & ~mask)
+            above |= mask
+        self._unders.reverse()
+
+        self._span = (1 << self._width) - 1
+
+    @property
+    def matrix(self) -> Matrix:
+        return self._matrix
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def masks(self) -> List[int]:
+        return self._masks
+
+    @property
+    def unders(self) -> List[int]:
+        return self._unders
+
+    @property
+    def span(self) -> int:
+        return self._span
+
+
+ShapeLike = Union[Matrix, BitShape]
+BoundingBox = Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]
+
+BOARD_BACKEND_BITS: Final[str] = "bits"
+BOARD_BACKEND_NUMPY: Final[str] = "numpy"
+BOARD_BACKENDS: Final[List[str]] = [BOARD_BACKEND_BITS, BOARD_BACKEND_NUMPY]
+
+
+def as_bit_shape(shape: ShapeLike) -> BitShape:
+    if isinstance(shape, BitShape):
+        return shape
+    return BitShape(shape)
+
+
+class BitBoard:
+    """
+    Board core that packs each row into an integer occupancy mask.
+
+    The cell values are kept in `matrix` for rendering,
+    while all rule checks are performed with shift-and-AND operations on `masks`.
+    """
+
+    def __init__(self, cols: int, rows: int, block_init: Optional[int] = None):
+        assert rows > 0
+        assert cols > 0
+
+        init = block_init if block_init is not None else N
+        self._cols = cols
+        self._rows = rows
+        self._matrix = [[init for _x in range(cols)] for _y in range(rows)]
+        self._masks = [row_mask(line) for line in self._matrix]
+        self._belows: Optional[List[int]] = None
+
+        # Incremented whenever a cell changes, so that callers can cache results.
+        self._version = 0
+
+        # Cells written since the last `pop_dirty_cells`, one mask per row.
+        self._dirty = [0 for _y in range(rows)]
+
+    @property
+    def matrix(self) -> Matrix:
+        return self._matrix
+
+    @property
+    def masks(self) -> List[int]:
+        return self._masks
+
+    @property
+    def cols(self) -> int:
+        return self._cols
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def dirty(self) -> List[int]:
+        return self._dirty
+
+    def is_dirty(self) -> bool:
+        return any(self._dirty)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def _invalidate(self) -> None:
+        self._belows = None
+        self._version += 1
+
+    def _mark_all_dirty(self) -> None:
+        self._dirty = [(1 << self._cols) - 1 for _y in range(self._rows)]
+
+    def clear_dirty(self) -> None:
+        self._dirty = [0 for _y in range(self._rows)]
+
+    def pop_dirty_cells(self) -> List[Tuple[int, int]]:
+        """
+        Returns the `(col, row)` of every cell written since the last call.
+        """
+
+        result = list()
+        for row, mask in enumerate(self._dirty):
+            while mask:
+                low = mask & -mask
+                result.append((low.bit_length() - 1, row))
+                mask ^= low
+        self.clear_dirty()
+        return result
+
+    def _get_belows(self) -> List[int]:
+        """
+        `belows[y]` is the union of all row masks under the `y` row.
+        """
+
+        if self._belows is None:
+            belows = [0]
+            for mask in self._masks:
+                belows.append(belows[-1] | mask)
+            self._belows = belows
+        return self._belows
+
+    def set_cell(self, col: int, row: int, value: int) -> None:
+        self._matrix[row][col] = value
+        if is_active_block(value):
+            self._masks[row] |= 1 << col
+        else:
+            self._masks[row] &= ~(1 << col)
+        self._dirty[row] |= 1 << col
+        self._invalidate()
+
+    def set_matrix(self, matrix: Matrix, masks: Optional[List[int]] = None) -> None:
+        self._cols = len(matrix[0])
+        self._rows = len(matrix)
+        self._matrix = matrix
+        if masks is not None:
+            self._masks = list(masks)
+        else:
+            self._masks = [row_mask(line) for line in matrix]
+        self._mark_all_dirty()
+        self._invalidate()
+
+    def join_matrix(self, matrix: Matrix, x=0, y=0) -> None:
+        for row, line in enumerate(matrix):
+            for col, val in enumerate(line):
+                self.set_cell(col + x, row + y - 1, val)
+
+    def fill(self, value: int) -> None:
+        mask = (1 << self._cols) - 1 if is_active_block(value) else 0
+        for row in range(self._rows):
+            line = self._matrix[row]
+            for col in range(self._cols):
+                line[col] = value
+            self._masks[row] = mask
+        self._mark_all_dirty()
+        self._invalidate()
+
+    def fill_matrix(
+        self,
+        shape: ShapeLike,
+        offset_x: int,
+        offset_y: int,
+        value=N,
+    ) -> None:
+        bits = as_bit_shape(shape)
+        active = is_active_block(value)
+        for row, line in enumerate(bits.matrix):
+            board_line = self._matrix[row + offset_y]
+            for col, val in enumerate(line):
+                if not is_active_block(val):
+                    continue
+                board_line[col + offset_x] = value
+
+            mask = bits.masks[row] << offset_x
+            if active:
+                self._masks[row + offset_y] |= mask
+            else:
+                self._masks[row + offset_y] &= ~mask
+            self._dirty[row + offset_y] |= mask
+        self._invalidate()
+
+    def is_all_inactive(self) -> bool:
+        return not any(self._masks)
+
+    @property
+    def bbox(self) -> BoundingBox:
+        """
+        `(left, top, right, bottom)` of the active cells, or all `None`.
+        """
+
+        rows = [row for row, mask in enumerate(self._masks) if mask]
+        if not rows:
+            return None, None, None, None
+
+        union = 0
+        for mask in self._masks:
+            union |= mask
+        left = (union & -union).bit_length() - 1
+        right = union.bit_length() - 1
+        return left, rows[-1], right, rows[0]
+
+    def check_collision(self, shape: ShapeLike, offset_x: int, offset_y: int) -> bool:
+        bits = as_bit_shape(shape)
+        masks = self._masks
+        for row, mask in enumerate(bits.masks):
+            if masks[row + offset_y] & (mask << offset_x):
+                return True
+        return False
+
+    def check_intersection(
+        self,
+        shape: ShapeLike,
+        offset_x: int,
+        offset_y: int,
+    ) -> bool:
+        bits = as_bit_shape(shape)
+        masks = self._masks
+        for row, mask in enumerate(bits.masks):
+            shifted = mask << offset_x
+            if (masks[row + offset_y] & shifted) != shifted:
+                return False
+        return True
+
+    def check_insertable(self, shape: ShapeLike, offset_x: int, offset_y: int) -> bool:
+        bits = as_bit_shape(shape)
+        masks = self._masks
+        for row, under in enumerate(bits.unders):
+            if under and masks[row + offset_y] & (under << offset_x):
+                return False
+
+        # All spaces under `shape` in `board` should be empty
+        if self._get_belows()[offset_y] & (bits.span << offset_x):
+            return False
+
+        return True
+
+    def get_hard_drop_position(
+        self,
+        shape: ShapeLike,
+        offset_x: int,
+        offset_y: int = 0,
+    ) -> Optional[int]:
+        bits = as_bit_shape(shape)
+        max_y = self._rows - bits.height
+        for y in range(offset_y, max_y + 1, 1):
+            if self.check_intersection(bits, offset_x, y):
+                if self.check_insertable(bits, offset_x, y):
+                    return y
+                else:
+                    return None
+        return None
+
+
+BoardCore = Union[BitBoard, "NumpyBoard"]
+
+# Cell values of a board core: nested lists, or an array for the `numpy` backend.
+CoreMatrix = Union[Matrix, "np.ndarray"]
+
+
+def create_board_core(
+    cols: int,
+    rows: int,
+    block_init: Optional[int] = None,
+    backend=BOARD_BACKEND_BITS,
+) -> BoardCore:
+    """
+    The `numpy` backend is imported on demand, since NumPy is optional.
+    """
+
+    if backend == BOARD_BACKEND_NUMPY:
+        from t3.objects.numpy_board import NumpyBoard
+
+        return NumpyBoard(cols, rows, block_init)
+    if backend != BOARD_BACKEND_BITS:
+        raise ValueError(f"Unknown board backend: {backend}")
+    return BitBoard(cols, rows, block_init)
@@ -1,14 +1,9 @@
 # -*- coding: utf-8 -*-
 
 from enum import Enum, unique, auto
-from typing import Final, Dict
+from typing import Final
 
-from PIL import Image, ImageDraw
-from arcade import Texture
-
-from t3.color.color_tuple import ColorTuple
 from t3.objects.matrix import Matrix
-from t3.theme.theme import Theme
 
 
 @unique
@@ -115,41 +110,6 @@ def is_active_block(v: int) -> bool:
     return v != N and v != E
 
 
-def create_block_texture(
-    name: str,
-    width: int,
-    height: int,
-    color: ColorTuple,
-) -> Texture:
-    image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(image)
-    xy = (0, 0, width, height)
-    draw.rectangle(xy, color)
-    return Texture(name, image=image)
-
-
-def create_block_textures(width: int, height: int, theme: Theme) -> Dict[int, Texture]:
-    return {
-        N: create_block_texture("N", width, height, (0, 0, 0, 0)),
-        E: create_block_texture("E", width, height, theme.empty),
-        D: create_block_texture("D", width, height, theme.block_disable),
-        I: create_block_texture("I", width, height, theme.block_i_normal),
-        O: create_block_texture("O", width, height, theme.block_o_normal),
-        T: create_block_texture("T", width, height, theme.block_t_normal),
-        L: create_block_texture("L", width, height, theme.block_l_normal),
-        J: create_block_texture("J", width, height, theme.block_j_normal),
-        S: create_block_texture("S", width, height, theme.block_s_normal),
-        Z: create_block_texture("Z", width, height, theme.block_z_normal),
-        IC: create_block_texture("IC", width, height, theme.block_i_clear),
-        OC: create_block_texture("OC", width, height, theme.block_o_clear),
-        TC: create_block_texture("TC", width, height, theme.block_t_clear),
-        LC: create_block_texture("LC", width, height, theme.block_l_clear),
-        JC: create_block_texture("JC", width, height, theme.block_j_clear),
-        SC: create_block_texture("SC", width, height, theme.block_s_clear),
-        ZC: create_block_texture("ZC", width, height, theme.block_z_clear),
-    }
-
-
 def rotate_clockwise(shape: Matrix) -> Matrix:
     result = list()
     for x in range(len(shape[0]) - 1, -1, -1):
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, Final, List, Tuple
+
+from PIL import Image, ImageDraw
+from arcade import Texture
+
+from t3.color.color_tuple import ColorTuple
+from t3.objects.block import BlockIndex
+from t3.theme.theme import Theme
+
+TRANSPARENT: Final[ColorTuple] = (0, 0, 0, 0)
+
+# Theme attribute of each block index. `N` is always transparent.
+BLOCK_COLOR_ATTRIBUTES: Final[Dict[int, str]] = {
+    BlockIndex.e.value: "empty",
+    BlockIndex.d.value: "block_disable",
+    BlockIndex.i.value: "block_i_normal",
+    BlockIndex.o.value: "block_o_normal",
+    BlockIndex.t.value: "block_t_normal",
+    BlockIndex.l.value: "block_l_normal",
+    BlockIndex.j.value: "block_j_normal",
+    BlockIndex.s.value: "block_s_normal",
+    BlockIndex.z.value: "block_z_normal",
+    BlockIndex.ic.value: "block_i_clear",
+    BlockIndex.oc.value: "block_o_clear",
+    BlockIndex.tc.value: "block_t_clear",
+    BlockIndex.lc.value: "block_l_clear",
+    BlockIndex.jc.value: "block_j_clear",
+    BlockIndex.sc.value: "block_s_clear",
+    BlockIndex.zc.value: "block_z_clear",
+}
+
+AtlasKey = Tuple[int, int, Tuple[ColorTuple, ...]]
+
+
+def block_colors(theme: Theme) -> List[ColorTuple]:
+    """
+    Colors of every block, where the list index is the `BlockIndex` value.
+    """
+
+    result = list()
+    for block in BlockIndex:
+        attribute = BLOCK_COLOR_ATTRIBUTES.get(block.value)
+        result.append(tuple(getattr(theme, attribute)) if attribute else TRANSPARENT)
+    return result
+
+
+class BlockAtlas:
+    """
+    Every block color of a theme packed side by side into a single image.
+    Each region is exposed as a texture indexed by `BlockIndex` value.
+    """
+
+    def __init__(self, width: int, height: int, colors: List[ColorTuple]):
+        self._width = width
+        self._height = height
+        self._image = Image.new("RGBA", (width * len(colors), height), TRANSPARENT)
+
+        draw = ImageDraw.Draw(self._image)
+        for index, color in enumerate(colors):
+            left = index * width
+            draw.rectangle((left, 0, left + width - 1, height - 1), color)
+
+        # The name identifies the region in the shared GPU texture atlas,
+        # so it must be unique for each size and color.
+        self._textures: Dict[int, Texture] = dict()
+        for index, color in enumerate(colors):
+            left = index * width
+            region = self._image.crop((left, 0, left + width, height))
+            code = "".join(f"{c:02x}" for c in color)
+            name = f"Block{width}x{height}#{code}"
+            self._textures[index] = Texture(name, image=region)
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def image(self) -> Image.Image:
+        return self._image
+
+    @property
+    def textures(self) -> Dict[int, Texture]:
+        return self._textures
+
+    def __getitem__(self, index: int) -> Texture:
+        return self._textures[index]
+
+    def __len__(self) -> int:
+        return len(self._textures)
+
+
+_atlases: Dict[AtlasKey, BlockAtlas] = dict()
+
+
+def get_block_atlas(width: int, height: int, theme: Theme) -> BlockAtlas:
+    """
+    Atlases are built once per (block size, theme colors) and then shared.
+    """
+
+    colors = block_colors(theme)
+    key = (width, height, tuple(colors))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = BlockAtlas(width, height, colors)
+        _atlases[key] = atlas
+    return atlas
+
+
+def create_block_textures(width: int, height: int, theme: Theme) -> Dict[int, Texture]:
+    return get_block_atlas(width, height, theme).textures
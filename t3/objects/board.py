@@ -4,8 +4,16 @@ from typing import Dict, Tuple, Optional
 
 from arcade import SpriteList, Texture, Sprite
 
-from t3.objects.block import N, is_active_block
+from t3.objects.bitboard import (
+    BoardCore,
+    BoundingBox,
+    CoreMatrix,
+    ShapeLike,
+    create_board_core,
+)
+from t3.objects.block import N
 from t3.objects.matrix import Matrix
+from t3.objects.sprite_pool import SpritePool
 
 
 class Board:
@@ -18,37 +26,48 @@ class Board:
         block_margin: int,
         block_textures: Dict[int, Texture],
         block_init: Optional[int] = None,
+        core: Optional[BoardCore] = None,
+        pool: Optional[SpritePool] = None,
     ):
-        assert rows > 0
-        assert cols > 0
-
-        self._cols = cols
-        self._rows = rows
+        self._core = (
+            core if core is not None else create_board_core(cols, rows, block_init)
+        )
         self._block_width = block_width
         self._block_height = block_height
         self._block_margin = block_margin
         self._offset_x = 0
         self._offset_y = 0
         self._block_textures = block_textures
+        self._pool = pool if pool is not None else SpritePool()
 
-        init = block_init if block_init is not None else N
-        self._matrix = [[init for _x in range(cols)] for _y in range(rows)]
+        self._sprites_size = (self._core.cols, self._core.rows)
         self._sprites = self.create_sprites()
 
     def create_sprites(self) -> SpriteList:
-        result = SpriteList()
-        for y in range(self._rows):
-            for x in range(self._cols):
-                sprite = Sprite()
-                for texture in self._block_textures.values():
-                    sprite.append_texture(texture)
-                sprite.set_texture(self._matrix[y][x])
+        """
+        Takes a sprite list of the current size from the pool and lays it out.
+        """
+
+        matrix = self._core.matrix
+        result = self._pool.acquire(self._core.cols, self._core.rows)
+        for y in range(self._core.rows):
+            for x in range(self._core.cols):
+                sprite = result[self._core.cols * y + x]
+                sprite.texture = self._block_textures[matrix[y][x]]
                 center = self.measure_block_center(x, y)
                 sprite.center_x = self._offset_x + center[0]
                 sprite.center_y = self._offset_y + center[1]
-                result.append(sprite)
+        self._core.clear_dirty()
         return result
 
+    def release_sprites(self) -> None:
+        """
+        Returns the sprites to the pool. The board must not be drawn afterwards.
+        """
+
+        cols, rows = self._sprites_size
+        self._pool.release(cols, rows, self._sprites)
+
     def measure_block_center(self, col: int, row: int) -> Tuple[float, float]:
         assert self._block_width > 0
         assert self._block_height > 0
@@ -67,16 +86,24 @@ class Board:
         return center_x, center_y
 
     @property
-    def matrix(self) -> Matrix:
-        return self._matrix
+    def core(self) -> BoardCore:
+        return self._core
+
+    @property
+    def pool(self) -> SpritePool:
+        return self._pool
+
+    @property
+    def matrix(self) -> CoreMatrix:
+        return self._core.matrix
 
     @property
     def cols(self) -> int:
-        return self._cols
+        return self._core.cols
 
     @property
     def rows(self) -> int:
-        return self._rows
+        return self._core.rows
 
     @property
     def block_width(self) -> int:
@@ -94,14 +121,14 @@ class Board:
     def width(self) -> int:
         margin = self._block_margin
         width = self._block_width
-        cols = self._cols
+        cols = self._core.cols
         return (margin + width) * cols + margin
 
     @property
     def height(self) -> int:
         margin = self._block_margin
         height = self._block_height
-        rows = self._rows
+        rows = self._core.rows
         return (margin + height) * rows + margin
 
     @property
@@ -129,128 +156,86 @@ class Board:
         return self._offset_y
 
     @property
-    def bbox(self) -> Tuple[int, int, int, int]:
-        left, top, right, bottom = None, None, None, None
-
-        for row in range(self._rows):
-            any_active = False
-
-            for col in range(self._cols):
-                active = is_active_block(self._matrix[row][col])
-
-                if active:
-                    any_active = True
-                    if left is None:
-                        left = col
-                        right = col
-                    else:
-                        right = col
-
-            if any_active:
-                if bottom is None:
-                    bottom = row
-                    top = row
-                else:
-                    top = row
-
-        return left, top, right, bottom
+    def bbox(self) -> BoundingBox:
+        return self._core.bbox
 
     def as_sprite(self, col: int, row: int) -> Sprite:
-        return self._sprites[self._cols * row + col]
+        return self._sprites[self._core.cols * row + col]
 
     def set_texture(self, col: int, row: int, texture_index: int) -> None:
-        self.as_sprite(col, row).set_texture(texture_index)
+        self.as_sprite(col, row).texture = self._block_textures[texture_index]
 
     def set_matrix(self, matrix: Matrix) -> None:
-        self._cols = len(matrix[0])
-        self._rows = len(matrix)
-        self._matrix = matrix
+        # The rows are copied, as `matrix` may be shared, e.g. by the rotation table.
+        self._core.set_matrix([list(line) for line in matrix])
+        self.sync()
+
+    def sync(self) -> None:
+        """
+        Updates the sprites after the core was changed directly, e.g. by the
+        engine that shares it.
+        """
+
+        size = (self._core.cols, self._core.rows)
+        if size == self._sprites_size:
+            self.update_textures()
+            return
+
+        self.release_sprites()
+        self._sprites_size = size
         self._sprites = self.create_sprites()
 
     def join_matrix(self, matrix: Matrix, x=0, y=0) -> None:
-        for row, line in enumerate(matrix):
-            for col, val in enumerate(line):
-                self._matrix[row + y - 1][col + x] = val
+        self._core.join_matrix(matrix, x, y)
 
     def fill(self, value: int) -> None:
-        for row in range(self._rows):
-            for col in range(self._cols):
-                self._matrix[row][col] = value
+        self._core.fill(value)
 
     def is_all_inactive(self) -> bool:
-        for row in range(self._rows):
-            for col in range(self._cols):
-                if is_active_block(self._matrix[row][col]):
-                    return False
-        return True
+        return self._core.is_all_inactive()
 
     def update_offset(self, offset_x: int, offset_y: int) -> None:
         self._offset_x = offset_x
         self._offset_y = offset_y
 
-        for row in range(self._rows):
-            for col in range(self._cols):
+        for row in range(self._core.rows):
+            for col in range(self._core.cols):
                 center = self.measure_block_center(col, row)
                 sprite = self.as_sprite(col, row)
                 sprite.center_x = offset_x + center[0]
                 sprite.center_y = offset_y + center[1]
 
     def update_textures(self):
-        for row in range(self._rows):
-            for col in range(self._cols):
-                self.set_texture(col, row, self._matrix[row][col])
-
-    def fill_matrix(self, shape: Matrix, offset_x: int, offset_y: int, value=N) -> None:
-        for row, line in enumerate(shape):
-            for col, val in enumerate(line):
-                if not is_active_block(val):
-                    continue
-                self._matrix[row + offset_y][col + offset_x] = value
-
-    def check_collision(self, shape: Matrix, offset_x: int, offset_y: int) -> bool:
-        for row, line in enumerate(shape):
-            for col, val in enumerate(line):
-                if not is_active_block(val):
-                    continue
-                board_value = self._matrix[row + offset_y][col + offset_x]
-                if is_active_block(board_value):
-                    return True
-        return False
-
-    def check_intersection(self, shape: Matrix, offset_x: int, offset_y: int) -> bool:
-        for row, line in enumerate(shape):
-            for col, val in enumerate(line):
-                if not is_active_block(val):
-                    continue
-                board_value = self._matrix[row + offset_y][col + offset_x]
-                if not is_active_block(board_value):
-                    return False
-        return True
-
-    def check_insertable(self, shape: Matrix, offset_x: int, offset_y: int) -> bool:
-        for col in range(len(shape[0])):
-            col_top = False
-            for row in range(len(shape) - 1, -1, -1):
-                val = shape[row][col]
-                if not col_top:
-                    if is_active_block(val):
-                        col_top = True
-                    continue
-
-                if is_active_block(val):
-                    continue
-
-                board_value = self._matrix[row + offset_y][col + offset_x]
-                if is_active_block(board_value):
-                    return False
-
-            # All spaces under `shape` in `board` should be empty
-            for y in range(offset_y - 1, -1, -1):
-                board_value = self._matrix[y][col + offset_x]
-                if is_active_block(board_value):
-                    return False
-
-        return True
+        """
+        Only the cells written to the core since the last update are changed.
+        """
+
+        matrix = self._core.matrix
+        for col, row in self._core.pop_dirty_cells():
+            self.set_texture(col, row, matrix[row][col])
+
+    def fill_matrix(
+        self,
+        shape: ShapeLike,
+        offset_x: int,
+        offset_y: int,
+        value=N,
+    ) -> None:
+        self._core.fill_matrix(shape, offset_x, offset_y, value)
+
+    def check_collision(self, shape: ShapeLike, offset_x: int, offset_y: int) -> bool:
+        return self._core.check_collision(shape, offset_x, offset_y)
+
+    def check_intersection(
+        self,
+        shape: ShapeLike,
+        offset_x: int,
+        offset_y: int,
+    ) -> bool:
+        return self._core.check_intersection(shape, offset_x, offset_y)
+
+    def check_insertable(self, shape: ShapeLike, offset_x: int, offset_y: int) -> bool:
+        return self._core.check_insertable(shape, offset_x, offset_y)
 
     def draw(self) -> None:
         self._sprites.draw()
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+
+from copy import deepcopy
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from t3.objects.action import Action
+from t3.objects.bitboard import (
+    BOARD_BACKEND_BITS,
+    BitShape,
+    BoardCore,
+    create_board_core,
+)
+from t3.objects.block import E
+from t3.objects.matrix import Matrix
+from t3.objects.rotation import Rotations, find_rotations
+from t3.stages.stage import Stage
+from t3.stages.stages import default_stage_pack
+from t3.variables.board import BOARD_COLS, BOARD_ROWS
+
+
+class Engine:
+    """
+    Game rules without any rendering, audio or window dependencies.
+    """
+
+    def __init__(
+        self,
+        board_cols=BOARD_COLS,
+        board_rows=BOARD_ROWS,
+        stages: Optional[Sequence[Stage]] = None,
+        backend=BOARD_BACKEND_BITS,
+    ):
+        self._board = create_board_core(board_cols, board_rows, backend=backend)
+
+        self._total_delta = 0.0
+        self._drop_delta = 0.0
+        self._drop_threshold = 1.0
+
+        self._stage_clear = False
+        self._stage_failed = False
+        self._game_over = False
+        self._paused = False
+
+        self._history: List[Matrix] = list()
+
+        self._cursor: Optional[BitShape] = None
+        self._cursor_rotations: Rotations = tuple()
+        self._cursor_rotation = 0
+        self._cursor_x = 0
+        self._cursor_y = 0
+
+        self._drop_shape: Optional[BitShape] = None
+        self._drop_x = 0
+        self._drop_y = 0
+
+        # Hard drop rows of the cursor piece by (rotation, column); they are only
+        # valid for the `version` of the board they were computed on.
+        self._drop_rows: Dict[Tuple[int, int], Optional[int]] = dict()
+        self._drop_rows_version = -1
+
+        self._stages = stages if stages is not None else default_stage_pack()
+        self._stage = 0
+
+        self.reset()
+
+    @property
+    def board(self) -> BoardCore:
+        return self._board
+
+    @property
+    def history(self) -> List[Matrix]:
+        return self._history
+
+    @property
+    def cursor(self) -> Optional[BitShape]:
+        return self._cursor
+
+    @property
+    def cursor_rotations(self) -> Rotations:
+        return self._cursor_rotations
+
+    @property
+    def cursor_rotation(self) -> int:
+        """
+        Position of the cursor in `cursor_rotations`.
+        """
+
+        return self._cursor_rotation
+
+    @property
+    def cursor_x(self) -> int:
+        return self._cursor_x
+
+    @property
+    def cursor_y(self) -> int:
+        return self._cursor_y
+
+    @property
+    def drop_shape(self) -> Optional[BitShape]:
+        return self._drop_shape
+
+    @property
+    def drop_x(self) -> int:
+        return self._drop_x
+
+    @property
+    def drop_y(self) -> int:
+        return self._drop_y
+
+    @property
+    def stages(self) -> Sequence[Stage]:
+        return self._stages
+
+    @property
+    def stage(self) -> int:
+        return self._stage
+
+    @property
+    def stage_clear(self) -> bool:
+        return self._stage_clear
+
+    @property
+    def stage_failed(self) -> bool:
+        return self._stage_failed
+
+    @property
+    def total_delta(self) -> float:
+        return self._total_delta
+
+    def is_empty_more_stage(self) -> bool:
+        return self._stage + 1 >= len(self._stages)
+
+    def reset(self) -> None:
+        self.change_stage(self._stage)
+
+    def change_next_stage(self) -> None:
+        if self._stage + 1 >= len(self._stages):
+            return
+        self._stage += 1
+        self.change_stage(self._stage)
+
+    def change_prev_stage(self) -> None:
+        if self._stage - 1 < 0:
+            return
+        self._stage -= 1
+        self.change_stage(self._stage)
+
+    def select_stage(self, stage_index: int) -> None:
+        self._stage = stage_index
+        self.change_stage(stage_index)
+
+    def change_stage(self, stage_index: int) -> None:
+        self._stage_clear = False
+        self._stage_failed = False
+
+        stage = self._stages[stage_index]
+        board = [list(line) for line in reversed(stage.board)]
+        self._board.set_matrix(board, stage.masks)
+        self._history = deepcopy(stage.history)
+        self.next_block()
+
+    def update(self, delta_time: float) -> None:
+        self._total_delta += delta_time
+
+    def next_block(self) -> None:
+        rotations, position = find_rotations(self._history.pop(0))
+        self._cursor_rotations = rotations
+        self._cursor_rotation = position
+        self._cursor = rotations[position].shape
+        self._drop_rows.clear()
+
+        half_cols = self._board.cols // 2
+        half_cursor_block_cols = self._cursor.width // 2
+        self._cursor_x = half_cols - half_cursor_block_cols
+        self._cursor_y = 0
+
+        self.update_hard_drop_matrix()
+
+    def move(self, delta_x: int) -> bool:
+        """
+        Returns `False` if the cursor is stopped by the side of the board.
+        """
+
+        if self._cursor is None:
+            return False
+
+        board_cols = self._board.cols
+        max_x = board_cols - self._cursor.width
+        next_x = self._cursor_x + delta_x
+
+        stop_flag = False
+
+        if next_x < 0:
+            next_x = 0
+            stop_flag = True
+        if next_x > max_x:
+            next_x = max_x
+            stop_flag = True
+
+        if not self._board.check_collision(self._cursor, next_x, self._cursor_y):
+            self._cursor_x = next_x
+            self.update_hard_drop_matrix()
+
+        return not stop_flag
+
+    def rotate(self) -> bool:
+        if self._cursor is None:
+            return False
+
+        rotated_index = (self._cursor_rotation + 1) % len(self._cursor_rotations)
+        rotated_shape = self._cursor_rotations[rotated_index].shape
+        rotated_block_width = rotated_shape.width
+
+        board_cols = self._board.cols
+        if self._cursor_x + rotated_block_width >= board_cols:
+            next_x = board_cols - rotated_block_width
+        else:
+            next_x = self._cursor_x
+
+        if self._board.check_collision(rotated_shape, next_x, self._cursor_y):
+            return False
+
+        self._cursor = rotated_shape
+        self._cursor_rotation = rotated_index
+        self._cursor_x = next_x
+        self.update_hard_drop_matrix()
+        return True
+
+    def get_hard_drop_position(self) -> Optional[Tuple[int, int]]:
+        if self._cursor is None:
+            return None
+
+        if self._drop_rows_version != self._board.version:
+            self._drop_rows.clear()
+            self._drop_rows_version = self._board.version
+
+        x = self._cursor_x
+        key = (self._cursor_rotation, x)
+        if key in self._drop_rows:
+            y = self._drop_rows[key]
+        else:
+            y = self._board.get_hard_drop_position(self._cursor, x, self._cursor_y)
+            self._drop_rows[key] = y
+        return (x, y) if y is not None else None
+
+    def update_hard_drop_matrix(self) -> None:
+        hard_drop_position = self.get_hard_drop_position()
+        if hard_drop_position is not None:
+            self._drop_shape = self._cursor
+            self._drop_x = hard_drop_position[0]
+            self._drop_y = hard_drop_position[1]
+        else:
+            self._drop_shape = None
+            self._drop_x = 0
+            self._drop_y = 0
+
+    def hard_drop(self) -> bool:
+        if self._drop_shape is None:
+            return False
+
+        self._board.fill_matrix(self._drop_shape, self._drop_x, self._drop_y, E)
+
+        self._drop_shape = None
+        self._drop_x = 0
+        self._drop_y = 0
+
+        if self._history:
+            self.next_block()
+        else:
+            self._cursor = None
+            self._cursor_rotations = tuple()
+            self._cursor_rotation = 0
+            self._cursor_x = 0
+            self._cursor_y = 0
+
+            if self._board.is_all_inactive():
+                self.on_stage_clear()
+            else:
+                self.on_stage_failed()
+
+        return True
+
+    def apply(self, action: Action) -> bool:
+        """
+        Performs a player `action`; returns `False` if it had no effect.
+        """
+
+        if action == Action.move_left:
+            return self.move(-1)
+        elif action == Action.move_right:
+            return self.move(1)
+        elif action == Action.rotate:
+            return self.rotate()
+        elif action == Action.hard_drop:
+            return self.hard_drop()
+        elif action == Action.reset:
+            self.reset()
+        elif action == Action.prev_stage:
+            self.change_prev_stage()
+        elif action == Action.next_stage:
+            self.change_next_stage()
+        return True
+
+    def on_stage_clear(self) -> None:
+        self._stage_clear = True
+        self._stage_failed = False
+
+    def on_stage_failed(self) -> None:
+        self._stage_clear = False
+        self._stage_failed = True
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 
-from copy import deepcopy
 from math import floor
-from typing import Optional, Tuple
-
-from PIL import Image
-
-from arcade import Sound, Texture, draw_text, draw_line, draw_rectangle_outline
+from typing import Any, Final, Optional, Sequence, Tuple
+
+from arcade import (
+    Shape,
+    ShapeElementList,
+    create_line,
+    create_rectangle_outline,
+    draw_text,
+)
 from arcade.gui import (
     UIAnchorWidget,
     UIBoxLayout,
@@ -33,21 +36,34 @@ from t3.assets.path import (
     WALLET_CLOSE_PATH,
     MI_SFX_42_PATH,
 )
-from t3.objects.block import (
-    E,
-    Matrix,
-    create_block_textures,
-    rotate_clockwise,
-    is_active_block,
-)
+from t3.assets.manager import AssetManager
+from t3.objects.action import Action
+from t3.objects.bitboard import BOARD_BACKEND_BITS
+from t3.objects.block import is_active_block
+from t3.objects.block_texture import create_block_textures
 from t3.objects.board import Board
+from t3.objects.engine import Engine
 from t3.objects.history import History
-from t3.stages.stages import create_stages
+from t3.objects.sound_pool import SoundPool
+from t3.objects.sprite_pool import SpritePool
+from t3.profiler.profiler import (
+    SECTION_BOARD_DRAW,
+    SECTION_HISTORY_DRAW,
+    FrameProfiler,
+)
+from t3.replay.replay import Replay
+from t3.stages.stage import Stage
 from t3.theme.flat import FlatTheme
 from t3.theme.theme import Theme
 from t3.variables.block import BLOCK_WIDTH, BLOCK_HEIGHT, BLOCK_MARGIN
 from t3.variables.board import BOARD_COLS, BOARD_ROWS
 
+SOUND_PATHS: Final[Tuple[str, ...]] = (
+    WALLET_CLOSE_PATH,
+    MI_SFX_42_PATH,
+    BUTTON_05_PATH,
+)
+
 
 class Game:
     def __init__(
@@ -58,7 +74,14 @@ class Game:
         block_height=BLOCK_HEIGHT,
         block_margin=BLOCK_MARGIN,
         theme: Optional[Theme] = None,
+        stages: Optional[Sequence[Stage]] = None,
+        board_backend=BOARD_BACKEND_BITS,
+        profiler: Optional[FrameProfiler] = None,
+        assets: Optional[AssetManager] = None,
     ):
+        self._engine = Engine(board_cols, board_rows, stages, board_backend)
+        self._profiler = profiler if profiler else FrameProfiler(enabled=False)
+        self._assets = assets if assets else AssetManager()
         self._theme = theme if theme else FlatTheme()
         self._block_textures = create_block_textures(
             block_width,
@@ -66,6 +89,8 @@ class Game:
             self._theme,
         )
 
+        self._sprite_pool = SpritePool()
+        self._sound_pool = SoundPool(self._assets)
         self._sfx_volume = 0.5
 
         self._board = Board(
@@ -75,27 +100,23 @@ class Game:
             block_height,
             block_margin,
             self._block_textures,
+            core=self._engine.board,
+            pool=self._sprite_pool,
         )
 
-        self._total_delta = 0.0
-        self._drop_delta = 0.0
-        self._drop_threshold = 1.0
-
-        self._stage_clear = False
-        self._stage_failed = False
-        self._game_over = False
-        self._paused = False
-
         self._cursor_board: Optional[Board] = None
-        self._cursor_x = 0
-        self._cursor_y = 0
 
-        self._drop_matrix: Optional[Matrix] = None
-        self._drop_x = 0
-        self._drop_y = 0
+        # Cursor columns after the last two updates, for `interpolate_cursor`,
+        # and the column the cursor sprites are placed at.
+        self._cursor_from = 0.0
+        self._cursor_to = 0.0
+        self._cursor_drawn_x = 0.0
 
-        self._stages = create_stages()
-        self._stage = 0
+        # The border and the hard drop outline, rebuilt when `_overlay_key` changes.
+        self._overlay: Optional[ShapeElementList[Shape]] = None
+        self._overlay_key: Optional[Tuple[Any, ...]] = None
+
+        self._replay: Optional[Replay] = None
 
         self._buttons = self._create_buttons()
         self._buttons.enable()
@@ -107,24 +128,72 @@ class Game:
             self._board.block_margin,
             self._theme.history_cap_width,
             self._block_textures,
+            self._sprite_pool,
         )
 
-        self.reset()
+        self.update_stage()
 
-        self._move_sound = Sound(WALLET_CLOSE_PATH)
-        self._error_sound = Sound(MI_SFX_42_PATH)
-        self._drop_sound = Sound(BUTTON_05_PATH)
+    @property
+    def engine(self) -> Engine:
+        return self._engine
+
+    @property
+    def profiler(self) -> FrameProfiler:
+        return self._profiler
+
+    @property
+    def assets(self) -> AssetManager:
+        return self._assets
+
+    @property
+    def sprite_pool(self) -> SpritePool:
+        return self._sprite_pool
+
+    @property
+    def sound_pool(self) -> SoundPool:
+        return self._sound_pool
+
+    @property
+    def replay(self) -> Optional[Replay]:
+        return self._replay
+
+    def start_recording(self, seed=0) -> Replay:
+        """
+        Records every action passed to `apply` from the current stage.
+        """
+
+        self._replay = Replay(self._engine.stage, seed)
+        return self._replay
+
+    def apply(self, action: Action) -> None:
+        if self._replay is not None:
+            self._replay.append(self._engine.total_delta, action)
+
+        if action == Action.move_left:
+            self.move(-1)
+        elif action == Action.move_right:
+            self.move(1)
+        elif action == Action.rotate:
+            self.rotate()
+        elif action == Action.hard_drop:
+            self.hard_drop()
+        elif action == Action.reset:
+            self.reset()
+        elif action == Action.prev_stage:
+            self.change_prev_stage()
+        elif action == Action.next_stage:
+            self.change_next_stage()
 
     @property
     def stage_clear(self) -> bool:
-        return self._stage_clear
+        return self._engine.stage_clear
 
     @property
     def stage_failed(self) -> bool:
-        return self._stage_failed
+        return self._engine.stage_failed
 
     def is_empty_more_stage(self) -> bool:
-        return self._stage == 10
+        return self._engine.is_empty_more_stage()
 
     def enable_buttons(self) -> None:
         return self._buttons.enable()
@@ -133,9 +202,9 @@ class Game:
         return self._buttons.disable()
 
     def _create_buttons(self) -> UIManager:
-        refresh_normal = Texture("RefreshNormal", Image.open(REFRESH_NORMAL_PATH))
-        refresh_hovered = Texture("RefreshHovered", Image.open(REFRESH_HOVERED_PATH))
-        refresh_pressed = Texture("RefreshPressed", Image.open(REFRESH_PRESSED_PATH))
+        refresh_normal = self._assets.texture(REFRESH_NORMAL_PATH)
+        refresh_hovered = self._assets.texture(REFRESH_HOVERED_PATH)
+        refresh_pressed = self._assets.texture(REFRESH_PRESSED_PATH)
         refresh_button = UITextureButton(
             texture=refresh_normal,
             texture_hovered=refresh_hovered,
@@ -144,20 +213,20 @@ class Game:
 
         @refresh_button.event("on_click")
         def on_click_refresh(event):
-            self.reset()
+            self.apply(Action.reset)
 
-        # right_normal = Texture("RightNormal", Image.open(ARROW_RIGHT_NORMAL_PATH))
-        # right_hovered = Texture("RightHovered", Image.open(ARROW_RIGHT_HOVERED_PATH))
-        # right_pressed = Texture("RightPressed", Image.open(ARROW_RIGHT_PRESSED_PATH))
+        # right_normal = self._assets.texture(ARROW_RIGHT_NORMAL_PATH)
+        # right_hovered = self._assets.texture(ARROW_RIGHT_HOVERED_PATH)
+        # right_pressed = self._assets.texture(ARROW_RIGHT_PRESSED_PATH)
         # right_button = UITextureButton(
         #     texture=right_normal,
         #     texture_hovered=right_hovered,
         #     texture_pressed=right_pressed,
         # )
 
-        # left_normal = Texture("LeftNormal", Image.open(ARROW_LEFT_NORMAL_PATH))
-        # left_hovered = Texture("LeftHovered", Image.open(ARROW_LEFT_HOVERED_PATH))
-        # left_pressed = Texture("LeftPressed", Image.open(ARROW_LEFT_PRESSED_PATH))
+        # left_normal = self._assets.texture(ARROW_LEFT_NORMAL_PATH)
+        # left_hovered = self._assets.texture(ARROW_LEFT_HOVERED_PATH)
+        # left_pressed = self._assets.texture(ARROW_LEFT_PRESSED_PATH)
         # left_button = UITextureButton(
         #     texture=left_normal,
         #     texture_hovered=left_hovered,
@@ -187,28 +256,35 @@ class Game:
         return uis
 
     def reset(self) -> None:
-        self.change_stage(self._stage)
+        self._engine.reset()
+        self.update_stage()
 
     def change_next_stage(self) -> None:
-        if self._stage + 1 >= len(self._stages):
-            return
-        self._stage += 1
-        self.change_stage(self._stage)
+        self._engine.change_next_stage()
+        self.update_stage()
 
     def change_prev_stage(self) -> None:
-        if self._stage - 1 < 0:
-            return
-        self._stage -= 1
-        self.change_stage(self._stage)
+        self._engine.change_prev_stage()
+        self.update_stage()
 
     def change_stage(self, stage_index: int) -> None:
-        self._stage_clear = False
-        self._stage_failed = False
-
-        stage = self._stages[stage_index]
-        self._board.set_matrix(deepcopy(stage.board[::-1]))
-        self._history.set_history(deepcopy(stage.history))
-        self.next_block()
+        self._engine.change_stage(stage_index)
+        self.update_stage()
+
+    def select_stage(self, stage_index: int) -> None:
+        self._engine.select_stage(stage_index)
+        self.update_stage()
+
+    def update_stage(self) -> None:
+        # The engine has loaded the stage, with its masks, into the shared core.
+        self._board.sync()
+        self._history.set_history(self._engine.history)
+        self.release_cursor_board()
+        cursor = self._engine.cursor
+        if cursor is not None:
+            self._cursor_board = self._history.create_board(cursor.matrix)
+        self.update_cursor()
+        self.snap_cursor()
 
     def resize(self, width: float, height: float) -> None:
         half_width = width // 2
@@ -224,41 +300,37 @@ class Game:
             self._board.bottom,
         )
         self.update_cursor()
-        self.update_hard_drop_matrix()
 
     def update(self, delta_time: float) -> None:
-        self._total_delta += delta_time
+        self._engine.update(delta_time)
+        self._sound_pool.dispatch()
+        self._cursor_from = self._cursor_to
+        self._cursor_to = float(self._engine.cursor_x)
 
-    def _draw_border(self) -> None:
+    def _create_border(self, shapes: ShapeElementList[Shape]) -> None:
         left = self._board.left - self._board.block_margin
         right = self._board.right + self._board.block_margin
         top = self._board.top - self._board.block_margin
         bottom = self._board.bottom + self._board.block_margin
 
-        draw_line(
-            start_x=left,
-            start_y=top,
-            end_x=left,
-            end_y=bottom,
-            color=self._theme.foreground,
-            line_width=self._theme.border_width,
-        )
-
-        draw_line(
-            start_x=right,
-            start_y=top,
-            end_x=right,
-            end_y=bottom,
-            color=self._theme.foreground,
-            line_width=self._theme.border_width,
-        )
+        for x in (left, right):
+            shapes.append(
+                create_line(
+                    start_x=x,
+                    start_y=top,
+                    end_x=x,
+                    end_y=bottom,
+                    color=self._theme.foreground,
+                    line_width=self._theme.border_width,
+                )
+            )
 
     def _draw_right_panel(self) -> None:
         x = self._board.right + self._theme.margin_width
         top = self._board.top - self._board.block_margin
 
         draw_text(
-            text=f"STAGE {self._stage}",
+            text=f"STAGE {self._engine.stage}",
             start_x=x + (self._board.block_margin * 2),
             start_y=top,
             color=self._theme.foreground,
@@ -283,175 +355,162 @@ class Game:
         )
 
     def draw(self):
-        self._board.draw()
-        self._draw_border()
+        with self._profiler.measure(SECTION_BOARD_DRAW):
+            self._board.draw()
         self._draw_right_panel()
-        self._history.draw()
+        with self._profiler.measure(SECTION_HISTORY_DRAW):
+            self._history.draw()
 
         if self._cursor_board:
             self._cursor_board.draw()
 
-        if self._drop_matrix is not None:
-            self._draw_drop_matrix()
-
+        self._draw_overlay()
         self._buttons.draw()
 
-    def _draw_drop_matrix(self) -> None:
-        assert self._drop_matrix is not None
+    def _draw_overlay(self) -> None:
+        """
+        Draws the border and the hard drop outline as one shape list, whose
+        vertices are only built again when the board moves or the drop changes.
+        """
+
+        key = (
+            self._board.left,
+            self._board.bottom,
+            self._engine.drop_shape,
+            self._engine.drop_x,
+            self._engine.drop_y,
+        )
+        if self._overlay is None or key != self._overlay_key:
+            shapes: ShapeElementList[Shape] = ShapeElementList()
+            self._create_border(shapes)
+            if self._engine.drop_shape is not None:
+                self._create_drop_outline(shapes)
+            self._overlay = shapes
+            self._overlay_key = key
+
+        self._overlay.draw()
+
+    def _create_drop_outline(self, shapes: ShapeElementList[Shape]) -> None:
+        drop_shape = self._engine.drop_shape
+        assert drop_shape is not None
+        drop_matrix = drop_shape.matrix
 
         left = self._board.left
         bottom = self._board.bottom
 
-        for row in range(len(self._drop_matrix)):
-            for col in range(len(self._drop_matrix[0])):
-                value = self._drop_matrix[row][col]
+        for row in range(drop_shape.height):
+            for col in range(drop_shape.width):
+                value = drop_matrix[row][col]
                 if not is_active_block(value):
                     continue
 
-                x = self._drop_x + col
-                y = self._drop_y + row
+                x = self._engine.drop_x + col
+                y = self._engine.drop_y + row
                 center = self._board.measure_block_center(x, y)
                 width = self._board.block_width
                 height = self._board.block_height
 
-                draw_rectangle_outline(
-                    left + center[0],
-                    bottom + center[1],
-                    width,
-                    height,
-                    self._theme.accent,
+                shapes.append(
+                    create_rectangle_outline(
+                        left + center[0],
+                        bottom + center[1],
+                        width,
+                        height,
+                        self._theme.accent,
+                    )
                 )
 
-    def next_block(self) -> None:
-        self._cursor_board = self._history.pop()
+    def release_cursor_board(self) -> None:
+        if self._cursor_board is None:
+            return
+        self._cursor_board.release_sprites()
+        self._cursor_board = None
 
-        half_cols = self._board.cols // 2
-        half_cursor_block_cols = self._cursor_board.cols // 2
-        self._cursor_x = half_cols - half_cursor_block_cols
-        self._cursor_y = 0
+    def update_cursor(self) -> None:
+        self._place_cursor(self._engine.cursor_x)
 
-        self.update_cursor()
-        self.update_hard_drop_matrix()
+    def _place_cursor(self, cursor_x: float) -> None:
+        self._cursor_drawn_x = cursor_x
+        if self._cursor_board is None:
+            return
 
-    def update_cursor(self) -> None:
         left = self._board.left
         bottom = self._board.bottom
         block_width = self._board.block_width
         block_margin = self._board.block_margin
-        offset_x = left + (block_width + block_margin) * self._cursor_x
+        # Interpolated columns are snapped to whole pixels.
+        offset_x = round(left + (block_width + block_margin) * cursor_x)
         offset_y = bottom
 
         self._cursor_board.update_offset(offset_x, offset_y)
 
-    def move(self, delta_x: int) -> None:
-        if self._cursor_board is None:
-            return
+    def snap_cursor(self) -> None:
+        """
+        Stops the interpolation at the current column, e.g. for a new piece.
+        """
 
-        board_cols = self._board.cols
-        cursor_block_cols = self._cursor_board.cols
-        max_x = board_cols - cursor_block_cols
-        next_x = self._cursor_x + delta_x
+        self._cursor_from = self._cursor_to = float(self._engine.cursor_x)
 
-        stop_flag = False
+    def interpolate_cursor(self, alpha: float) -> bool:
+        """
+        Places the cursor between its columns after the last two updates,
+        `alpha` of the way to the latest one. Returns whether it was moved.
+        """
 
-        if next_x < 0:
-            next_x = 0
-            stop_flag = True
-        if next_x > max_x:
-            next_x = max_x
-            stop_flag = True
+        x = self._cursor_from + (self._cursor_to - self._cursor_from) * alpha
+        if x == self._cursor_drawn_x:
+            return False
+        self._place_cursor(x)
+        return True
 
-        cursor_matrix = self._cursor_board.matrix
-        if not self._board.check_collision(cursor_matrix, next_x, self._cursor_y):
-            self._cursor_x = next_x
-            self.update_cursor()
-            self.update_hard_drop_matrix()
+    def move(self, delta_x: int) -> None:
+        if self._engine.cursor is None:
+            return
 
-        if stop_flag:
-            self.play_error_sound()
-        else:
-            self.play_move_sound()
+        moved = self._engine.move(delta_x)
+        self.update_cursor()
 
-    def update_hard_drop_matrix(self) -> None:
-        hard_drop_position = self.get_hard_drop_position()
-        if hard_drop_position is not None:
-            self._drop_matrix = deepcopy(self._cursor_board.matrix)
-            self._drop_x = hard_drop_position[0]
-            self._drop_y = hard_drop_position[1]
+        if moved:
+            self.play_move_sound()
         else:
-            self._drop_matrix = None
-            self._drop_x = 0
-            self._drop_y = 0
+            self.play_error_sound()
 
     def rotate(self):
-        rotated_block = rotate_clockwise(self._cursor_board.matrix)
-        rotated_block_width = len(rotated_block[0])
-
-        board_cols = self._board.cols
-        if self._cursor_x + rotated_block_width >= board_cols:
-            next_x = board_cols - rotated_block_width
-        else:
-            next_x = self._cursor_x
-        if not self._board.check_collision(rotated_block, next_x, self._cursor_y):
-            self._cursor_board.set_matrix(rotated_block)
-            self._cursor_x = next_x
+        if self._engine.rotate():
+            self._cursor_board.set_matrix(self._engine.cursor.matrix)
             self.update_cursor()
-            self.update_hard_drop_matrix()
             self.play_move_sound()
         else:
             self.play_error_sound()
 
     def get_hard_drop_position(self) -> Optional[Tuple[int, int]]:
-        cursor_matrix = self._cursor_board.matrix
-        x = self._cursor_x
-        max_y = self._board.rows - self._cursor_board.rows
-        for y in range(self._cursor_y, max_y + 1, 1):
-            if self._board.check_intersection(cursor_matrix, x, y):
-                if self._board.check_insertable(cursor_matrix, x, y):
-                    return x, y
-                else:
-                    return None
-        return None
+        return self._engine.get_hard_drop_position()
 
     def play_move_sound(self) -> None:
-        self._move_sound.play(self._sfx_volume)
+        self._sound_pool.play(WALLET_CLOSE_PATH, self._sfx_volume)
 
     def play_error_sound(self) -> None:
-        self._error_sound.play(self._sfx_volume)
+        self._sound_pool.play(MI_SFX_42_PATH, self._sfx_volume)
 
     def play_drop_sound(self) -> None:
-        self._drop_sound.play(self._sfx_volume)
+        self._sound_pool.play(BUTTON_05_PATH, self._sfx_volume)
 
     def hard_drop(self) -> None:
-        if self._drop_matrix is None:
+        if not self._engine.hard_drop():
             return
 
         self.play_drop_sound()
-
-        self._board.fill_matrix(self._drop_matrix, self._drop_x, self._drop_y, E)
         self._board.update_textures()
 
-        self._drop_matrix = None
-        self._drop_x = 0
-        self._drop_y = 0
-
-        if self._history.size >= 1:
-            self.next_block()
+        self.release_cursor_board()
+        if self._engine.cursor is not None:
+            self._cursor_board = self._history.pop()
+            self.update_cursor()
+            self.snap_cursor()
             self._history.update_textures()
-        else:
-            self._cursor_board = None
-            self._cursor_x = 0
-            self._cursor_y = 0
-
-            if self._board.is_all_inactive():
-                self.on_stage_clear()
-            else:
-                self.on_stage_failed()
 
     def on_stage_clear(self) -> None:
-        self._stage_clear = True
-        self._stage_failed = False
+        self._engine.on_stage_clear()
 
     def on_stage_failed(self) -> None:
-        self._stage_clear = False
-        self._stage_failed = True
+        self._engine.on_stage_failed()
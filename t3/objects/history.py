@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 
-from typing import Dict, Final, List, Tuple
+from typing import Dict, Final, List, Optional
 
 from arcade import Texture
 
 from t3.objects.matrix import Matrix
 from t3.objects.board import Board
+from t3.objects.sprite_pool import SpritePool
 
 
 class History:
@@ -21,6 +22,7 @@ class History:
         block_margin: int,
         board_margin: int,
         block_textures: Dict[int, Texture],
+        pool: Optional[SpritePool] = None,
     ):
         self._drawing_size = drawing_size
         self._block_width = block_width
@@ -30,26 +32,30 @@ class History:
         self._offset_x = 0
         self._offset_y = 0
         self._block_textures = block_textures
+        self._pool = pool if pool is not None else SpritePool()
         self._boards: List[Board] = list()
 
     @property
     def size(self) -> int:
         return len(self._boards)
 
-    def _create_board(self, matrix: Matrix) -> Board:
+    def create_board(self, matrix: Matrix) -> Board:
         result = Board(
-            History.PREVIEW_COLS,
-            History.PREVIEW_ROWS,
+            len(matrix[0]),
+            len(matrix),
             self._block_width,
             self._block_height,
             self._block_margin,
             self._block_textures,
+            pool=self._pool,
         )
         result.set_matrix(matrix)
         return result
 
     def set_history(self, history: List[Matrix]) -> None:
-        self._boards = [self._create_board(h) for h in history]
+        for board in self._boards:
+            board.release_sprites()
+        self._boards = [self.create_board(h) for h in history]
 
     def pop(self) -> Board:
         result = self._boards.pop(0)
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+
+from typing import List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError as e:
+    raise ImportError("The 'numpy' board backend requires NumPy") from e
+
+from t3.objects.bitboard import (
+    BitShape,
+    BoundingBox,
+    ShapeLike,
+    as_bit_shape,
+)
+from t3.objects.block import E, N, is_active_block
+from t3.objects.matrix import Matrix
+
+_ShapeArrays = Tuple[np.ndarray, np.ndarray]
+
+# Masks of the shapes from the rotation table, which live as long as the game.
+_shape_arrays: "WeakKeyDictionary[BitShape, _ShapeArrays]" = WeakKeyDictionary()
+
+
+def active_array(values: np.ndarray) -> np.ndarray:
+    return (values != N) & (values != E)
+
+
+def shape_arrays(shape: ShapeLike) -> _ShapeArrays:
+    """
+    The active cells of the `shape` and its `unders`, as boolean arrays.
+    """
+
+    bits = as_bit_shape(shape)
+    cached = _shape_arrays.get(bits)
+    if cached is not None:
+        return cached
+
+    cols = np.arange(bits.width)
+    masks = np.array(bits.masks, dtype=np.int64)[:, None] >> cols & 1
+    unders = np.array(bits.unders, dtype=np.int64)[:, None] >> cols & 1
+    result = masks.astype(bool), unders.astype(bool)
+    _shape_arrays[bits] = result
+    return result
+
+
+def pack_rows(cells: np.ndarray) -> List[int]:
+    """
+    Packs each row of a boolean array into an integer; bit `n` is column `n`.
+    """
+
+    packed = np.packbits(cells, axis=1, bitorder="little")
+    return [int.from_bytes(line.tobytes(), "little") for line in packed]
+
+
+class NumpyBoard:
+    """
+    Board core on a `uint8` array of cell values, with the same interface as
+    `BitBoard`. The rule checks are slices and reductions of a boolean array
+    of the active cells.
+
+    `matrix` is the array itself; it is indexed like the nested lists of
+    `BitBoard`, so existing callers keep working.
+    """
+
+    def __init__(self, cols: int, rows: int, block_init: Optional[int] = None):
+        assert rows > 0
+        assert cols > 0
+
+        init = block_init if block_init is not None else N
+        self._array = np.full((rows, cols), init, dtype=np.uint8)
+        self._active = active_array(self._array)
+
+        # Cells written since the last `pop_dirty_cells`.
+        self._dirty = np.zeros((rows, cols), dtype=bool)
+
+        # Incremented whenever a cell changes, like `BitBoard.version`.
+        self._version = 0
+
+    @property
+    def array(self) -> np.ndarray:
+        return self._array
+
+    @property
+    def active(self) -> np.ndarray:
+        return self._active
+
+    @property
+    def matrix(self) -> np.ndarray:
+        return self._array
+
+    @property
+    def masks(self) -> List[int]:
+        return pack_rows(self._active)
+
+    @property
+    def cols(self) -> int:
+        return self._array.shape[1]
+
+    @property
+    def rows(self) -> int:
+        return self._array.shape[0]
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def dirty(self) -> List[int]:
+        return pack_rows(self._dirty)
+
+    def is_dirty(self) -> bool:
+        return bool(self._dirty.any())
+
+    def clear_dirty(self) -> None:
+        self._dirty[:] = False
+
+    def pop_dirty_cells(self) -> List[Tuple[int, int]]:
+        rows, cols = np.nonzero(self._dirty)
+        self.clear_dirty()
+        return list(zip(cols.tolist(), rows.tolist()))
+
+    def set_cell(self, col: int, row: int, value: int) -> None:
+        self._array[row, col] = value
+        self._active[row, col] = is_active_block(value)
+        self._dirty[row, col] = True
+        self._version += 1
+
+    def set_matrix(self, matrix: Matrix, masks: Optional[List[int]] = None) -> None:
+        # The masks of `BitBoard` are not needed here.
+        self._array = np.array(matrix, dtype=np.uint8)
+        self._active = active_array(self._array)
+        self._dirty = np.ones(self._array.shape, dtype=bool)
+        self._version += 1
+
+    def join_matrix(self, matrix: Matrix, x=0, y=0) -> None:
+        for row, line in enumerate(matrix):
+            for col, val in enumerate(line):
+                self.set_cell(col + x, row + y - 1, val)
+
+    def fill(self, value: int) -> None:
+        self._array[:] = value
+        self._active[:] = is_active_block(value)
+        self._dirty[:] = True
+        self._version += 1
+
+    def fill_matrix(
+        self,
+        shape: ShapeLike,
+        offset_x: int,
+        offset_y: int,
+        value=N,
+    ) -> None:
+        mask, _ = shape_arrays(shape)
+        height, width = mask.shape
+        area = np.s_[offset_y : offset_y + height, offset_x : offset_x + width]
+        self._array[area][mask] = value
+        self._active[area][mask] = is_active_block(value)
+        self._dirty[area] |= mask
+        self._version += 1
+
+    def is_all_inactive(self) -> bool:
+        return not self._active.any()
+
+    @property
+    def bbox(self) -> BoundingBox:
+        rows = np.flatnonzero(self._active.any(axis=1))
+        if not len(rows):
+            return None, None, None, None
+
+        cols = np.flatnonzero(self._active.any(axis=0))
+        return int(cols[0]), int(rows[-1]), int(cols[-1]), int(rows[0])
+
+    def _window(self, mask: np.ndarray, offset_x: int, offset_y: int) -> np.ndarray:
+        height, width = mask.shape
+        return self._active[offset_y : offset_y + height, offset_x : offset_x + width]
+
+    def check_collision(self, shape: ShapeLike, offset_x: int, offset_y: int) -> bool:
+        mask, _ = shape_arrays(shape)
+        return bool((self._window(mask, offset_x, offset_y) & mask).any())
+
+    def check_intersection(
+        self,
+        shape: ShapeLike,
+        offset_x: int,
+        offset_y: int,
+    ) -> bool:
+        mask, _ = shape_arrays(shape)
+        return not (mask & ~self._window(mask, offset_x, offset_y)).any()
+
+    def check_insertable(self, shape: ShapeLike, offset_x: int, offset_y: int) -> bool:
+        mask, unders = shape_arrays(shape)
+        if (self._window(unders, offset_x, offset_y) & unders).any():
+            return False
+
+        # All spaces under `shape` in `board` should be empty
+        width = mask.shape[1]
+        return not self._active[:offset_y, offset_x : offset_x + width].any()
+
+    def get_hard_drop_position(
+        self,
+        shape: ShapeLike,
+        offset_x: int,
+        offset_y: int = 0,
+    ) -> Optional[int]:
+        mask, _ = shape_arrays(shape)
+        height, width = mask.shape
+        if offset_y + height > self.rows:
+            return None
+
+        # Every vertical position of the shape from `offset_y`, at once.
+        columns = self._active[offset_y:, offset_x : offset_x + width]
+        windows = sliding_window_view(columns, (height, width))[:, 0]
+        contained = ~(mask & ~windows).any(axis=(1, 2))
+
+        found = np.flatnonzero(contained)
+        if not len(found):
+            return None
+
+        y = offset_y + int(found[0])
+        return y if self.check_insertable(shape, offset_x, y) else None
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+from types import MappingProxyType
+from typing import Final, Mapping, NamedTuple, Tuple
+
+from t3.objects.bitboard import BitShape, row_mask
+from t3.objects.block import (
+    BLOCK_I,
+    BLOCK_IC,
+    BLOCK_J,
+    BLOCK_JC,
+    BLOCK_L,
+    BLOCK_LC,
+    BLOCK_O,
+    BLOCK_OC,
+    BLOCK_S,
+    BLOCK_SC,
+    BLOCK_T,
+    BLOCK_TC,
+    BLOCK_Z,
+    BLOCK_ZC,
+    is_active_block,
+    rotate_clockwise,
+)
+from t3.objects.matrix import Matrix
+
+FrozenMatrix = Tuple[Tuple[int, ...], ...]
+
+
+class Rotation(NamedTuple):
+    """
+    One distinct orientation of a shape.
+    `rotation_index` is the number of clockwise rotations from the original shape.
+    """
+
+    rotation_index: int
+    matrix: FrozenMatrix
+    width: int
+    height: int
+    masks: Tuple[int, ...]
+    bottoms: Tuple[int, ...]
+    shape: BitShape
+
+
+Rotations = Tuple[Rotation, ...]
+
+
+def freeze_matrix(shape: Matrix) -> FrozenMatrix:
+    return tuple(tuple(line) for line in shape)
+
+
+def create_rotation(index: int, shape: Matrix) -> Rotation:
+    width = len(shape[0])
+    height = len(shape)
+
+    # The lowest active row of each column, or -1 if the column is empty.
+    bottoms = list()
+    for col in range(width):
+        rows = [row for row in range(height) if is_active_block(shape[row][col])]
+        bottoms.append(rows[0] if rows else -1)
+
+    return Rotation(
+        rotation_index=index,
+        matrix=freeze_matrix(shape),
+        width=width,
+        height=height,
+        masks=tuple(row_mask(line) for line in shape),
+        bottoms=tuple(bottoms),
+        shape=BitShape([list(line) for line in shape]),
+    )
+
+
+def create_rotations(shape: Matrix) -> Rotations:
+    """
+    Distinct orientations in `rotate_clockwise` order.
+    Rotating the last one clockwise gives the first one again.
+    """
+
+    result = list()
+    seen = set()
+    current = shape
+    for index in range(4):
+        frozen = freeze_matrix(current)
+        if frozen in seen:
+            break
+        seen.add(frozen)
+        result.append(create_rotation(index, current))
+        current = rotate_clockwise(current)
+    return tuple(result)
+
+
+BLOCKS: Final[Tuple[Matrix, ...]] = (
+    BLOCK_I,
+    BLOCK_O,
+    BLOCK_T,
+    BLOCK_L,
+    BLOCK_J,
+    BLOCK_S,
+    BLOCK_Z,
+    BLOCK_IC,
+    BLOCK_OC,
+    BLOCK_TC,
+    BLOCK_LC,
+    BLOCK_JC,
+    BLOCK_SC,
+    BLOCK_ZC,
+)
+
+
+def _create_table() -> Mapping[FrozenMatrix, Tuple[Rotations, int]]:
+    table = dict()
+    for block in BLOCKS:
+        rotations = create_rotations(block)
+        for position, rotation in enumerate(rotations):
+            table[rotation.matrix] = (rotations, position)
+    return MappingProxyType(table)
+
+
+# Every orientation of every `BLOCK_*` shape, mapped to the rotations of its
+# block and its position in them.
+ROTATION_TABLE: Final[Mapping[FrozenMatrix, Tuple[Rotations, int]]] = _create_table()
+
+
+def find_rotations(shape: Matrix) -> Tuple[Rotations, int]:
+    """
+    Returns the rotations of `shape` and the position of `shape` in them.
+    Shapes which are not in `ROTATION_TABLE` are computed on demand.
+    """
+
+    found = ROTATION_TABLE.get(freeze_matrix(shape))
+    if found is not None:
+        return found
+    return create_rotations(shape), 0
+
+
+def get_rotations(shape: Matrix) -> Rotations:
+    """
+    Rotations starting from `shape`, so that the position in the result is
+    the number of clockwise rotations from `shape`.
+    """
+
+    rotations, position = find_rotations(shape)
+    return rotations[position:] + rotations[:position]
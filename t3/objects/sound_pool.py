@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, Final, List
+
+from pyglet.media import Player
+
+from t3.assets.manager import AssetManager
+
+DEFAULT_VOICES: Final[int] = 2
+DEFAULT_VOLUME: Final[float] = 0.5
+
+
+class SoundPool:
+    """
+    Plays sound effects on at most `voices` players per effect. When every
+    player of an effect is busy, the one that started the longest ago is
+    rewound and reused.
+
+    `play` only records the request, so it is cheap to call from key handlers;
+    `dispatch` starts the requested effects and is called once per update.
+    Requests for the same effect in between are played once.
+
+    The effects are decoded once by the `AssetManager` into static sources,
+    which keep the PCM data in memory and are shared by the players.
+    """
+
+    def __init__(self, assets: AssetManager, voices=DEFAULT_VOICES):
+        assert voices > 0
+
+        self._assets = assets
+        self._voices = voices
+
+        # The players of each effect, from the one that started the longest ago.
+        self._players: Dict[str, List[Player]] = dict()
+        self._pending: Dict[str, float] = dict()
+
+        self._plays = 0
+        self._steals = 0
+        self._coalesced = 0
+
+    @property
+    def voices(self) -> int:
+        return self._voices
+
+    @property
+    def plays(self) -> int:
+        return self._plays
+
+    @property
+    def steals(self) -> int:
+        return self._steals
+
+    @property
+    def coalesced(self) -> int:
+        return self._coalesced
+
+    @property
+    def player_allocations(self) -> int:
+        return sum(len(players) for players in self._players.values())
+
+    @property
+    def pending_size(self) -> int:
+        return len(self._pending)
+
+    def play(self, path: str, volume=DEFAULT_VOLUME) -> None:
+        previous = self._pending.get(path)
+        if previous is not None:
+            self._coalesced += 1
+            volume = max(previous, volume)
+        self._pending[path] = volume
+
+    def _acquire(self, path: str) -> Player:
+        players = self._players.setdefault(path, list())
+        player = next((p for p in players if not p.playing), None)
+        if player is not None:
+            players.remove(player)
+        elif len(players) < self._voices:
+            player = Player()
+        else:
+            player = players.pop(0)
+            self._steals += 1
+
+        players.append(player)
+        return player
+
+    def dispatch(self) -> None:
+        if not self._pending:
+            return
+
+        pending = self._pending
+        self._pending = dict()
+
+        for path, volume in pending.items():
+            source = self._assets.sound(path).source
+            player = self._acquire(path)
+            player.volume = volume
+            if player.source is None:
+                player.queue(source)
+            else:
+                player.seek(0.0)
+            player.play()
+            self._plays += 1
+
+    def stop(self) -> None:
+        self._pending.clear()
+        for players in self._players.values():
+            for player in players:
+                player.pause()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, List, Tuple
+
+from arcade import Sprite, SpriteList
+
+
+class SpritePool:
+    """
+    Keeps released block `SpriteList`s keyed by board dimensions,
+    so that boards of the same size reuse the sprites and their GPU buffers.
+    """
+
+    def __init__(self):
+        self._free: Dict[Tuple[int, int], List[SpriteList]] = dict()
+        self._sprite_allocations = 0
+        self._list_allocations = 0
+        self._reuses = 0
+
+    @property
+    def sprite_allocations(self) -> int:
+        return self._sprite_allocations
+
+    @property
+    def list_allocations(self) -> int:
+        return self._list_allocations
+
+    @property
+    def reuses(self) -> int:
+        return self._reuses
+
+    @property
+    def free_size(self) -> int:
+        return sum(len(lists) for lists in self._free.values())
+
+    def reset_counters(self) -> None:
+        self._sprite_allocations = 0
+        self._list_allocations = 0
+        self._reuses = 0
+
+    def create_sprite(self) -> Sprite:
+        sprite = Sprite()
+        self._sprite_allocations += 1
+        return sprite
+
+    def acquire(self, cols: int, rows: int) -> SpriteList:
+        free = self._free.get((cols, rows))
+        if free:
+            self._reuses += 1
+            return free.pop()
+
+        result = SpriteList()
+        for _ in range(cols * rows):
+            result.append(self.create_sprite())
+        self._list_allocations += 1
+        return result
+
+    def release(self, cols: int, rows: int, sprites: SpriteList) -> None:
+        self._free.setdefault((cols, rows), list()).append(sprites)
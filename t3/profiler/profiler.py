@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+import json
+from array import array
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Dict, Final, Iterator, List, NamedTuple
+
+DEFAULT_CAPACITY: Final[int] = 600
+
+SECTION_UPDATE: Final[str] = "update"
+SECTION_GAME_UPDATE: Final[str] = "game.update"
+SECTION_DRAW: Final[str] = "draw"
+SECTION_GAME_DRAW: Final[str] = "game.draw"
+SECTION_BOARD_DRAW: Final[str] = "board.draw"
+SECTION_HISTORY_DRAW: Final[str] = "history.draw"
+SECTION_UI_DRAW: Final[str] = "ui.draw"
+SECTION_INPUT: Final[str] = "input"
+
+# Prefix of the sections of the time from a key press to the end of the frame
+# that shows its result, one per action: `latency.move_left`, ...
+SECTION_LATENCY: Final[str] = "latency"
+
+
+class RingBuffer:
+    """
+    The last `capacity` samples, overwriting the oldest one when full.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        assert capacity > 0
+
+        self._samples = array("d", bytes(8 * capacity))
+        self._capacity = capacity
+        self._cursor = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, value: float) -> None:
+        self._samples[self._cursor] = value
+        self._cursor = (self._cursor + 1) % self._capacity
+        if self._size < self._capacity:
+            self._size += 1
+
+    def values(self) -> List[float]:
+        """
+        Samples from the oldest to the newest.
+        """
+
+        if self._size < self._capacity:
+            return self._samples[: self._size].tolist()
+        return (self._samples[self._cursor :] + self._samples[: self._cursor]).tolist()
+
+
+class SectionStats(NamedTuple):
+    sample_count: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+def percentile(ordered: List[float], ratio: float) -> float:
+    """
+    Nearest-rank percentile of sorted samples.
+    """
+
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(ratio * len(ordered)) - 1))
+    return ordered[index]
+
+
+def section_stats(samples: List[float]) -> SectionStats:
+    ordered = sorted(samples)
+    return SectionStats(
+        sample_count=len(ordered),
+        p50=percentile(ordered, 0.50),
+        p95=percentile(ordered, 0.95),
+        p99=percentile(ordered, 0.99),
+        max=ordered[-1] if ordered else 0.0,
+    )
+
+
+class FrameProfiler:
+    """
+    Keeps the durations of named sections of the last frames in ring buffers.
+    A disabled profiler measures nothing, so the hooks can stay in place.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, enabled=True):
+        self._capacity = capacity
+        self._enabled = enabled
+        self._sections: Dict[str, RingBuffer] = dict()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def sections(self) -> Dict[str, RingBuffer]:
+        return self._sections
+
+    def record(self, name: str, seconds: float) -> None:
+        if not self._enabled:
+            return
+        buffer = self._sections.get(name)
+        if buffer is None:
+            buffer = RingBuffer(self._capacity)
+            self._sections[name] = buffer
+        buffer.append(seconds)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        if not self._enabled:
+            yield
+            return
+
+        begin = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, perf_counter() - begin)
+
+    def stats(self) -> Dict[str, SectionStats]:
+        return {name: section_stats(b.values()) for name, b in self._sections.items()}
+
+    def summary(self) -> List[str]:
+        """
+        One line per section with the percentiles in milliseconds.
+        """
+
+        lines = list()
+        for name, stats in self.stats().items():
+            lines.append(
+                f"{name:<13} p50 {stats.p50 * 1e3:6.2f}"
+                f" p95 {stats.p95 * 1e3:6.2f} p99 {stats.p99 * 1e3:6.2f}"
+            )
+        return lines
+
+    def as_dict(self) -> Dict[str, Any]:
+        sections = dict()
+        for name, buffer in self._sections.items():
+            samples = buffer.values()
+            sections[name] = {
+                "stats": section_stats(samples)._asdict(),
+                "samples": samples,
+            }
+        return {"capacity": self._capacity, "sections": sections}
+
+    def dump(self, path: str) -> None:
+        """
+        Saves the samples (in seconds, oldest first) and the percentiles as JSON.
+        """
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, indent=2)
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+from struct import Struct
+from time import perf_counter
+from typing import Callable, Final, List, NamedTuple, Optional, Sequence
+
+from t3.objects.action import Action
+from t3.objects.engine import Engine
+from t3.stages.stage import Stage
+from t3.stages.stages import default_stage_pack, open_stage_pack
+
+REPLAY_MAGIC: Final[bytes] = b"T3RP"
+REPLAY_VERSION: Final[int] = 1
+
+# magic, version, stage, seed, number of events
+REPLAY_HEADER: Final[Struct] = Struct("<4sBHII")
+# milliseconds since the start of the replay, action
+REPLAY_EVENT: Final[Struct] = Struct("<IB")
+
+
+class ReplayError(ValueError):
+    pass
+
+
+class ReplayEvent(NamedTuple):
+    time: int
+    action: Action
+
+    @property
+    def seconds(self) -> float:
+        return self.time / 1000.0
+
+
+class Replay:
+    """
+    The starting stage, the seed and the timestamped actions of a session.
+    """
+
+    def __init__(
+        self,
+        stage: int = 0,
+        seed: int = 0,
+        events: Optional[List[ReplayEvent]] = None,
+    ):
+        self._stage = stage
+        self._seed = seed
+        self._events = events if events is not None else list()
+
+    @property
+    def stage(self) -> int:
+        return self._stage
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def events(self) -> List[ReplayEvent]:
+        return self._events
+
+    @property
+    def duration(self) -> float:
+        return self._events[-1].seconds if self._events else 0.0
+
+    def append(self, seconds: float, action: Action) -> None:
+        self._events.append(ReplayEvent(int(round(seconds * 1000)), action))
+
+    def to_bytes(self) -> bytes:
+        header = REPLAY_HEADER.pack(
+            REPLAY_MAGIC,
+            REPLAY_VERSION,
+            self._stage,
+            self._seed,
+            len(self._events),
+        )
+        events = b"".join(REPLAY_EVENT.pack(e.time, e.action) for e in self._events)
+        return header + events
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        if len(data) < REPLAY_HEADER.size:
+            raise ReplayError("Replay data is too short")
+
+        magic, version, stage, seed, count = REPLAY_HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ReplayError("Not a replay file")
+        if version != REPLAY_VERSION:
+            raise ReplayError(f"Unsupported replay version: {version}")
+
+        expected = REPLAY_HEADER.size + REPLAY_EVENT.size * count
+        if len(data) != expected:
+            raise ReplayError(f"Replay size mismatch: {len(data)} != {expected}")
+
+        events = list()
+        for time, action in REPLAY_EVENT.iter_unpack(data[REPLAY_HEADER.size :]):
+            events.append(ReplayEvent(time, Action(action)))
+        return cls(stage, seed, events)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayPlayer:
+    """
+    Hands out the events of a `Replay` as the game time reaches them.
+    """
+
+    def __init__(self, replay: Replay):
+        self._replay = replay
+        self._cursor = 0
+
+    @property
+    def replay(self) -> Replay:
+        return self._replay
+
+    @property
+    def done(self) -> bool:
+        return self._cursor >= len(self._replay.events)
+
+    def pop_due(self, seconds: float) -> List[Action]:
+        events = self._replay.events
+        time = int(round(seconds * 1000))
+        result = list()
+        while self._cursor < len(events) and events[self._cursor].time <= time:
+            result.append(events[self._cursor].action)
+            self._cursor += 1
+        return result
+
+
+def play_headless(
+    replay: Replay,
+    stages: Optional[Sequence[Stage]] = None,
+    engine: Optional[Engine] = None,
+) -> Engine:
+    """
+    Applies every event to an `Engine` as fast as possible.
+    """
+
+    if engine is None:
+        engine = Engine(stages=stages)
+    engine.select_stage(replay.stage)
+
+    for event in replay.events:
+        delta = event.seconds - engine.total_delta
+        if delta > 0:
+            engine.update(delta)
+        engine.apply(event.action)
+    return engine
+
+
+def run_headless_replays(
+    replay_files: List[str],
+    stage_pack: Optional[str] = None,
+    printer: Callable[..., None] = print,
+) -> int:
+    stages = open_stage_pack(stage_pack) if stage_pack else default_stage_pack()
+    begin = perf_counter()
+    for path in replay_files:
+        replay = Replay.load(path)
+        engine = play_headless(replay, stages)
+        printer(
+            f"{path}: events={len(replay.events)} stage={engine.stage}"
+            f" clear={engine.stage_clear} failed={engine.stage_failed}"
+        )
+    elapsed = perf_counter() - begin
+    printer(f"{len(replay_files)} replays in {elapsed:.3f}s")
+    return 0
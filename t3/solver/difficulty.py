@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+import csv
+import json
+import math
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Final, Iterator, List, NamedTuple, Optional
+
+from t3.objects.matrix import Matrix
+from t3.solver.solver import Solver
+from t3.solver.validate import NamedStage, named_stages
+
+FORMAT_CSV: Final[str] = "csv"
+FORMAT_JSONL: Final[str] = "jsonl"
+FORMATS: Final[List[str]] = [FORMAT_CSV, FORMAT_JSONL]
+
+CSV_FIELDS: Final[List[str]] = [
+    "stage_index",
+    "name",
+    "pieces",
+    "solutions",
+    "nodes",
+    "elapsed",
+    "score",
+    "branching",
+    "dead_ends",
+    "branches",
+]
+
+
+class StageDifficulty(NamedTuple):
+    stage_index: int
+    name: str
+    pieces: int
+    solutions: int
+    nodes: int
+    elapsed: float
+
+    # Mean legal placements of the nodes the search expanded at each step of
+    # `history`, and how many placements of that step, over the whole search,
+    # can not lead to a cleared board.
+    branching: List[float]
+    dead_ends: List[int]
+    # Placements tried at each step over the whole search.
+    branches: List[int]
+
+    @property
+    def solved(self) -> bool:
+        return self.solutions > 0
+
+    @property
+    def score(self) -> float:
+        """
+        Bits of guessing; each step adds the logarithm of the placements the
+        search tried per placement that still led to a solution.
+        Unsolvable stages score infinity.
+        """
+
+        if not self.solved:
+            return math.inf
+
+        result = 0.0
+        for branches, dead_ends in zip(self.branches, self.dead_ends):
+            if branches:
+                result += math.log2(branches / (branches - dead_ends))
+        return result
+
+    def as_dict(self) -> Dict[str, Any]:
+        result = self._asdict()
+        result["score"] = self.score if self.solved else None
+        return result
+
+    def as_row(self) -> Dict[str, Any]:
+        result = self.as_dict()
+        result["branching"] = " ".join(f"{v:.2f}" for v in self.branching)
+        result["dead_ends"] = " ".join(str(v) for v in self.dead_ends)
+        result["branches"] = " ".join(str(v) for v in self.branches)
+        return result
+
+
+def score_stage(
+    board: Matrix,
+    history: List[Matrix],
+    stage_index=0,
+    name="",
+) -> StageDifficulty:
+    """
+    Solves the stage and collects the placements the solver tried at each
+    step of `history`, and which of them were dead ends.
+    """
+
+    solver = Solver(board, history)
+    result = solver.solve()
+
+    branching = list()
+    for expanded, branches in zip(solver.expanded, solver.branches):
+        branching.append(branches / expanded if expanded else 0.0)
+
+    return StageDifficulty(
+        stage_index=stage_index,
+        name=name,
+        pieces=len(history),
+        solutions=result.solutions,
+        nodes=result.nodes,
+        elapsed=result.elapsed,
+        branching=branching,
+        dead_ends=list(solver.dead_ends),
+        branches=list(solver.branches),
+    )
+
+
+def score_stages(
+    stages: List[NamedStage],
+    max_workers: Optional[int] = None,
+) -> Iterator[StageDifficulty]:
+    """
+    Scores every stage in a process pool and yields the profiles
+    in the order in which they are completed.
+    """
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(score_stage, stage.board[::-1], stage.history, i, name)
+            for i, (name, stage) in enumerate(stages)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_score_stages(
+    stage_files: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    output_format=FORMAT_CSV,
+    output: Optional[str] = None,
+    printer: Callable[..., None] = print,
+) -> int:
+    """
+    Scores the given stage files or packs, or the default stages,
+    and streams one record per stage to the `output` file or standard output.
+    """
+
+    if output_format not in FORMATS:
+        printer(f"Unknown output format: {output_format}")
+        return 1
+
+    stages = named_stages(stage_files, defaults=not stage_files)
+    f = open(output, "w", encoding="utf-8", newline="") if output else sys.stdout
+    try:
+        writer = None
+        if output_format == FORMAT_CSV:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+
+        for item in score_stages(stages, max_workers):
+            if writer is not None:
+                writer.writerow(item.as_row())
+            else:
+                f.write(json.dumps(item.as_dict()) + "\n")
+            f.flush()
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+    if output:
+        printer(f"{len(stages)} stages are scored: {output}")
+    return 0
@@ -0,0 +1,405 @@
+# -*- coding: utf-8 -*-
+
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from t3.objects.bitboard import BitShape
+from t3.objects.matrix import Matrix
+from t3.objects.rotation import Rotation, get_rotations
+from t3.stages.stage import Stage
+
+
+class Placement(NamedTuple):
+    rotation: int
+    x: int
+    y: int
+
+
+class SolverResult(NamedTuple):
+    path: Optional[List[Placement]]
+    solutions: int
+    nodes: int
+    elapsed: float
+
+    @property
+    def solved(self) -> bool:
+        return self.path is not None
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def popcount(value: int) -> int:
+    return bin(value).count("1")
+
+
+def bit_indices(value: int) -> List[int]:
+    result = list()
+    while value:
+        low = value & -value
+        result.append(low.bit_length() - 1)
+        value ^= low
+    return result
+
+
+class _Rotation:
+    """
+    A rotated piece packed into the same row stride as the board.
+    """
+
+    def __init__(self, rotation: int, item: Rotation, stride: int):
+        self.rotation = rotation
+        self.width = item.width
+        self.height = item.height
+
+        self.bits = 0
+        for row, mask in enumerate(item.masks):
+            self.bits |= mask << (row * stride)
+        self.cells = bit_indices(self.bits)
+
+        # The lowest cell of each column, and the holes above it.
+        self.bottoms = list()
+        self.gaps = list()
+        for col, bottom in enumerate(item.bottoms):
+            if bottom < 0:
+                continue
+            self.bottoms.append(bottom * stride + col)
+            rows = [r for r, m in enumerate(item.masks) if m >> col & 1]
+            for row in range(bottom + 1, rows[-1]):
+                if row not in rows:
+                    self.gaps.append(row * stride + col)
+
+        # Every anchor position in which the piece lies inside the board.
+        self.anchors = 0
+
+
+class Solver:
+    """
+    Exhaustive search over every (rotation, column) placement of each `history`
+    piece, using the same rules as `BitBoard.get_hard_drop_position`.
+
+    The whole board is packed into a single integer (`cols` bits per row),
+    which also serves as the key of the transposition table.
+    """
+
+    def __init__(self, board: Matrix, history: List[Matrix]):
+        self._cols = len(board[0])
+        self._rows = len(board)
+        self._stride = self._cols
+
+        bits = 0
+        for row, line in enumerate(board):
+            bits |= BitShape([line]).masks[0] << (row * self._stride)
+        self._board = bits
+
+        # Distinct rotations of each piece, in `rotate_clockwise` order.
+        self._pieces: List[List[_Rotation]] = list()
+        for piece in history:
+            rotations = list()
+            for rotation, item in enumerate(get_rotations(piece)):
+                packed = _Rotation(rotation, item, self._stride)
+                packed.anchors = self.span_mask(0, self._cols - packed.width + 1)
+                packed.anchors &= self.rows_mask(self._rows - packed.height + 1)
+                rotations.append(packed)
+            self._pieces.append(rotations)
+
+        max_height = max((r.height for p in self._pieces for r in p), default=0)
+        self._cursor_rows = self.rows_mask(max_height)
+        self._cells = sum(popcount(p[0].bits) for p in self._pieces)
+
+        # A piece only clears connected active cells, so when all pieces are the
+        # same size, every connected region must be a multiple of that size.
+        sizes = {popcount(p[0].bits) for p in self._pieces}
+        self._unit = sizes.pop() if len(sizes) == 1 else 1
+        self._no_first_col = self.span_mask(1, self._cols - 1)
+        self._no_last_col = self.span_mask(0, self._cols - 1)
+
+        # Shapes of the remaining pieces, which an isolated region must match.
+        self._shapes: List[Set[int]] = [set() for _ in range(len(self._pieces) + 1)]
+        for depth in range(len(self._pieces) - 1, -1, -1):
+            self._shapes[depth].update(self._shapes[depth + 1])
+            self._shapes[depth].update(r.bits for r in self._pieces[depth])
+
+        # Since every drop clears a fixed number of cells, the board alone
+        # identifies the depth and can be used as the key of the table.
+        self._table: Dict[int, int] = dict()
+        self._nodes = 0
+
+        # Per depth over the whole search: nodes whose placements were tried,
+        # the placements tried, and those of them without any solution.
+        self._expanded = [0] * len(self._pieces)
+        self._branches = [0] * len(self._pieces)
+        self._dead_ends = [0] * len(self._pieces)
+
+    @classmethod
+    def from_stage(cls, stage: Stage):
+        return cls(stage.board[::-1], stage.history)
+
+    @property
+    def cols(self) -> int:
+        return self._cols
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def board(self) -> int:
+        return self._board
+
+    @property
+    def depth(self) -> int:
+        return len(self._pieces)
+
+    @property
+    def table(self) -> Dict[int, int]:
+        return self._table
+
+    @property
+    def expanded(self) -> List[int]:
+        return self._expanded
+
+    @property
+    def branches(self) -> List[int]:
+        return self._branches
+
+    @property
+    def dead_ends(self) -> List[int]:
+        return self._dead_ends
+
+    def span_mask(self, x: int, w: int) -> int:
+        """
+        Selects `w` columns from the `x` column in every row.
+        """
+
+        span = ((1 << w) - 1) << x
+        result = 0
+        for row in range(self._rows):
+            result |= span << (row * self._stride)
+        return result
+
+    def rows_mask(self, h: int) -> int:
+        """
+        Selects the lowest `h` rows.
+        """
+
+        return (1 << (max(h, 0) * self._stride)) - 1
+
+    def lowest_cells(self, board: int) -> int:
+        """
+        Active cells without any active cell under them in the same column.
+        """
+
+        stride = self._stride
+        limit = self._rows * stride
+        smear = board
+        shift = stride
+        while shift < limit:
+            smear |= smear << shift
+            shift <<= 1
+        return board & ~(smear << stride)
+
+    def _grow(self, region: int, board: int) -> int:
+        return board & (
+            region
+            | ((region & self._no_last_col) << 1)
+            | ((region & self._no_first_col) >> 1)
+            | (region << self._stride)
+            | (region >> self._stride)
+        )
+
+    def is_dead(self, board: int, depth: int) -> bool:
+        """
+        Returns `True` if some connected region can not be cleared by whole pieces.
+        """
+
+        if self._unit <= 1:
+            return False
+
+        unit = self._unit
+        shapes = self._shapes[depth]
+        remain = board
+        while remain:
+            region = remain & -remain
+            while True:
+                grow = self._grow(region, remain)
+                if grow == region:
+                    break
+                region = grow
+
+            size = popcount(region)
+            if size % unit:
+                return True
+            if size == unit and self.normalize(region) not in shapes:
+                return True
+            remain &= ~region
+        return False
+
+    def normalize(self, region: int) -> int:
+        """
+        Moves the `region` to the bottom-left corner of the board.
+        """
+
+        stride = self._stride
+        row = ((region & -region).bit_length() - 1) // stride
+        region >>= row * stride
+
+        cols = 0
+        rest = region
+        row_mask = (1 << stride) - 1
+        while rest:
+            cols |= rest & row_mask
+            rest >>= stride
+        return region >> ((cols & -cols).bit_length() - 1)
+
+    def _reachable(self, board: int, depth: int) -> Optional[Set[Tuple[int, int]]]:
+        """
+        Returns the reachable (rotation, column) pairs of the cursor,
+        or `None` if nothing can block the cursor.
+        """
+
+        if not board & self._cursor_rows:
+            return None
+
+        rotations = self._pieces[depth]
+        cols = self._cols
+        start_x = cols // 2 - rotations[0].width // 2
+        visited = {(0, start_x)}
+        queue = [(0, start_x)]
+        while queue:
+            rotation, x = queue.pop()
+            item = rotations[rotation]
+            candidates = list()
+            if x > 0:
+                candidates.append((rotation, x - 1))
+            if x < cols - item.width:
+                candidates.append((rotation, x + 1))
+            rotated = (rotation + 1) % len(rotations)
+            width = rotations[rotated].width
+            candidates.append((rotated, cols - width if x + width >= cols else x))
+
+            for candidate in candidates:
+                if candidate in visited:
+                    continue
+                if board & (rotations[candidate[0]].bits << candidate[1]):
+                    continue
+                visited.add(candidate)
+                queue.append(candidate)
+        return visited
+
+    def placements(self, board: int, depth: int) -> List[Tuple[Placement, int]]:
+        """
+        Returns every legal placement of the `depth` piece and the resulting board.
+
+        All cells of a dropped piece must be active, and the lowest cell of
+        each of its columns must be the lowest active cell of that column;
+        that is exactly the position found by the hard drop of `Engine`.
+        """
+
+        stride = self._stride
+        lowest = self.lowest_cells(board)
+        reachable = self._reachable(board, depth)
+
+        result = list()
+        for item in self._pieces[depth]:
+            fits = item.anchors
+            for cell in item.cells:
+                fits &= board >> cell
+            for cell in item.bottoms:
+                fits &= lowest >> cell
+            for cell in item.gaps:
+                fits &= ~board >> cell
+
+            for anchor in bit_indices(fits):
+                y, x = divmod(anchor, stride)
+                if reachable is not None and (item.rotation, x) not in reachable:
+                    continue
+                placement = Placement(item.rotation, x, y)
+                result.append((placement, board & ~(item.bits << anchor)))
+        return result
+
+    def _search(self, board: int, depth: int) -> int:
+        if depth == len(self._pieces):
+            return 1 if not board else 0
+
+        cached = self._table.get(board)
+        if cached is not None:
+            return cached
+
+        self._nodes += 1
+        count = 0
+        if not self.is_dead(board, depth):
+            placements = self.placements(board, depth)
+            self._expanded[depth] += 1
+            self._branches[depth] += len(placements)
+            for _, next_board in placements:
+                subtree = self._search(next_board, depth + 1)
+                if not subtree:
+                    self._dead_ends[depth] += 1
+                count += subtree
+
+        self._table[board] = count
+        return count
+
+    def _find_path(self, board: int, start: int) -> Optional[List[Placement]]:
+        path = list()
+        for depth in range(start, len(self._pieces)):
+            for placement, next_board in self.placements(board, depth):
+                if depth + 1 == len(self._pieces):
+                    if not next_board:
+                        break
+                elif self._table.get(next_board, 0) > 0:
+                    break
+            else:
+                return None
+            path.append(placement)
+            board = next_board
+        return path
+
+    def first_moves(self) -> List[Tuple[Placement, int]]:
+        """
+        Placements of the first piece; each one is an independent subtree.
+        """
+
+        if not self._pieces:
+            return list()
+        return self.placements(self._board, 0)
+
+    def solve(self, first: Optional[int] = None) -> SolverResult:
+        """
+        Searches the whole tree, or only the subtree of the `first` move
+        (an index into `first_moves`).
+        """
+
+        self._table.clear()
+        self._nodes = 0
+        for stats in (self._expanded, self._branches, self._dead_ends):
+            stats[:] = [0] * len(self._pieces)
+
+        begin = perf_counter()
+        board = self._board
+        depth = 0
+        prefix = list()
+        if first is not None:
+            placement, board = self.first_moves()[first]
+            depth = 1
+            prefix.append(placement)
+
+        if popcount(self._board) != self._cells:
+            solutions = 0
+        elif depth == len(self._pieces):
+            solutions = 1 if not board else 0
+        else:
+            solutions = self._search(board, depth)
+
+        path = self._find_path(board, depth) if solutions > 0 else None
+        elapsed = perf_counter() - begin
+
+        if path is not None:
+            path = prefix + path
+        return SolverResult(path, solutions, self._nodes, elapsed)
+
+
+def solve_stage(stage: Stage) -> SolverResult:
+    return Solver.from_stage(stage).solve()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from t3.objects.matrix import Matrix
+from t3.solver.solver import Solver, SolverResult
+from t3.stages.loader import load_stages
+from t3.stages.stage import Stage
+from t3.stages.pack import STAGE_FILE_EXTENSION
+from t3.stages.stages import default_stage_pack, open_stage_pack
+
+NamedStage = Tuple[str, Stage]
+
+
+class StageReport(NamedTuple):
+    name: str
+    result: SolverResult
+
+    @property
+    def solved(self) -> bool:
+        return self.result.solved
+
+
+def _solve_task(
+    board: Matrix,
+    history: List[Matrix],
+    first: Optional[int],
+) -> SolverResult:
+    return Solver(board, history).solve(first)
+
+
+def merge_results(results: List[SolverResult]) -> SolverResult:
+    """
+    Combines the results of the first-move subtrees of a single stage.
+    The `elapsed` time is the sum of the worker times.
+    """
+
+    path = next((r.path for r in results if r.path is not None), None)
+    solutions = sum(r.solutions for r in results)
+    nodes = sum(r.nodes for r in results)
+    elapsed = sum(r.elapsed for r in results)
+    return SolverResult(path, solutions, nodes, elapsed)
+
+
+def named_stages(
+    stage_files: Optional[List[str]] = None,
+    defaults=True,
+) -> List[NamedStage]:
+    result: List[NamedStage] = list()
+    if defaults:
+        pack = default_stage_pack()
+        result.extend((pack.name(i), pack[i]) for i in range(len(pack)))
+    for path in stage_files or list():
+        if path.endswith(STAGE_FILE_EXTENSION):
+            for index, stage in enumerate(load_stages(path)):
+                result.append((f"{path}:{index}", stage))
+            continue
+
+        other = open_stage_pack(path)
+        for index in range(len(other)):
+            name = other.name(index) or str(index)
+            result.append((f"{path}:{name}", other[index]))
+    return result
+
+
+def validate_stages(
+    stages: List[NamedStage],
+    max_workers: Optional[int] = None,
+    split: bool = False,
+) -> List[StageReport]:
+    """
+    Solves every stage in a process pool. If `split` is set,
+    each first move of a stage is submitted as a separate task.
+    """
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures: Dict[int, List[Future]] = dict()
+        for index, (_, stage) in enumerate(stages):
+            board = stage.board[::-1]
+            history = stage.history
+
+            firsts: List[Optional[int]] = [None]
+            if split:
+                count = len(Solver(board, history).first_moves())
+                if count > 1:
+                    firsts = list(range(count))
+
+            futures[index] = [
+                executor.submit(_solve_task, board, history, first)
+                for first in firsts
+            ]
+
+        reports = list()
+        for index, (name, _) in enumerate(stages):
+            results = [future.result() for future in futures[index]]
+            reports.append(StageReport(name, merge_results(results)))
+        return reports
+
+
+def run_validate_stages(
+    stage_files: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    split: bool = False,
+    printer: Callable[..., None] = print,
+) -> int:
+    reports = validate_stages(named_stages(stage_files), max_workers, split)
+
+    failed = 0
+    for report in reports:
+        result = report.result
+        status = "OK" if report.solved else "FAIL"
+        printer(
+            f"[{status}] {report.name}: solutions={result.solutions}"
+            f" nodes={result.nodes} nodes/s={result.nodes_per_second:.0f}"
+        )
+        if not report.solved:
+            failed += 1
+
+    printer(f"{len(reports) - failed}/{len(reports)} stages are clearable")
+    return 1 if failed else 0
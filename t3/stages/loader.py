@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+import json
+from typing import Any, Dict, Final, List, Union
+
+from t3.objects.block import (
+    BLOCK_I,
+    BLOCK_J,
+    BLOCK_L,
+    BLOCK_O,
+    BLOCK_S,
+    BLOCK_T,
+    BLOCK_Z,
+    D,
+    E,
+    I,
+    J,
+    L,
+    N,
+    O,
+    S,
+    T,
+    Z,
+)
+from t3.objects.matrix import Matrix
+from t3.stages.stage import Stage
+
+CELL_CODES: Final[Dict[str, int]] = {
+    "N": N,
+    "E": E,
+    "D": D,
+    "I": I,
+    "O": O,
+    "T": T,
+    "L": L,
+    "J": J,
+    "S": S,
+    "Z": Z,
+}
+
+BLOCK_CODES: Final[Dict[str, Matrix]] = {
+    "I": BLOCK_I,
+    "O": BLOCK_O,
+    "T": BLOCK_T,
+    "L": BLOCK_L,
+    "J": BLOCK_J,
+    "S": BLOCK_S,
+    "Z": BLOCK_Z,
+}
+
+
+def parse_board(rows: List[Union[str, List[int]]]) -> Matrix:
+    """
+    Each row is either a string of `CELL_CODES` or a list of block indices.
+    Rows are written from top to bottom, like the `Stage` classes.
+    """
+
+    result = list()
+    for row in rows:
+        if isinstance(row, str):
+            result.append([CELL_CODES[code] for code in row.upper()])
+        else:
+            result.append([int(value) for value in row])
+    return result
+
+
+def parse_history(pieces: List[str]) -> List[Matrix]:
+    return [BLOCK_CODES[piece.upper()] for piece in pieces]
+
+
+def parse_stage(data: Dict[str, Any]) -> Stage:
+    stage = Stage()
+    stage.board = parse_board(data["board"])
+    stage.history = parse_history(data["history"])
+    if "solver" in data:
+        stage.solver = parse_board(data["solver"])
+    return stage
+
+
+def format_board(board: Matrix) -> List[str]:
+    codes = {value: code for code, value in CELL_CODES.items()}
+    return ["".join(codes[value] for value in line) for line in board]
+
+
+def format_history(history: List[Matrix]) -> List[str]:
+    result = list()
+    for piece in history:
+        codes = [code for code, block in BLOCK_CODES.items() if block == piece]
+        if not codes:
+            raise ValueError(f"Unknown piece: {piece}")
+        result.append(codes[0])
+    return result
+
+
+def dump_stage(stage: Stage, name="") -> Dict[str, Any]:
+    """
+    The inverse of `parse_stage`.
+    """
+
+    result: Dict[str, Any] = dict()
+    if name:
+        result["name"] = name
+    if stage.solver is not None:
+        result["solver"] = format_board(stage.solver)
+    result["board"] = format_board(stage.board)
+    result["history"] = format_history(stage.history)
+    return result
+
+
+def load_stages(path: str) -> List[Stage]:
+    """
+    Loads a JSON file which contains either a single stage object
+    or a `{"stages": [...]}` list of them.
+    """
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    if isinstance(data, dict) and "stages" in data:
+        items = data["stages"]
+    elif isinstance(data, list):
+        items = data
+    else:
+        items = [data]
+
+    return [parse_stage(item) for item in items]
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+import mmap
+from itertools import count as iter_count
+from struct import Struct
+from typing import Dict, Final, List, Optional, Sequence
+from weakref import WeakValueDictionary
+
+from t3.objects.bitboard import row_mask
+from t3.objects.matrix import Matrix
+from t3.stages.loader import BLOCK_CODES, CELL_CODES
+from t3.stages.pack import DEFAULT_CACHE_SIZE, CachedStagePack
+from t3.stages.stage import Stage
+
+STAGE_PACK_MAGIC: Final[bytes] = b"T3SP"
+STAGE_PACK_VERSION: Final[int] = 1
+STAGE_PACK_EXTENSION: Final[str] = ".t3p"
+
+# magic, version, number of stages
+PACK_HEADER: Final[Struct] = Struct("<4sBI")
+# offset and size of each stage record
+PACK_INDEX: Final[Struct] = Struct("<QI")
+# cols, rows, number of pieces, name size
+RECORD_HEADER: Final[Struct] = Struct("<HHHB")
+MAX_NAME_SIZE: Final[int] = 0xFF
+
+# A record is followed by its name, one byte per piece of the history,
+# one byte per cell of the board (top row first) and the occupancy mask of
+# each row (bottom row first), as `BitBoard` stores it.
+
+PIECE_CODES: Final[Dict[int, Matrix]] = {
+    CELL_CODES[code]: block for code, block in BLOCK_CODES.items()
+}
+
+
+class StagePackError(ValueError):
+    pass
+
+
+def mask_size(cols: int) -> int:
+    return (cols + 7) // 8
+
+
+def encode_stage(stage: Stage, name="") -> bytes:
+    board = stage.board
+    cols = len(board[0])
+    rows = len(board)
+    encoded_name = name.encode("utf-8")
+    if len(encoded_name) > MAX_NAME_SIZE:
+        raise StagePackError(f"Stage name is longer than {MAX_NAME_SIZE} bytes: {name}")
+
+    pieces = list()
+    for piece in stage.history:
+        codes = [v for line in piece for v in line if v in PIECE_CODES]
+        if not codes or PIECE_CODES[codes[0]] != piece:
+            raise StagePackError(f"Unknown piece: {piece}")
+        pieces.append(codes[0])
+
+    chunks = [
+        RECORD_HEADER.pack(cols, rows, len(pieces), len(encoded_name)),
+        encoded_name,
+        bytes(pieces),
+        b"".join(bytes(line) for line in board),
+    ]
+    size = mask_size(cols)
+    for line in reversed(board):
+        chunks.append(row_mask(line).to_bytes(size, "little"))
+    return b"".join(chunks)
+
+
+def write_stage_pack(
+    path: str,
+    stages: Sequence[Stage],
+    names: Optional[List[str]] = None,
+) -> None:
+    records = [
+        encode_stage(stage, names[i] if names else "")
+        for i, stage in enumerate(stages)
+    ]
+
+    offset = PACK_HEADER.size + PACK_INDEX.size * len(records)
+    index = list()
+    for record in records:
+        index.append(PACK_INDEX.pack(offset, len(record)))
+        offset += len(record)
+
+    with open(path, "wb") as f:
+        f.write(PACK_HEADER.pack(STAGE_PACK_MAGIC, STAGE_PACK_VERSION, len(records)))
+        f.write(b"".join(index))
+        f.write(b"".join(records))
+
+
+class MappedStagePack(CachedStagePack):
+    """
+    A single binary stage pack read through `mmap`.
+    Any stage is located through the offset index without reading the others,
+    and is decoded straight from the map into the lists of the `Stage`.
+    """
+
+    def __init__(self, path: str, cache_size=DEFAULT_CACHE_SIZE):
+        super().__init__(cache_size)
+        self._path = path
+
+        # Views handed out by `record`, which `close` releases if still alive.
+        self._records: "WeakValueDictionary[int, memoryview]" = WeakValueDictionary()
+        self._record_ids = iter_count()
+
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        if len(self._view) < PACK_HEADER.size:
+            self.close()
+            raise StagePackError("Stage pack is too short")
+
+        magic, version, count = PACK_HEADER.unpack_from(self._view)
+        if magic != STAGE_PACK_MAGIC:
+            self.close()
+            raise StagePackError("Not a stage pack")
+        if version != STAGE_PACK_VERSION:
+            self.close()
+            raise StagePackError(f"Unsupported stage pack version: {version}")
+        self._count = count
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, index: int) -> memoryview:
+        """
+        A view of the record in the map, without a copy.
+        It is released by `close`, after which it can no longer be read.
+        """
+
+        if not 0 <= index < self._count:
+            raise IndexError(f"Stage index out of range: {index}")
+
+        offset, size = PACK_INDEX.unpack_from(
+            self._view,
+            PACK_HEADER.size + PACK_INDEX.size * index,
+        )
+        result = self._view[offset : offset + size]
+        self._records[next(self._record_ids)] = result
+        return result
+
+    def name(self, index: int) -> str:
+        with self.record(index) as record:
+            name_size = RECORD_HEADER.unpack_from(record)[3]
+            begin = RECORD_HEADER.size
+            return str(record[begin : begin + name_size], "utf-8")
+
+    def parse(self, index: int) -> Stage:
+        with self.record(index) as record:
+            return self._decode(record)
+
+    @staticmethod
+    def _decode(record: memoryview) -> Stage:
+        cols, rows, pieces, name_size = RECORD_HEADER.unpack_from(record)
+
+        begin = RECORD_HEADER.size + name_size
+        history = [PIECE_CODES[code] for code in record[begin : begin + pieces]]
+
+        begin += pieces
+        board = [
+            list(record[begin + row * cols : begin + (row + 1) * cols])
+            for row in range(rows)
+        ]
+
+        begin += rows * cols
+        size = mask_size(cols)
+        masks = list()
+        for row in range(rows):
+            offset = begin + row * size
+            masks.append(int.from_bytes(record[offset : offset + size], "little"))
+
+        stage = Stage()
+        stage.board = board
+        stage.history = history
+        stage.masks = masks
+        return stage
+
+    def close(self) -> None:
+        for view in list(self._records.values()):
+            view.release()
+        self._records.clear()
+        self._view.release()
+        self._mmap.close()
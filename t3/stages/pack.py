@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Final, Iterator, List, Optional, Sequence, Union, overload
+from zipfile import ZipFile
+
+from t3.stages.loader import parse_stage
+from t3.stages.stage import Stage
+
+STAGE_FILE_EXTENSION: Final[str] = ".json"
+DEFAULT_CACHE_SIZE: Final[int] = 16
+
+
+class CachedStagePack(Sequence[Stage], ABC):
+    """
+    Base of the stage packs; parsed stages are kept in an LRU cache
+    of `cache_size` entries.
+    """
+
+    def __init__(self, cache_size=DEFAULT_CACHE_SIZE):
+        assert cache_size > 0
+
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[int, Stage]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def cache_size(self) -> int:
+        return self._cache_size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    @overload
+    def __getitem__(self, index: int) -> Stage:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Stage]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Stage, List[Stage]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(f"Stage index out of range: {index}")
+
+        stage = self._cache.get(index)
+        if stage is not None:
+            self._hits += 1
+            self._cache.move_to_end(index)
+            return stage
+
+        self._misses += 1
+        stage = self.parse(index)
+        self._cache[index] = stage
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return stage
+
+    def __iter__(self) -> Iterator[Stage]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @abstractmethod
+    def name(self, index: int) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def parse(self, index: int) -> Stage:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class StagePack(CachedStagePack):
+    """
+    Indexes the stage files of a directory or a zip archive by file name and
+    only parses a stage when it is requested.
+    """
+
+    def __init__(self, path: str, cache_size=DEFAULT_CACHE_SIZE):
+        super().__init__(cache_size)
+        self._path = path
+
+        if os.path.isdir(path):
+            self._archive: Optional[ZipFile] = None
+            names = os.listdir(path)
+        else:
+            self._archive = ZipFile(path)
+            names = self._archive.namelist()
+        self._files: List[str] = sorted(
+            name for name in names if name.endswith(STAGE_FILE_EXTENSION)
+        )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def name(self, index: int) -> str:
+        basename = os.path.basename(self._files[index])
+        return os.path.splitext(basename)[0]
+
+    def read(self, index: int) -> bytes:
+        filename = self._files[index]
+        if self._archive is not None:
+            return self._archive.read(filename)
+        with open(os.path.join(self._path, filename), "rb") as f:
+            return f.read()
+
+    def parse(self, index: int) -> Stage:
+        return parse_stage(json.loads(self.read(index)))
+
+    def close(self) -> None:
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 
-from typing import List
+from typing import List, Optional
 from t3.objects.matrix import Matrix
 
 
 class Stage:
     board: Matrix
     history: List[Matrix]
+
+    # The finished layout the stage was authored from, if it is known.
+    solver: Optional[Matrix] = None
+
+    # Precomputed occupancy masks of the board rows, bottom row first.
+    masks: Optional[List[int]] = None
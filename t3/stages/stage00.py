@@ -1,32 +0,0 @@
-# -*- coding: utf-8 -*-
-
-from t3.stages.stage import Stage
-from t3.objects.block import E, I, O, T, Z, BLOCK_I, BLOCK_O, BLOCK_T, BLOCK_Z
-
-
-class Stage00(Stage):
-
-    board = [
-        [O, O, E, I, E, T, E, E, E, Z],
-        [O, O, E, I, E, T, T, E, Z, Z],
-        [E, E, E, I, E, T, E, E, Z, E],
-        [E, E, E, I, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-        [E, E, E, E, E, E, E, E, E, E],
-    ]
-
-    history = [BLOCK_Z, BLOCK_O, BLOCK_I, BLOCK_T]
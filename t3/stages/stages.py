@@ -1,32 +1,29 @@
 # -*- coding: utf-8 -*-
 
+import os
 from typing import List
 
+from t3.assets.path import STAGES_DIR
+from t3.stages.mapped_pack import STAGE_PACK_MAGIC, MappedStagePack
+from t3.stages.pack import CachedStagePack, StagePack
 from t3.stages.stage import Stage
-from t3.stages.stage00 import Stage00
-from t3.stages.stage01 import Stage01
-from t3.stages.stage02 import Stage02
-from t3.stages.stage03 import Stage03
-from t3.stages.stage04 import Stage04
-from t3.stages.stage05 import Stage05
-from t3.stages.stage06 import Stage06
-from t3.stages.stage07 import Stage07
-from t3.stages.stage08 import Stage08
-from t3.stages.stage09 import Stage09
-from t3.stages.stage10 import Stage10
+
+
+def default_stage_pack() -> StagePack:
+    return StagePack(STAGES_DIR)
 
 
 def create_stages() -> List[Stage]:
-    return [
-        Stage00(),
-        Stage01(),
-        Stage02(),
-        Stage03(),
-        Stage04(),
-        Stage05(),
-        Stage06(),
-        Stage07(),
-        Stage08(),
-        Stage09(),
-        Stage10(),
-    ]
+    return list(default_stage_pack())
+
+
+def open_stage_pack(path: str) -> CachedStagePack:
+    """
+    Opens a binary stage pack, or a directory or zip archive of stage files.
+    """
+
+    if not os.path.isdir(path):
+        with open(path, "rb") as f:
+            if f.read(len(STAGE_PACK_MAGIC)) == STAGE_PACK_MAGIC:
+                return MappedStagePack(path)
+    return StagePack(path)
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+from typing import Final, FrozenSet, Iterator, List, NamedTuple, Optional
+
+from t3.objects.action import Action
+
+DEFAULT_STEP: Final[float] = 1.0 / 60.0
+DEFAULT_MAX_STEPS: Final[int] = 5
+
+# Delayed auto shift: how long a move key is held before it starts repeating.
+DEFAULT_DAS: Final[float] = 0.17
+# Auto repeat rate: the interval between the repeated moves.
+DEFAULT_ARR: Final[float] = 0.05
+
+REPEAT_ACTIONS: Final[FrozenSet[Action]] = frozenset(
+    (Action.move_left, Action.move_right)
+)
+
+
+class InputEvent(NamedTuple):
+    # Seconds on the clock passed to `press` and `advance`.
+    time: float
+    action: Action
+    repeat: bool = False
+
+
+class FixedTimestep:
+    """
+    Runs the simulation in steps of `step` seconds, whatever the frame rate.
+
+    Key presses are queued with their timestamps and handed out with the step
+    that contains them, so the same input produces the same game at any frame
+    rate. A held move key repeats after `das` seconds, every `arr` seconds.
+
+    At most `max_steps` steps are run per `advance`; the time beyond that is
+    dropped instead of slowing every later frame down.
+    """
+
+    def __init__(
+        self,
+        step=DEFAULT_STEP,
+        max_steps=DEFAULT_MAX_STEPS,
+        das=DEFAULT_DAS,
+        arr=DEFAULT_ARR,
+    ):
+        assert step > 0
+        assert max_steps > 0
+        assert arr > 0
+
+        self._step = step
+        self._max_steps = max_steps
+        self._das = das
+        self._arr = arr
+
+        # Steps are counted from the time of the first `advance`, so that their
+        # boundaries do not drift with the sum of the step durations.
+        self._origin: Optional[float] = None
+        self._index = 0
+        self._accumulator = 0.0
+        self._queue: List[InputEvent] = list()
+
+        self._held: Optional[Action] = None
+        self._held_next = 0.0
+
+        self._steps = 0
+        self._dropped_steps = 0
+
+    @property
+    def step(self) -> float:
+        return self._step
+
+    @property
+    def das(self) -> float:
+        return self._das
+
+    @property
+    def arr(self) -> float:
+        return self._arr
+
+    @property
+    def held(self) -> Optional[Action]:
+        return self._held
+
+    @property
+    def steps(self) -> int:
+        return self._steps
+
+    @property
+    def dropped_steps(self) -> int:
+        return self._dropped_steps
+
+    @property
+    def alpha(self) -> float:
+        """
+        Progress from the last step to the next one, in `[0, 1)`.
+        """
+
+        return self._accumulator / self._step
+
+    def alpha_at(self, now: float) -> float:
+        """
+        Progress from the last step to the next one at the time `now`, in
+        `[0, 1]`. Unlike `alpha`, it also moves between two `advance` calls,
+        for frames drawn more often than the simulation steps.
+        """
+
+        if self._origin is None:
+            return 0.0
+        alpha = (now - self._boundary(self._index)) / self._step
+        return min(max(alpha, 0.0), 1.0)
+
+    def press(self, action: Action, time: float) -> None:
+        self._queue.append(InputEvent(time, action))
+        if action in REPEAT_ACTIONS:
+            self._held = action
+            self._held_next = time + self._das
+
+    def release(self, action: Action, time: float) -> None:
+        if action != self._held:
+            return
+
+        # Repeats that were due before the release belong to the steps that
+        # have not run yet.
+        while self._held_next < time:
+            self._queue.append(InputEvent(self._held_next, action, True))
+            self._held_next += self._arr
+        self._held = None
+
+    def clear(self) -> None:
+        self._queue.clear()
+        self._held = None
+
+    def _boundary(self, index: int) -> float:
+        assert self._origin is not None
+        return self._origin + index * self._step
+
+    def _pop_events(self, end: float) -> List[InputEvent]:
+        due = [e for e in self._queue if e.time < end]
+        if due:
+            self._queue = [e for e in self._queue if e.time >= end]
+
+        if self._held is not None:
+            while self._held_next < end:
+                due.append(InputEvent(self._held_next, self._held, True))
+                self._held_next += self._arr
+
+        due.sort(key=lambda e: e.time)
+        return due
+
+    def advance(self, now: float) -> Iterator[List[InputEvent]]:
+        """
+        Yields the input events of each step that ends by `now`;
+        the caller applies them and then simulates one `step`.
+        """
+
+        if self._origin is None:
+            self._origin = now
+
+        for _ in range(self._max_steps):
+            end = self._boundary(self._index + 1)
+            if end > now:
+                break
+            events = self._pop_events(end)
+            self._index += 1
+            self._steps += 1
+            yield events
+        else:
+            behind = int((now - self._origin) // self._step) - self._index
+            if behind > 0:
+                self._index += behind
+                self._held_next = max(self._held_next, self._boundary(self._index))
+                self._dropped_steps += behind
+
+        self._accumulator = now - self._boundary(self._index)
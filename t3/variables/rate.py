@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+from typing import Final
+
+DEFAULT_DRAW_HZ: Final[int] = 60
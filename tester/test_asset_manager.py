@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase, main
+
+from t3.assets.manager import AssetManager
+from t3.assets.path import (
+    MI_SFX_42_PATH,
+    REFRESH_HOVERED_PATH,
+    REFRESH_NORMAL_PATH,
+    STAGES_DIR,
+    WALLET_CLOSE_PATH,
+)
+
+
+class AssetManagerTestCase(TestCase):
+    def test_cache(self):
+        assets = AssetManager()
+        self.assertEqual(dict(), assets.load_times)
+
+        texture = assets.texture(REFRESH_NORMAL_PATH)
+        self.assertIs(texture, assets.texture(REFRESH_NORMAL_PATH))
+        self.assertIs(texture.image, assets.image(REFRESH_NORMAL_PATH))
+        self.assertEqual(REFRESH_NORMAL_PATH, texture.name)
+        self.assertLess(0, texture.width)
+        self.assertEqual([REFRESH_NORMAL_PATH], list(assets.load_times))
+        self.assertEqual(1, len(assets.summary()))
+
+    def test_preload(self):
+        assets = AssetManager()
+        paths = [WALLET_CLOSE_PATH, MI_SFX_42_PATH, REFRESH_HOVERED_PATH]
+        assets.preload(paths)
+        assets.wait()
+        self.assertEqual(set(paths), set(assets.load_times))
+
+        sound = assets.sound(WALLET_CLOSE_PATH)
+        self.assertIs(sound, assets.sound(WALLET_CLOSE_PATH))
+        self.assertLess(0, sound.get_length())
+
+    def test_concurrent_loads(self):
+        assets = AssetManager()
+        paths = [REFRESH_NORMAL_PATH, REFRESH_HOVERED_PATH] * 4
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            textures = list(executor.map(assets.texture, paths))
+        self.assertEqual(2, len(set(map(id, textures))))
+        self.assertIs(textures[0], assets.texture(REFRESH_NORMAL_PATH))
+
+    def test_failed_load(self):
+        assets = AssetManager()
+        missing = REFRESH_NORMAL_PATH + ".missing.png"
+        for _ in range(2):
+            with self.assertRaises(FileNotFoundError):
+                assets.image(missing)
+        self.assertNotIn(missing, assets.load_times)
+
+    def test_unknown_type(self):
+        with self.assertRaises(ValueError):
+            AssetManager().load(STAGES_DIR)
+
+
+if __name__ == "__main__":
+    main()
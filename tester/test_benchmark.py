@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from t3.benchmark.benchmark import run_benchmarks
+from t3.entrypoint import main as entrypoint_main
+
+
+class BenchmarkTestCase(TestCase):
+    def test_run_benchmarks(self):
+        results = run_benchmarks([(12, 24)], repeat=1, duration=0.0)
+        names = {r.name for r in results}
+        self.assertIn("check_insertable", names)
+        self.assertIn("create_sprites", names)
+        self.assertIn("playthrough", names)
+        for result in results:
+            self.assertEqual((12, 24), (result.cols, result.rows))
+            self.assertLessEqual(result.best, result.mean)
+
+    def test_benchmark_command(self):
+        lines = list()
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "bench.json")
+            cmdline = ["benchmark", "--sizes", "10x20", "--repeat", "1", "-o", path]
+            self.assertEqual(0, entrypoint_main(cmdline, lines.append))
+            compare = cmdline + ["--compare", path]
+            self.assertEqual(0, entrypoint_main(compare, lines.append))
+            with open(path) as f:
+                data = json.load(f)
+        self.assertEqual(8, len(data["results"]))
+        self.assertTrue(lines[-1].strip().startswith("10x20"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+from copy import deepcopy
+from unittest import TestCase, main
+
+from t3.objects.bitboard import BitBoard, BitShape
+from t3.objects.block import (
+    BLOCK_I,
+    BLOCK_J,
+    BLOCK_L,
+    BLOCK_O,
+    BLOCK_S,
+    BLOCK_T,
+    BLOCK_Z,
+    E,
+    is_active_block,
+    rotate_clockwise,
+)
+from t3.stages.stages import create_stages
+
+BLOCKS = [BLOCK_I, BLOCK_O, BLOCK_T, BLOCK_J, BLOCK_L, BLOCK_S, BLOCK_Z]
+
+
+def matrix_collision(board, shape, offset_x, offset_y) -> bool:
+    for row, line in enumerate(shape):
+        for col, val in enumerate(line):
+            if not is_active_block(val):
+                continue
+            if is_active_block(board[row + offset_y][col + offset_x]):
+                return True
+    return False
+
+
+def matrix_intersection(board, shape, offset_x, offset_y) -> bool:
+    for row, line in enumerate(shape):
+        for col, val in enumerate(line):
+            if not is_active_block(val):
+                continue
+            if not is_active_block(board[row + offset_y][col + offset_x]):
+                return False
+    return True
+
+
+def matrix_insertable(board, shape, offset_x, offset_y) -> bool:
+    for col in range(len(shape[0])):
+        col_top = False
+        for row in range(len(shape) - 1, -1, -1):
+            val = shape[row][col]
+            if not col_top:
+                if is_active_block(val):
+                    col_top = True
+                continue
+            if is_active_block(val):
+                continue
+            if is_active_block(board[row + offset_y][col + offset_x]):
+                return False
+        for y in range(offset_y - 1, -1, -1):
+            if is_active_block(board[y][col + offset_x]):
+                return False
+    return True
+
+
+def all_rotations(shape):
+    result = [shape]
+    for _ in range(3):
+        result.append(rotate_clockwise(result[-1]))
+    return result
+
+
+class BitBoardTestCase(TestCase):
+    def test_checks_match_matrix(self):
+        for stage in create_stages():
+            matrix = deepcopy(stage.board[::-1])
+            board = BitBoard(1, 1)
+            board.set_matrix(matrix)
+
+            for block in BLOCKS:
+                for shape in all_rotations(block):
+                    bits = BitShape(shape)
+                    for y in range(board.rows - bits.height + 1):
+                        for x in range(board.cols - bits.width + 1):
+                            self.assertEqual(
+                                matrix_collision(matrix, shape, x, y),
+                                board.check_collision(bits, x, y),
+                            )
+                            self.assertEqual(
+                                matrix_intersection(matrix, shape, x, y),
+                                board.check_intersection(bits, x, y),
+                            )
+                            self.assertEqual(
+                                matrix_insertable(matrix, shape, x, y),
+                                board.check_insertable(bits, x, y),
+                            )
+
+    def test_fill_matrix(self):
+        board = BitBoard(10, 20, E)
+        self.assertTrue(board.is_all_inactive())
+
+        board.fill_matrix(BLOCK_T, 3, 5, BLOCK_T[0][0])
+        self.assertFalse(board.is_all_inactive())
+        self.assertEqual(0b0000111000, board.masks[5])
+        self.assertEqual(0b0000010000, board.masks[6])
+        self.assertTrue(board.check_intersection(BLOCK_T, 3, 5))
+        self.assertEqual(5, board.get_hard_drop_position(BLOCK_T, 3))
+
+        board.fill_matrix(BLOCK_T, 3, 5, E)
+        self.assertTrue(board.is_all_inactive())
+        self.assertEqual(E, board.matrix[5][4])
+
+    def test_dirty_cells(self):
+        board = BitBoard(10, 20, E)
+        self.assertFalse(board.is_dirty())
+        board.fill(E)
+        self.assertEqual(200, len(board.pop_dirty_cells()))
+
+        board.fill_matrix(BLOCK_T, 3, 5, BLOCK_T[0][0])
+        self.assertTrue(board.is_dirty())
+        self.assertEqual([(3, 5), (4, 5), (5, 5), (4, 6)], board.pop_dirty_cells())
+        self.assertEqual([], board.pop_dirty_cells())
+
+        board.join_matrix([[E]], 7, 3)
+        self.assertEqual([(7, 2)], board.pop_dirty_cells())
+
+    def test_large_board(self):
+        board = BitBoard(100, 200, E)
+        board.fill_matrix(BLOCK_I, 90, 150, BLOCK_I[0][0])
+        self.assertFalse(board.check_intersection(BLOCK_I, 89, 150))
+        self.assertEqual(150, board.get_hard_drop_position(BLOCK_I, 90))
+        self.assertIsNone(board.get_hard_drop_position(BLOCK_I, 91))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from t3.objects.block import BlockIndex, N, O
+from t3.objects.block_texture import get_block_atlas
+from t3.theme.flat import FlatTheme
+
+
+class _OtherTheme(FlatTheme):
+    block_o_normal = (1, 2, 3, 255)
+
+
+class BlockAtlasTestCase(TestCase):
+    def test_atlas_cache(self):
+        atlas = get_block_atlas(8, 6, FlatTheme())
+        self.assertIs(atlas, get_block_atlas(8, 6, FlatTheme()))
+        self.assertIsNot(atlas, get_block_atlas(8, 8, FlatTheme()))
+        self.assertEqual(len(BlockIndex), len(atlas))
+        self.assertEqual((8 * len(BlockIndex), 6), atlas.image.size)
+        self.assertEqual((8, 6), atlas[O].image.size)
+        self.assertEqual((0, 0, 0, 0), atlas[N].image.getpixel((0, 0)))
+
+        other = get_block_atlas(8, 6, _OtherTheme())
+        self.assertIsNot(atlas, other)
+        self.assertNotEqual(atlas[O].name, other[O].name)
+        self.assertEqual((1, 2, 3, 255), other[O].image.getpixel((7, 5)))
+
+
+if __name__ == "__main__":
+    main()
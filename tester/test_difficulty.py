@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import csv
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from t3.entrypoint import main as entrypoint_main
+from t3.solver.difficulty import score_stage
+from t3.stages.stages import create_stages
+
+STAGE_FILE = {
+    "stages": [
+        {"board": ["EEEE", "EOOE", "EOOE"], "history": ["O"]},
+        {"board": ["EEEE", "EOOE", "OOEE"], "history": ["O"]},
+    ]
+}
+
+
+class DifficultyTestCase(TestCase):
+    def test_score_stage(self):
+        stage = create_stages()[1]
+        item = score_stage(stage.board[::-1], stage.history, 1, "Stage01")
+        self.assertEqual(2, item.solutions)
+        self.assertEqual(len(stage.history), len(item.branching))
+        self.assertEqual([3.0, 1.0, 2.0, 2.0, 1.0, 1.0], item.branching)
+        self.assertEqual([2, 0, 1, 0, 0, 0], item.dead_ends)
+        # Both solutions reach the fifth step, on different boards.
+        self.assertEqual([3, 1, 2, 2, 2, 1], item.branches)
+        self.assertAlmostEqual(2.585, item.score, places=3)
+
+    def test_score_stages_command(self):
+        lines = list()
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "stages.json")
+            with open(path, "w") as f:
+                json.dump(STAGE_FILE, f)
+
+            output = os.path.join(tmpdir, "scores.jsonl")
+            cmdline = ["score-stages", path, "--format", "jsonl", "-o", output]
+            self.assertEqual(0, entrypoint_main(cmdline, lines.append))
+            with open(output) as f:
+                records = [json.loads(line) for line in f]
+
+            output = os.path.join(tmpdir, "scores.csv")
+            cmdline = ["score-stages", path, "-j", "2", "-o", output]
+            self.assertEqual(0, entrypoint_main(cmdline, lines.append))
+            with open(output, newline="") as f:
+                rows = list(csv.DictReader(f))
+
+        records.sort(key=lambda r: r["stage_index"])
+        self.assertEqual([f"{path}:0", f"{path}:1"], [r["name"] for r in records])
+        self.assertEqual([1, 0], [r["solutions"] for r in records])
+        self.assertEqual(0.0, records[0]["score"])
+        self.assertIsNone(records[1]["score"])
+        self.assertEqual({"0", "1"}, {row["stage_index"] for row in rows})
+
+
+if __name__ == "__main__":
+    main()
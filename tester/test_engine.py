@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+from unittest import TestCase, main
+
+from t3.objects.block import BLOCK_O, BLOCK_T, E, N, O, T
+from t3.objects.engine import Engine
+from t3.stages.stage import Stage
+
+
+class _TestStage(Stage):
+    board = [
+        [E, E, E, E, E, E, E, E, E, E],
+        [E, E, E, E, E, E, E, E, E, E],
+        [E, E, E, E, E, E, E, E, E, E],
+        [E, E, E, E, O, O, E, E, E, E],
+        [E, T, T, T, O, O, E, E, E, E],
+        [E, E, T, E, E, E, E, E, E, E],
+        [E, E, E, E, E, E, E, E, E, E],
+        [E, E, E, E, E, E, E, E, E, E],
+    ]
+    history = [BLOCK_O, BLOCK_T]
+
+
+class _TestStageFailed(_TestStage):
+    history = [BLOCK_O]
+
+
+class EngineTestCase(TestCase):
+    def setUp(self):
+        self.engine = Engine(10, 8, [_TestStage()])
+
+    def test_change_stage(self):
+        self.assertFalse(self.engine.stage_clear)
+        self.assertFalse(self.engine.stage_failed)
+        self.assertEqual(BLOCK_O, self.engine.cursor.matrix)
+        self.assertEqual(4, self.engine.cursor_x)
+        self.assertEqual([BLOCK_T], self.engine.history)
+        self.assertEqual((4, 3), self.engine.get_hard_drop_position())
+
+    def test_move(self):
+        self.assertTrue(self.engine.move(-1))
+        self.assertEqual(3, self.engine.cursor_x)
+        self.assertIsNone(self.engine.drop_shape)
+        self.assertFalse(self.engine.move(-10))
+        self.assertEqual(0, self.engine.cursor_x)
+        self.assertFalse(self.engine.move(20))
+        self.assertEqual(8, self.engine.cursor_x)
+
+    def test_drop_rows_cache(self):
+        calls = list()
+        board = self.engine.board
+        get_hard_drop_position = board.get_hard_drop_position
+
+        def counter(*args):
+            calls.append(args)
+            return get_hard_drop_position(*args)
+
+        board.get_hard_drop_position = counter
+        for _ in range(3):
+            self.engine.move(-1)
+            self.engine.move(1)
+        self.assertEqual(1, len(calls))
+        self.assertEqual((4, 3), self.engine.get_hard_drop_position())
+
+        board.fill(E)
+        self.assertIsNone(self.engine.get_hard_drop_position())
+        self.assertEqual(2, len(calls))
+
+    def test_rotate(self):
+        self.assertTrue(self.engine.rotate())
+        self.assertEqual(BLOCK_O, self.engine.cursor.matrix)
+
+    def test_stage_clear(self):
+        self.assertTrue(self.engine.hard_drop())
+        self.assertEqual(BLOCK_T, self.engine.cursor.matrix)
+        self.assertEqual([], self.engine.history)
+
+        self.assertTrue(self.engine.rotate())
+        self.assertTrue(self.engine.rotate())
+        self.assertEqual([[N, T, N], [T, T, T]], self.engine.cursor.matrix)
+        self.assertTrue(self.engine.move(-3))
+        self.assertEqual((1, 2), self.engine.get_hard_drop_position())
+
+        self.assertTrue(self.engine.hard_drop())
+        self.assertIsNone(self.engine.cursor)
+        self.assertTrue(self.engine.stage_clear)
+        self.assertTrue(self.engine.board.is_all_inactive())
+
+    def test_stage_failed(self):
+        engine = Engine(10, 8, [_TestStage(), _TestStageFailed()])
+        engine.change_next_stage()
+        self.assertEqual(1, engine.stage)
+
+        self.assertTrue(engine.hard_drop())
+        self.assertFalse(engine.stage_clear)
+        self.assertTrue(engine.stage_failed)
+        self.assertFalse(engine.hard_drop())
+
+    def test_headless_import(self):
+        code = (
+            "import sys; import t3.objects.engine; "
+            "print(any(m.split('.')[0] in ('arcade', 'pyglet') for m in sys.modules))"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual("False", output.decode().strip())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,39 @@
 # -*- coding: utf-8 -*-
 
+import subprocess
+import sys
 from contextlib import redirect_stdout
 from io import StringIO
+from typing import Dict, Final, List
 from unittest import TestCase, main
 
 from t3.arguments import version
 from t3.entrypoint import main as entrypoint_main
 
+# Cumulative import time of `t3.entrypoint` in microseconds; it takes about 50ms
+# without arcade, and over 400ms when arcade is imported with it.
+IMPORT_TIME_BUDGET: Final[int] = 200_000
+HEAVY_MODULES: Final[List[str]] = ["arcade", "pyglet", "PIL", "numpy"]
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """
+    Cumulative import times, in microseconds, reported by `-X importtime`
+    when `module` is imported by a new interpreter.
+    """
+
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    process = subprocess.run(command, capture_output=True, text=True, check=True)
+
+    result = dict()
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            result[name.strip()] = int(cumulative)
+    return result
+
 
 class EntrypointTestCase(TestCase):
     def test_version(self):
@@ -16,6 +43,12 @@ class EntrypointTestCase(TestCase):
                 entrypoint_main(["--version"])
         self.assertEqual(version(), buffer.getvalue().strip())
 
+    def test_import_time(self):
+        times = import_times("t3.entrypoint")
+        for name in HEAVY_MODULES:
+            self.assertNotIn(name, times)
+        self.assertLess(times["t3.entrypoint"], IMPORT_TIME_BUDGET)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main, skipUnless
+
+from t3.benchmark.benchmark import play_stage
+from t3.module.optional import has_numpy
+from t3.objects.action import Action
+from t3.solver.solver import solve_stage
+from t3.stages.stages import create_stages
+
+if has_numpy():
+    import numpy as np
+
+    from t3.env.env import ACTIONS, T3Env, VectorT3Env
+
+
+@skipUnless(has_numpy(), "NumPy is not installed")
+class EnvTestCase(TestCase):
+    def setUp(self):
+        self.stages = create_stages()
+
+    def test_solution(self):
+        stage = self.stages[2]
+        path = solve_stage(stage).path
+        self.assertIsNotNone(path)
+
+        env = T3Env(self.stages)
+        obs = env.reset(2)
+        self.assertEqual((20, 10), obs["board"].shape)
+        self.assertEqual(len(stage.history) - 1, np.count_nonzero(obs["pieces"]))
+
+        drop = ACTIONS.index(Action.hard_drop)
+        rewards = list()
+        for placement in path:
+            for _ in range(placement.rotation):
+                env.step(ACTIONS.index(Action.rotate))
+            while env.engine.cursor_x != placement.x:
+                left = env.engine.cursor_x > placement.x
+                env.step(ACTIONS.index(Action.move_left if left else Action.move_right))
+            obs, reward, done, info = env.step(drop)
+            self.assertTrue(info["legal"])
+            rewards.append(reward)
+        self.assertTrue(done)
+        self.assertEqual(1.0, rewards[-1])
+        play_stage(env.engine, path)
+
+    def test_vector_matches_engine(self):
+        count = 8
+        vector = VectorT3Env(count, self.stages, seed=1)
+        obs = vector.reset()
+        envs = [T3Env(self.stages, vector.max_pieces) for _ in range(count)]
+        for env, stage in zip(envs, vector.stages):
+            env.reset(int(stage))
+
+        random = np.random.default_rng(0)
+        dones = 0
+        for _ in range(1000):
+            actions = random.integers(len(ACTIONS), size=count)
+            actions[random.random(count) < 0.5] = ACTIONS.index(Action.hard_drop)
+            obs, rewards, done, info = vector.step(actions)
+
+            for i, env in enumerate(envs):
+                expected, reward, finished, extra = env.step(int(actions[i]))
+                self.assertEqual(finished, done[i])
+                self.assertEqual(reward, rewards[i])
+                self.assertEqual(extra["legal"], info["legal"][i])
+                if finished:
+                    dones += 1
+                    expected = env.reset(int(vector.stages[i]))
+                for key, value in expected.items():
+                    np.testing.assert_array_equal(value, obs[key][i])
+        self.assertGreater(dones, 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from t3.benchmark.benchmark import play_stage
+from t3.entrypoint import main as entrypoint_main
+from t3.generator.generator import GeneratorOptions, generate_stages
+from t3.objects.block import D, E
+from t3.objects.engine import Engine
+from t3.stages.loader import load_stages
+from t3.stages.stages import open_stage_pack
+
+
+class GeneratorTestCase(TestCase):
+    def test_generate_stages(self):
+        options = GeneratorOptions(pieces=10, disabled=12, height=9)
+        for item in generate_stages(20, options, seed=7):
+            stage = item.stage
+            self.assertEqual(10, len(stage.history))
+            self.assertTrue(item.result.solved)
+
+            cells = [v for line in stage.board for v in line]
+            self.assertLessEqual(cells.count(D), 12)
+            rows = [i for i, line in enumerate(stage.solver) if set(line) != {E}]
+            self.assertLess(max(rows), 9)
+
+            play_stage(Engine(stages=[stage]), item.result.path)
+
+    def test_max_solutions(self):
+        options = GeneratorOptions(pieces=6, max_solutions=1)
+        for item in generate_stages(5, options, seed=1):
+            self.assertEqual(1, item.result.solutions)
+
+    def test_generate_stages_command(self):
+        lines = list()
+        with TemporaryDirectory() as tmpdir:
+            pack_path = os.path.join(tmpdir, "generated.t3p")
+            cmdline = ["generate-stages", pack_path, "-n", "3", "--pieces", "5"]
+            self.assertEqual(0, entrypoint_main(cmdline, lines.append))
+            pack = open_stage_pack(pack_path)
+            self.assertEqual(3, len(pack))
+            self.assertEqual("generated00002", pack.name(2))
+            self.assertEqual(5, len(pack[0].history))
+            pack.close()
+
+            json_path = os.path.join(tmpdir, "generated.json")
+            cmdline = ["generate-stages", json_path, "-n", "3", "--seed", "1"]
+            self.assertEqual(0, entrypoint_main(cmdline, lines.append))
+            stages = load_stages(json_path)
+            self.assertEqual(3, len(stages))
+            self.assertIsNotNone(stages[0].solver)
+
+            # No layout of 40 pieces fits in a single row.
+            cmdline = ["generate-stages", pack_path, "--pieces", "40", "--height", "1"]
+            self.assertEqual(1, entrypoint_main(cmdline, lines.append))
+            self.assertIn("No stage satisfies", lines[-1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+from random import Random
+from unittest import TestCase, main, skipUnless
+
+from t3.benchmark.benchmark import create_test_matrix, play_stage
+from t3.objects.bitboard import BOARD_BACKEND_NUMPY, BitBoard, create_board_core
+from t3.objects.block import D, E, N
+from t3.module.optional import has_numpy
+from t3.objects.engine import Engine
+from t3.objects.rotation import BLOCKS, get_rotations
+from t3.solver.solver import solve_stage
+from t3.stages.stages import create_stages
+
+if has_numpy():
+    from t3.objects.numpy_board import NumpyBoard
+
+
+@skipUnless(has_numpy(), "NumPy is not installed")
+class NumpyBoardTestCase(TestCase):
+    def test_same_as_bitboard(self):
+        cols, rows = 12, 24
+        bits = BitBoard(cols, rows)
+        array = create_board_core(cols, rows, backend=BOARD_BACKEND_NUMPY)
+        self.assertIsInstance(array, NumpyBoard)
+
+        matrix = create_test_matrix(cols, rows)
+        bits.set_matrix([list(line) for line in matrix])
+        array.set_matrix(matrix)
+        self.assertEqual(bits.bbox, array.bbox)
+        self.assertEqual(bits.masks, array.masks)
+
+        random = Random(0)
+        shapes = [r.shape for block in BLOCKS[:7] for r in get_rotations(block)]
+        for _ in range(500):
+            shape = random.choice(shapes)
+            x = random.randrange(cols - shape.width + 1)
+            y = random.randrange(rows - shape.height + 1)
+
+            for name in ("check_collision", "check_intersection", "check_insertable"):
+                expected = getattr(bits, name)(shape, x, y)
+                self.assertEqual(expected, getattr(array, name)(shape, x, y), name)
+            self.assertEqual(
+                bits.get_hard_drop_position(shape, x),
+                array.get_hard_drop_position(shape, x),
+            )
+
+            value = random.choice([N, E, D])
+            bits.fill_matrix(shape, x, y, value)
+            array.fill_matrix(shape, x, y, value)
+            self.assertEqual(bits.masks, array.masks)
+            self.assertEqual(bits.bbox, array.bbox)
+            self.assertEqual(bits.is_all_inactive(), array.is_all_inactive())
+            self.assertEqual(bits.pop_dirty_cells(), array.pop_dirty_cells())
+
+        bits.fill(E)
+        array.fill(E)
+        self.assertTrue(array.is_all_inactive())
+        self.assertEqual((None, None, None, None), array.bbox)
+        self.assertEqual(bits.matrix, array.matrix.tolist())
+
+    def test_engine(self):
+        stages = create_stages()
+        for index in (2, 9, 10):
+            path = solve_stage(stages[index]).path
+            engine = Engine(stages=[stages[index]], backend=BOARD_BACKEND_NUMPY)
+            self.assertIsInstance(engine.board, NumpyBoard)
+            play_stage(engine, path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from t3.profiler.profiler import FrameProfiler, RingBuffer, section_stats
+
+
+class ProfilerTestCase(TestCase):
+    def test_ring_buffer(self):
+        buffer = RingBuffer(4)
+        for value in range(3):
+            buffer.append(value)
+        self.assertEqual([0.0, 1.0, 2.0], buffer.values())
+        for value in range(3, 7):
+            buffer.append(value)
+        self.assertEqual(4, len(buffer))
+        self.assertEqual([3.0, 4.0, 5.0, 6.0], buffer.values())
+
+    def test_section_stats(self):
+        stats = section_stats([float(v) for v in range(100, 0, -1)])
+        self.assertEqual(100, stats.sample_count)
+        self.assertEqual(50.0, stats.p50)
+        self.assertEqual(95.0, stats.p95)
+        self.assertEqual(99.0, stats.p99)
+        self.assertEqual(100.0, stats.max)
+
+    def test_profiler(self):
+        disabled = FrameProfiler(enabled=False)
+        with disabled.measure("draw"):
+            pass
+        self.assertEqual({}, disabled.sections)
+
+        profiler = FrameProfiler(capacity=8)
+        for _ in range(10):
+            with profiler.measure("draw"):
+                pass
+        profiler.record("input", 0.002)
+        self.assertEqual(8, len(profiler.sections["draw"]))
+        self.assertEqual(2, len(profiler.summary()))
+        self.assertTrue(profiler.summary()[1].startswith("input"))
+
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "profile.json")
+            profiler.dump(path)
+            with open(path) as f:
+                data = json.load(f)
+        self.assertEqual([0.002], data["sections"]["input"]["samples"])
+        self.assertEqual(0.002, data["sections"]["input"]["stats"]["p99"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from t3.entrypoint import main as entrypoint_main
+from t3.objects.action import Action
+from t3.objects.engine import Engine
+from t3.replay.replay import (
+    REPLAY_EVENT,
+    REPLAY_HEADER,
+    Replay,
+    ReplayError,
+    ReplayPlayer,
+    play_headless,
+)
+from t3.solver.solver import solve_stage
+from t3.stages.stages import create_stages
+
+
+def create_solution_replay(stage_index: int) -> Replay:
+    stages = create_stages()
+    engine = Engine(stages=stages)
+    engine.select_stage(stage_index)
+
+    replay = Replay(stage_index, seed=7)
+    path = solve_stage(stages[stage_index]).path
+    assert path is not None
+    seconds = 0.0
+    for placement in path:
+        actions = [Action.rotate] * placement.rotation
+        for _ in actions:
+            engine.rotate()
+
+        delta = placement.x - engine.cursor_x
+        step = Action.move_right if delta > 0 else Action.move_left
+        actions += [step] * abs(delta)
+        actions.append(Action.hard_drop)
+
+        for action in actions[placement.rotation :]:
+            engine.apply(action)
+        for action in actions:
+            seconds += 0.25
+            replay.append(seconds, action)
+    return replay
+
+
+class ReplayTestCase(TestCase):
+    def test_round_trip(self):
+        replay = create_solution_replay(3)
+        loaded = Replay.from_bytes(replay.to_bytes())
+        self.assertEqual(3, loaded.stage)
+        self.assertEqual(7, loaded.seed)
+        self.assertEqual(replay.events, loaded.events)
+        size = REPLAY_HEADER.size + REPLAY_EVENT.size * len(replay.events)
+        self.assertEqual(size, len(replay.to_bytes()))
+
+        with self.assertRaises(ReplayError):
+            Replay.from_bytes(b"XXXX" + replay.to_bytes()[4:])
+        with self.assertRaises(ReplayError):
+            Replay.from_bytes(replay.to_bytes()[:-1])
+
+    def test_play_headless(self):
+        replay = create_solution_replay(3)
+        engine = play_headless(replay)
+        self.assertEqual(3, engine.stage)
+        self.assertTrue(engine.stage_clear)
+        self.assertAlmostEqual(replay.duration, engine.total_delta)
+
+        engine = play_headless(Replay(3, events=replay.events[:-1]))
+        self.assertFalse(engine.stage_clear)
+
+    def test_player(self):
+        replay = create_solution_replay(2)
+        player = ReplayPlayer(replay)
+        self.assertEqual([], player.pop_due(0.1))
+        self.assertEqual([replay.events[0].action], player.pop_due(0.25))
+        self.assertEqual(len(replay.events) - 1, len(player.pop_due(replay.duration)))
+        self.assertTrue(player.done)
+
+    def test_replay_command(self):
+        lines = list()
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "stage02.t3r")
+            create_solution_replay(2).save(path)
+            code = entrypoint_main(["replay", "--headless", path], lines.append)
+        self.assertEqual(0, code)
+        self.assertIn("clear=True", lines[0])
+
+        # A window plays a single replay.
+        code = entrypoint_main(["replay", path, path], lines.append)
+        self.assertEqual(1, code)
+        self.assertIn("--headless", lines[-1])
+
+
+if __name__ == "__main__":
+    main()
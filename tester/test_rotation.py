@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from t3.objects.block import (
+    BLOCK_I,
+    BLOCK_IC,
+    BLOCK_J,
+    BLOCK_L,
+    BLOCK_O,
+    BLOCK_OC,
+    BLOCK_S,
+    BLOCK_T,
+    BLOCK_Z,
+    rotate_clockwise,
+)
+from t3.objects.rotation import (
+    ROTATION_TABLE,
+    find_rotations,
+    freeze_matrix,
+    get_rotations,
+)
+
+
+class RotationTestCase(TestCase):
+    def test_distinct_rotations(self):
+        self.assertEqual(1, len(get_rotations(BLOCK_O)))
+        self.assertEqual(1, len(get_rotations(BLOCK_OC)))
+        self.assertEqual(2, len(get_rotations(BLOCK_I)))
+        self.assertEqual(2, len(get_rotations(BLOCK_IC)))
+        self.assertEqual(2, len(get_rotations(BLOCK_S)))
+        self.assertEqual(2, len(get_rotations(BLOCK_Z)))
+        self.assertEqual(4, len(get_rotations(BLOCK_T)))
+        self.assertEqual(4, len(get_rotations(BLOCK_J)))
+        self.assertEqual(4, len(get_rotations(BLOCK_L)))
+
+    def test_rotate_clockwise_order(self):
+        for matrix, (rotations, position) in ROTATION_TABLE.items():
+            rotated = rotate_clockwise([list(line) for line in matrix])
+            following = rotations[(position + 1) % len(rotations)]
+            self.assertEqual(freeze_matrix(rotated), following.matrix)
+
+    def test_rotation_fields(self):
+        rotations, position = find_rotations(BLOCK_T)
+        self.assertEqual(0, position)
+        t = rotations[0]
+        self.assertEqual((3, 2), (t.width, t.height))
+        self.assertEqual((0b111, 0b010), t.masks)
+        self.assertEqual((0, 0, 0), t.bottoms)
+        self.assertEqual((0, 1), rotations[1].bottoms)
+        self.assertEqual((1, 0, 1), rotations[2].bottoms)
+
+    def test_immutable(self):
+        with self.assertRaises(TypeError):
+            ROTATION_TABLE[freeze_matrix(BLOCK_T)] = None  # type: ignore[index]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+from random import Random
+from unittest import TestCase, main
+
+from t3.objects.bitboard import BitBoard
+from t3.objects.block import (
+    BLOCK_I,
+    BLOCK_J,
+    BLOCK_L,
+    BLOCK_O,
+    BLOCK_S,
+    BLOCK_T,
+    BLOCK_Z,
+    E,
+    O,
+)
+from t3.objects.engine import Engine
+from t3.objects.rotation import get_rotations
+from t3.solver.solver import Placement, Solver, solve_stage
+from t3.stages.stages import create_stages
+
+# Stage05 and Stage06 take several seconds, so they are not exercised here.
+QUICK_STAGES = [0, 1, 2, 3, 4, 7, 9, 10]
+
+PIECES = [BLOCK_I, BLOCK_O, BLOCK_T, BLOCK_L, BLOCK_J, BLOCK_S, BLOCK_Z]
+
+
+class SolverTestCase(TestCase):
+    def test_solution_path(self):
+        stages = create_stages()
+        for index in QUICK_STAGES:
+            stage = stages[index]
+            result = solve_stage(stage)
+            self.assertTrue(result.solved)
+            self.assertLess(0, result.solutions)
+            self.assertEqual(len(stage.history), len(result.path))
+
+            engine = Engine(stages=[stage])
+            for placement in result.path:
+                for _ in range(placement.rotation):
+                    self.assertTrue(engine.rotate())
+                engine.move(placement.x - engine.cursor_x)
+                self.assertEqual(placement.x, engine.cursor_x)
+                position = engine.get_hard_drop_position()
+                self.assertEqual((placement.x, placement.y), position)
+                self.assertTrue(engine.hard_drop())
+            self.assertTrue(engine.stage_clear)
+
+    def test_same_rules_as_board(self):
+        # The solver packs the board into one integer and has its own copy of
+        # the drop rules; they must agree with `BitBoard` on any board.
+        random = Random(3)
+        cols, rows, empty_rows = 6, 10, 4
+        for _ in range(50):
+            matrix = [[E] * cols for _ in range(empty_rows)]
+            for _ in range(rows - empty_rows):
+                matrix.append([O if random.random() < 0.6 else E for _ in range(cols)])
+            board = BitBoard(cols, rows)
+            board.set_matrix(matrix)
+            solver = Solver(matrix, PIECES)
+
+            for depth, piece in enumerate(PIECES):
+                expected = set()
+                for rotation, item in enumerate(get_rotations(piece)):
+                    for x in range(cols - item.width + 1):
+                        y = board.get_hard_drop_position(item.shape, x)
+                        if y is not None:
+                            expected.add(Placement(rotation, x, y))
+
+                placements = solver.placements(solver.board, depth)
+                self.assertEqual(expected, {p for p, _ in placements})
+
+    def test_solution_count(self):
+        stages = create_stages()
+        self.assertEqual(4, solve_stage(stages[2]).solutions)
+        self.assertEqual(14, solve_stage(stages[10]).solutions)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from t3.assets.manager import AssetManager
+from t3.assets.path import MI_SFX_42_PATH, WALLET_CLOSE_PATH
+from t3.objects.sound_pool import SoundPool
+
+
+class SoundPoolTestCase(TestCase):
+    def setUp(self):
+        self.pool = SoundPool(AssetManager(), voices=2)
+
+    def tearDown(self):
+        self.pool.stop()
+
+    def test_coalesce(self):
+        for _ in range(5):
+            self.pool.play(WALLET_CLOSE_PATH)
+        self.pool.play(MI_SFX_42_PATH)
+        self.assertEqual(2, self.pool.pending_size)
+        self.assertEqual(4, self.pool.coalesced)
+
+        self.pool.dispatch()
+        self.assertEqual(0, self.pool.pending_size)
+        self.assertEqual(2, self.pool.plays)
+        self.assertEqual(2, self.pool.player_allocations)
+
+    def test_voice_stealing(self):
+        for _ in range(6):
+            self.pool.play(WALLET_CLOSE_PATH)
+            self.pool.dispatch()
+
+        self.assertEqual(6, self.pool.plays)
+        self.assertEqual(2, self.pool.player_allocations)
+        self.assertEqual(4, self.pool.steals)
+
+
+if __name__ == "__main__":
+    main()
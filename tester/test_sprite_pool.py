@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from t3.objects.block import BLOCK_T, E, rotate_clockwise
+from t3.objects.block_texture import create_block_textures
+from t3.objects.board import Board
+from t3.objects.engine import Engine
+from t3.objects.rotation import get_rotations
+from t3.objects.sprite_pool import SpritePool
+from t3.theme.flat import FlatTheme
+
+
+class SpritePoolTestCase(TestCase):
+    def setUp(self):
+        self.textures = create_block_textures(4, 4, FlatTheme())
+        self.pool = SpritePool()
+
+    def test_rotate_reuses_sprites(self):
+        board = Board(3, 2, 4, 4, 1, self.textures, pool=self.pool)
+        shape = BLOCK_T
+        for _ in range(4):
+            shape = rotate_clockwise(shape)
+            board.set_matrix(shape)
+
+        self.pool.reset_counters()
+        for _ in range(8):
+            shape = rotate_clockwise(shape)
+            board.set_matrix(shape)
+            for row, line in enumerate(shape):
+                for col, value in enumerate(line):
+                    sprite = board.as_sprite(col, row)
+                    self.assertIs(self.textures[value], sprite.texture)
+
+        self.assertEqual(0, self.pool.sprite_allocations)
+        self.assertEqual(0, self.pool.list_allocations)
+        self.assertEqual(8, self.pool.reuses)
+
+    def test_set_matrix_copies(self):
+        shape = get_rotations(BLOCK_T)[0].shape
+        board = Board(shape.width, shape.height, 4, 4, 1, self.textures, pool=self.pool)
+        expected = [list(line) for line in shape.matrix]
+        board.set_matrix(shape.matrix)
+        board.fill(E)
+        self.assertEqual(expected, shape.matrix)
+
+    def test_sync_shared_core(self):
+        engine = Engine()
+        core = engine.board
+        board = Board(core.cols, core.rows, 4, 4, 1, self.textures, core=core)
+
+        engine.change_next_stage()
+        masks = core.masks
+        board.sync()
+        self.assertIs(masks, core.masks)
+        self.assertFalse(core.is_dirty())
+        for row, line in enumerate(core.matrix):
+            for col, value in enumerate(line):
+                self.assertIs(self.textures[value], board.as_sprite(col, row).texture)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+import os
+from collections.abc import Sequence
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+from zipfile import ZipFile
+
+from t3.assets.path import STAGES_DIR
+from t3.objects.block import BLOCK_O, E, O
+from t3.objects.engine import Engine
+from t3.stages.mapped_pack import MappedStagePack, StagePackError, write_stage_pack
+from t3.stages.pack import CachedStagePack, StagePack
+from t3.stages.stages import create_stages, open_stage_pack
+
+STAGE_JSON = '{"board": ["EEEE", "EOOE", "EOOE"], "history": ["O"]}'
+
+
+class StagePackTestCase(TestCase):
+    def test_lazy_lru(self):
+        pack = StagePack(STAGES_DIR, cache_size=2)
+        self.assertEqual(11, len(pack))
+        self.assertEqual("stage03", pack.name(3))
+        self.assertEqual(0, pack.misses)
+
+        stage = pack[3]
+        self.assertIs(stage, pack[3])
+        self.assertEqual((1, 1), (pack.misses, pack.hits))
+
+        pack[4]
+        pack[5]
+        self.assertIsNot(stage, pack[3])
+        self.assertEqual(4, pack.misses)
+
+        with self.assertRaises(IndexError):
+            pack[11]
+
+    def test_sequence(self):
+        pack = StagePack(STAGES_DIR)
+        self.assertIsInstance(pack, Sequence)
+        self.assertEqual([pack[9], pack[10]], pack[-2:])
+        self.assertEqual(3, pack.index(pack[3]))
+
+    def test_abstract_methods(self):
+        class _Incomplete(CachedStagePack):
+            def __len__(self) -> int:
+                return 0
+
+        with self.assertRaises(TypeError):
+            _Incomplete()  # type: ignore[abstract]
+
+    def test_engine_reads_on_demand(self):
+        pack = StagePack(STAGES_DIR)
+        engine = Engine(stages=pack)
+        self.assertEqual(1, pack.misses)
+        engine.change_next_stage()
+        self.assertEqual(2, pack.misses)
+
+    def test_zip_archive(self):
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "pack.zip")
+            with ZipFile(path, "w") as archive:
+                archive.writestr("b/001.json", STAGE_JSON)
+                archive.writestr("a/000.json", STAGE_JSON.replace('"O"]', '"O", "O"]'))
+                archive.writestr("readme.txt", "")
+
+            pack = StagePack(path)
+            self.assertEqual(["000", "001"], [pack.name(i) for i in range(len(pack))])
+            self.assertEqual([BLOCK_O, BLOCK_O], pack[0].history)
+            self.assertEqual([E, O, O, E], pack[1].board[1])
+            pack.close()
+
+
+class MappedStagePackTestCase(TestCase):
+    def test_round_trip(self):
+        stages = create_stages()
+        names = [f"stage{i:02d}" for i in range(len(stages))]
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "stages.t3p")
+            write_stage_pack(path, stages, names)
+
+            pack = open_stage_pack(path)
+            self.assertIsInstance(pack, MappedStagePack)
+            self.assertEqual(len(stages), len(pack))
+            self.assertEqual("stage07", pack.name(7))
+
+            for index in (10, 0, 5):
+                stage = pack[index]
+                self.assertEqual(stages[index].board, stage.board)
+                self.assertEqual(stages[index].history, stage.history)
+
+                engine = Engine(stages=[stages[index]])
+                self.assertEqual(engine.board.masks, stage.masks)
+
+            engine = Engine(stages=pack)
+            self.assertFalse(engine.is_empty_more_stage())
+            engine.select_stage(len(pack) - 1)
+            self.assertTrue(engine.is_empty_more_stage())
+
+            # Records are views of the map, released when it is closed.
+            record = pack.record(3)
+            self.assertIn(b"stage03", record.tobytes())
+            pack.close()
+            with self.assertRaises(ValueError):
+                record.tobytes()
+
+    def test_name_size(self):
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "stages.t3p")
+            with self.assertRaises(StagePackError):
+                write_stage_pack(path, create_stages()[:1], ["x" * 256])
+
+    def test_invalid_file(self):
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "invalid.t3p")
+            with open(path, "wb") as f:
+                f.write(b"XXXX" + bytes(16))
+            with self.assertRaises(StagePackError):
+                MappedStagePack(path)
+
+
+if __name__ == "__main__":
+    main()
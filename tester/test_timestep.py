@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+from typing import List, Tuple
+from unittest import TestCase, main
+
+from t3.objects.action import Action
+from t3.timestep.timestep import FixedTimestep
+
+STEP = 0.01
+
+
+def run(timestep: FixedTimestep, frames: List[float]) -> List[Tuple[int, Action]]:
+    result: List[Tuple[int, Action]] = list()
+    for now in frames:
+        for events in timestep.advance(now):
+            result.extend((timestep.steps, e.action) for e in events)
+    return result
+
+
+class FixedTimestepTestCase(TestCase):
+    def test_steps(self):
+        timestep = FixedTimestep(STEP)
+        self.assertEqual([], list(timestep.advance(1.0)))
+        self.assertEqual(3, len(list(timestep.advance(1.035))))
+        self.assertEqual(3, timestep.steps)
+        self.assertAlmostEqual(0.5, timestep.alpha)
+
+    def test_frame_rate_independent(self):
+        def _play(frame_time: float) -> List[Tuple[int, Action]]:
+            timestep = FixedTimestep(STEP, max_steps=100)
+            timestep.press(Action.rotate, 0.0)
+            timestep.press(Action.hard_drop, 0.034)
+            count = int(0.1 / frame_time) + 1
+            return run(timestep, [i * frame_time for i in range(count)])
+
+        expected = [(1, Action.rotate), (4, Action.hard_drop)]
+        self.assertEqual(expected, _play(0.005))
+        self.assertEqual(expected, _play(0.02))
+        self.assertEqual(expected, _play(0.05))
+
+    def test_auto_repeat(self):
+        timestep = FixedTimestep(STEP, max_steps=100, das=0.1, arr=0.03)
+        list(timestep.advance(0.0))
+        timestep.press(Action.move_right, 0.005)
+        moves = run(timestep, [0.05, 0.1, 0.15, 0.2])
+        self.assertEqual([1, 11, 14, 17, 20], [step for step, _ in moves])
+        self.assertTrue(all(a == Action.move_right for _, a in moves))
+
+        timestep.release(Action.move_right, 0.2)
+        self.assertEqual([], run(timestep, [0.3]))
+        self.assertIsNone(timestep.held)
+
+    def test_release_between_steps(self):
+        timestep = FixedTimestep(STEP, max_steps=100, das=0.1, arr=0.03)
+        list(timestep.advance(0.0))
+        timestep.press(Action.move_right, 0.005)
+        self.assertEqual([(1, Action.move_right)], run(timestep, [0.1]))
+
+        # The repeats at 0.105 and 0.135 were due before the release.
+        timestep.release(Action.move_right, 0.142)
+        moves = run(timestep, [0.3])
+        self.assertEqual([(11, Action.move_right), (14, Action.move_right)], moves)
+        self.assertIsNone(timestep.held)
+
+    def test_latest_direction_repeats(self):
+        timestep = FixedTimestep(STEP, max_steps=100, das=0.05, arr=0.05)
+        list(timestep.advance(0.0))
+        timestep.press(Action.move_left, 0.005)
+        timestep.press(Action.move_right, 0.015)
+        timestep.release(Action.move_left, 0.025)
+        actions = [a for _, a in run(timestep, [0.1])]
+        self.assertEqual([Action.move_left] + [Action.move_right] * 2, actions)
+
+    def test_alpha_between_updates(self):
+        timestep = FixedTimestep(0.05)
+        list(timestep.advance(1.0))
+        self.assertEqual(1, len(list(timestep.advance(1.06))))
+
+        # Two draws at 120 Hz before the next update at 1.11.
+        cursor_from, cursor_to = 2.0, 3.0
+        drawn = list()
+        for now in (1.0725, 1.0925):
+            alpha = timestep.alpha_at(now)
+            drawn.append(cursor_from + (cursor_to - cursor_from) * alpha)
+        self.assertAlmostEqual(2.45, drawn[0])
+        self.assertAlmostEqual(2.85, drawn[1])
+        self.assertAlmostEqual(0.2, timestep.alpha)
+        self.assertEqual(1.0, timestep.alpha_at(1.2))
+
+    def test_drop_steps(self):
+        timestep = FixedTimestep(STEP, max_steps=5)
+        list(timestep.advance(0.0))
+        timestep.press(Action.rotate, 0.5)
+        self.assertEqual(5, len(list(timestep.advance(1.005))))
+        self.assertEqual(95, timestep.dropped_steps)
+        self.assertAlmostEqual(0.5, timestep.alpha)
+        self.assertEqual([(6, Action.rotate)], run(timestep, [1.015]))
+
+
+if __name__ == "__main__":
+    main()
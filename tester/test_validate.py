@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from t3.solver.validate import validate_stages
+from t3.stages.loader import load_stages
+from t3.stages.stages import create_stages
+
+STAGE_FILE = {
+    "stages": [
+        {"board": ["EEEE", "EOOE", "EOOE"], "history": ["O"]},
+        {"board": ["EEEE", "EOOE", "OOEE"], "history": ["O"]},
+    ]
+}
+
+
+class ValidateTestCase(TestCase):
+    def test_validate_stages(self):
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "stages.json")
+            with open(path, "w") as f:
+                json.dump(STAGE_FILE, f)
+            loaded = load_stages(path)
+
+        stages = create_stages()
+        named = [("Stage02", stages[2]), ("Stage10", stages[10])]
+        named += [(f"loaded:{i}", s) for i, s in enumerate(loaded)]
+
+        for split in (False, True):
+            reports = validate_stages(named, max_workers=2, split=split)
+            self.assertEqual([n for n, _ in named], [r.name for r in reports])
+            self.assertEqual([True, True, True, False], [r.solved for r in reports])
+            self.assertEqual(4, reports[0].result.solutions)
+            self.assertEqual(14, reports[1].result.solutions)
+
+
+if __name__ == "__main__":
+    main()